@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+静态资源指纹清单
+build_assets.py 把 .workers/static 和 .workers/background 中的文件复制为带内容哈希的文件名
+（例如 .workers/assets/static/style.1a2b3c4d.css）并写入清单；list.py 和 update_resume.py
+生成页面时按清单把资源引用改为带哈希的文件名。没有清单时引用保持不变
+
+build_wallpapers.py 生成的壁纸变体（文件名中已带源文件哈希）记录在 .workers/wallpapers/manifest.json
+
+同时提供各脚本共用的项目根目录 PROJECT_ROOT、标签按钮颜色 TAB_COLORS 和原子写入 write_atomic，只依赖标准库，
+构建脚本和 list.py 不需要导入 update_resume（及其依赖的 BeautifulSoup、yaml 等）
+"""
+
+import os
+import re
+import json
+import stat
+import hashlib
+import tempfile
+import contextlib
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 标签按钮的多彩颜色（update_resume.py 按记录顺序循环使用，build_css.py 全部生成样式）
+TAB_COLORS = ['bg-blue-500', 'bg-green-500', 'bg-purple-500', 'bg-pink-500', 'bg-yellow-500', 'bg-orange-500', 'bg-teal-500']
+# 需要加指纹的资源目录（相对项目根目录），以及带指纹的文件所在目录
+ASSET_DIRS = ['.workers/static', '.workers/background']
+ASSETS_DIR = '.workers/assets'
+MANIFEST_PATH = os.path.join(PROJECT_ROOT, '.workers', 'assets', 'manifest.json')
+# 文件名中内容哈希的长度
+HASH_LENGTH = 8
+# 壁纸变体目录和清单
+WALLPAPERS_DIR = '.workers/wallpapers'
+WALLPAPER_MANIFEST_PATH = os.path.join(PROJECT_ROOT, '.workers', 'wallpapers', 'manifest.json')
+
+# 带指纹的文件路径：.workers/assets/<目录>/<文件名>.<哈希><扩展名>
+FINGERPRINT_PATTERN = re.compile(r'^\.workers/assets/(.+)/([^/]+)\.[0-9a-f]{%d}(\.[^./]+)$' % HASH_LENGTH)
+# 页面中引用 .workers 下资源的地址（属性值、脚本中的字符串和 url(...)）
+URL_PATTERN = re.compile(r'(["\'(])((?:\.\.?/)*\.workers/[^"\'()\s?#]+)')
+
+# 按修改时间缓存已读取的清单
+_manifest_cache = {}
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """
+    读取资源清单
+
+    Returns:
+        {源文件路径: 带指纹的文件路径}（均相对项目根目录），没有清单时返回空字典
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _manifest_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    _manifest_cache[path] = (mtime, manifest)
+    return manifest
+
+
+def load_wallpaper_manifest(path=WALLPAPER_MANIFEST_PATH):
+    """
+    读取壁纸变体清单
+
+    Returns:
+        {壁纸文件名: {'width', 'height', 'placeholder', 'variants': {格式: [[宽度, 路径], ...]}}}，
+        没有清单时返回空字典
+    """
+    return load_manifest(path)
+
+
+def source_path(path):
+    """带指纹的文件路径还原为源文件路径，其他路径原样返回"""
+    match = FINGERPRINT_PATTERN.match(path)
+    if not match:
+        return path
+    directory = match.group(1)
+    return '.workers/' + directory + '/' + match.group(2) + match.group(3)
+
+
+def asset_url(source, page_dir, root_dir=PROJECT_ROOT, manifest=None):
+    """
+    页面中引用资源的相对地址，清单中有该资源时使用带指纹的文件名
+
+    Args:
+        source: 源文件路径（相对项目根目录），例如 .workers/static/style.css
+        page_dir: 页面所在目录
+        root_dir: 项目根目录
+        manifest: 资源清单，为None时读取默认清单
+    """
+    manifest = load_manifest() if manifest is None else manifest
+    path = manifest.get(source, source)
+    return os.path.relpath(os.path.join(root_dir, path), page_dir).replace('\\', '/')
+
+
+def rewrite_references(content, page_dir, root_dir=PROJECT_ROOT, manifest=None):
+    """
+    把页面中对 .workers 下资源的引用（源文件名或旧的指纹文件名）改为清单中当前的指纹文件名
+
+    Returns:
+        修改后的内容，清单为空时原样返回
+    """
+    manifest = load_manifest() if manifest is None else manifest
+    if not manifest:
+        return content
+
+    def replace(match):
+        url = match.group(2)
+        path = os.path.relpath(os.path.normpath(os.path.join(page_dir, url)), root_dir).replace('\\', '/')
+        source = source_path(path)
+        if source not in manifest:
+            return match.group(0)
+        return match.group(1) + asset_url(source, page_dir, root_dir, manifest)
+
+    return URL_PATTERN.sub(replace, content)
+
+
+def write_atomic(path, chunks, skip_unchanged=False):
+    """
+    将片段依次写入同目录下的临时文件，完成后原子替换目标文件
+
+    读取方不会看到写了一半的文件；目标文件已存在时保留其权限。片段为字符串时按UTF-8编码、为bytes时直接写入（不转换换行符）。
+    skip_unchanged 为True时边写边按字节与目标文件比较，内容完全相同则删除临时文件、保留原文件（修改时间和inode不变）
+
+    Returns:
+        写入内容的sha1哈希；skip_unchanged 为True且内容没有变化时返回None
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+        skip_unchanged = False
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    existing = None
+    try:
+        if skip_unchanged:
+            # 按字节读取：文本模式会把 \r\n 转换为 \n，换行符不同的文件会被误认为没有变化
+            with contextlib.suppress(OSError):
+                existing = open(path, 'rb')
+        digest = hashlib.sha1()
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                data = chunk if isinstance(chunk, bytes) else chunk.encode('utf-8')
+                f.write(data)
+                digest.update(data)
+                if existing is not None:
+                    try:
+                        same = existing.read(len(data)) == data
+                    except OSError:
+                        same = False
+                    if not same:
+                        existing.close()
+                        existing = None
+        if existing is not None:
+            try:
+                unchanged = existing.read(1) == b''
+            except OSError:
+                unchanged = False
+            if unchanged:
+                os.remove(tmp_path)
+                return None
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    finally:
+        if existing is not None:
+            existing.close()
+    return digest.hexdigest()
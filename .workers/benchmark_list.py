@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+索引目录扫描系统调用次数对比脚本
+分别使用 os.listdir + os.path.isdir/getsize/getmtime（原实现）和 list.py 中基于 os.scandir 的扫描
+遍历同一个目录树，通过替换读取目录和 stat 的函数统计系统调用次数（不需要 strace），
+同时统计耗时，并校验两种方式得到的目录树一致（不会修改扫描的目录）
+"""
+
+import os
+import sys
+import stat
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+
+from asset_manifest import PROJECT_ROOT
+from list import DirectoryEntry, FileEntry, is_hidden, iter_directories, scan_directory, load_config
+
+
+class SyscallCounter:
+    """统计读取目录和 stat 的次数"""
+
+    def __init__(self):
+        self.counts = {'读取目录': 0, 'stat': 0}
+
+    def listdir(self, path):
+        self.counts['读取目录'] += 1
+        return os.listdir(path)
+
+    def stat(self, path):
+        self.counts['stat'] += 1
+        return os.stat(path)
+
+    def isdir(self, path):
+        """与 os.path.isdir 相同：一次 stat"""
+        try:
+            return stat.S_ISDIR(self.stat(path).st_mode)
+        except (OSError, ValueError):
+            return False
+
+    def scandir(self, path):
+        """作为 scan_directory 的 scandir 参数，返回统计 stat 次数的目录项"""
+        self.counts['读取目录'] += 1
+        return CountingScandir(os.scandir(path), self)
+
+
+class CountingScandir:
+    """包装 os.scandir 的迭代器"""
+
+    def __init__(self, iterator, counter):
+        self.iterator = iterator
+        self.counter = counter
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.iterator.close()
+
+    def __iter__(self):
+        for entry in self.iterator:
+            yield CountingEntry(entry, self.counter)
+
+
+class CountingEntry:
+    """
+    包装 os.DirEntry：类型来自读取目录的结果（d_type），不产生系统调用；
+    stat() 和符号链接的 is_dir() 第一次调用时产生一次 stat，之后使用缓存
+    """
+
+    def __init__(self, entry, counter):
+        self.entry = entry
+        self.counter = counter
+        self.name = entry.name
+        self.path = entry.path
+        self.stat_cached = False
+
+    def count_stat(self):
+        if not self.stat_cached:
+            self.counter.counts['stat'] += 1
+            self.stat_cached = True
+
+    def is_dir(self):
+        if self.entry.is_symlink():
+            self.count_stat()
+        return self.entry.is_dir()
+
+    def stat(self):
+        self.count_stat()
+        return self.entry.stat()
+
+
+def legacy_scan(path, hidden_patterns, counter):
+    """原实现的扫描方式：每个目录项分别调用 isdir、getsize、getmtime"""
+    node = DirectoryEntry(os.path.basename(path), path)
+    try:
+        items = counter.listdir(path)
+    except PermissionError:
+        return node
+    items.sort()
+    for item in items:
+        item_path = os.path.join(path, item)
+        if is_hidden(item_path, hidden_patterns):
+            continue
+        if counter.isdir(item_path):
+            node.entries.append(legacy_scan(item_path, hidden_patterns, counter))
+            continue
+        entry = FileEntry(item)
+        try:
+            stat_result = counter.stat(item_path)
+            entry.size = stat_result.st_size
+            entry.inode = stat_result.st_ino
+        except OSError:
+            pass
+        try:
+            entry.mtime = counter.stat(item_path).st_mtime
+        except OSError:
+            pass
+        node.entries.append(entry)
+    return node
+
+
+def build_synthetic_tree(root, directories, files_per_directory, depth):
+    """生成用于测试的目录树：每层 directories 个子目录，每个目录 files_per_directory 个文件"""
+    def build(path, level):
+        for index in range(files_per_directory):
+            with open(os.path.join(path, f'file{index}.txt'), 'w', encoding='utf-8') as f:
+                f.write('x' * index)
+        with open(os.path.join(path, '.hidden'), 'w', encoding='utf-8') as f:
+            f.write('hidden')
+        if level < depth:
+            for index in range(directories):
+                subdirectory = os.path.join(path, f'dir{index}')
+                os.makedirs(subdirectory)
+                build(subdirectory, level + 1)
+    build(root, 1)
+
+
+def measure(name, scan, runs):
+    """
+    多次执行扫描并输出系统调用次数和耗时
+
+    Returns:
+        最后一次扫描得到的目录树
+    """
+    times = []
+    tree = None
+    for _ in range(runs):
+        counter = SyscallCounter()
+        start = time.perf_counter()
+        tree = scan(counter)
+        times.append((time.perf_counter() - start) * 1000)
+    counts = '  '.join(f"{key} {value:7d}" for key, value in counter.counts.items())
+    print(f"{name:28s} {counts}  中位数 {statistics.median(times):8.2f} ms")
+    return tree
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='对比 list.py 目录扫描方式的系统调用次数和耗时')
+    parser.add_argument('--path', help='扫描的目录（默认生成临时目录树）')
+    parser.add_argument('--directories', type=int, default=6, help='临时目录树每层的子目录数（默认6）')
+    parser.add_argument('--files', type=int, default=20, help='临时目录树每个目录的文件数（默认20）')
+    parser.add_argument('--depth', type=int, default=4, help='临时目录树的层数（默认4）')
+    parser.add_argument('--runs', type=int, default=5, help='每种方式的执行次数（默认5）')
+    args = parser.parse_args(argv)
+
+    # list.py 的配置文件路径相对于当前目录（项目根目录），从其他目录运行时临时切换
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        hidden_patterns = load_config().get('hidden_patterns', ['.*', 'index.html'])
+    finally:
+        os.chdir(cwd)
+    temp_dir = None
+    if args.path:
+        root = os.path.abspath(args.path)
+    else:
+        temp_dir = tempfile.mkdtemp(prefix='benchmark_list_')
+        root = temp_dir
+        build_synthetic_tree(root, args.directories, args.files, args.depth)
+
+    try:
+        print(f"=== {root}（{args.runs} 次） ===")
+        legacy = measure('listdir + isdir/getsize/getmtime',
+                         lambda counter: legacy_scan(root, hidden_patterns, counter), args.runs)
+        scanned = measure('os.scandir（list.py）',
+                          lambda counter: scan_directory(root, hidden_patterns, counter.scandir), args.runs)
+
+        # 扫描一次之前，每个目录的索引页面都重新扫描自己的子树
+        directories = list(iter_directories(scanned))
+        measure('逐目录重新扫描（单次扫描之前）',
+                lambda counter: [legacy_scan(node.path, hidden_patterns, counter) for node in directories], 1)
+        files = sum(1 for node in directories for entry in node.entries if isinstance(entry, FileEntry))
+        print(f"目录 {len(directories)} 个，文件 {files} 个")
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    if legacy == scanned:
+        print("✓ 两种扫描方式得到的目录树一致")
+        return True
+    print("✗ 两种扫描方式得到的目录树不一致")
+    return False
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+并行渲染校验与性能对比脚本
+按不同规模生成合成简历，分别使用顺序渲染和并行渲染（--parallel，不同进程数）完整生成网页，
+校验输出一致，并对比耗时（在临时目录中进行，不会修改任何文件）
+"""
+
+import os
+import io
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+from update_resume import ResumeUpdater, PROJECT_ROOT
+from benchmark_resume import generate_resume
+from benchmark_splice import EDITS, LAST_UPDATED_PATTERN
+
+
+def run_update(directory, parallel, workers=None, force=True):
+    """
+    在目录中执行一次更新
+
+    Returns:
+        (耗时毫秒, 是否成功, 输出内容, 是否使用了并行渲染)
+    """
+    updater = ResumeUpdater(os.path.join(directory, 'resume.md'), os.path.join(directory, 'index.html'),
+                            os.path.join(directory, 'config.yaml'), cache_path=os.path.join(directory, 'cache.json'),
+                            model_cache_dir=os.path.join(directory, 'model_cache'), parallel=parallel, workers=workers)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        start = time.perf_counter()
+        success = updater.update_all(force=force)
+        elapsed = (time.perf_counter() - start) * 1000
+    with open(os.path.join(directory, 'index.html'), 'r', encoding='utf-8') as f:
+        return elapsed, success, LAST_UPDATED_PATTERN.sub('', f.read()), '并行渲染，' in log.getvalue()
+
+
+def prepare_dir(directory, template_path, config_path, resume):
+    """准备一次更新所需的模板、配置和简历文件"""
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+    os.makedirs(directory)
+    shutil.copy(template_path, os.path.join(directory, 'index.html'))
+    shutil.copy(config_path, os.path.join(directory, 'config.yaml'))
+    with open(os.path.join(directory, 'resume.md'), 'w', encoding='utf-8') as f:
+        f.write(resume)
+
+
+def check_size(template_path, config_path, entries, worker_counts, runs):
+    """对一种规模比较顺序渲染和各进程数的并行渲染，返回输出是否全部一致"""
+    print(f"\n=== {os.path.basename(template_path)}，合成简历 {entries} 条/部分 ===")
+    resume = generate_resume(entries)
+    all_same = True
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        work_dir = os.path.join(tmp_dir, 'work')
+        cases = [('顺序渲染', False, None)] + [(f'并行 {count} 进程', True, count) for count in worker_counts]
+        reference = None
+        baseline = None
+        for name, parallel, workers in cases:
+            timings = []
+            for _ in range(runs):
+                prepare_dir(work_dir, template_path, config_path, resume)
+                elapsed, success, output, used = run_update(work_dir, parallel, workers)
+                timings.append(elapsed)
+            best = min(timings)
+            if reference is None:
+                reference, baseline = output, best
+            same = success and output == reference and used == parallel
+            all_same = all_same and same
+            note = '' if used == parallel else '（未使用并行渲染）'
+            print(f"{'✓' if same else '✗'} {name:10s} {best:9.2f} ms  加速 {baseline / best:5.2f}x  "
+                  f"输出{'一致' if output == reference else '不一致'}{note}")
+    return all_same
+
+
+def check_incremental(template_path, config_path, entries):
+    """先完整生成一次，再依次修改各部分，比较顺序和并行的增量更新结果"""
+    print(f"\n=== 增量更新，合成简历 {entries} 条/部分 ===")
+    resume = generate_resume(entries)
+    all_same = True
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        work_dir = os.path.join(tmp_dir, 'work')
+        base_dir = os.path.join(tmp_dir, 'base')
+        prepare_dir(work_dir, template_path, config_path, resume)
+        run_update(work_dir, parallel=False)
+        shutil.copytree(work_dir, base_dir)
+        for name, old, new in EDITS:
+            if old not in resume:
+                continue
+            outputs = {}
+            for parallel in (False, True):
+                # 增量缓存以输出文件路径为键，每次在同一目录中从初始状态开始
+                shutil.rmtree(work_dir)
+                shutil.copytree(base_dir, work_dir)
+                with open(os.path.join(work_dir, 'resume.md'), 'w', encoding='utf-8') as f:
+                    f.write(resume.replace(old, new, 1))
+                outputs[parallel] = run_update(work_dir, parallel, force=False)[2]
+            same = outputs[False] == outputs[True]
+            all_same = all_same and same
+            print(f"{'✓' if same else '✗'} {name:6s} 输出{'一致' if same else '不一致'}")
+    return all_same
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='校验并行渲染与顺序渲染的输出一致，并对比耗时')
+    parser.add_argument('--template', default='index.html', help='HTML模板文件（默认 index.html）')
+    parser.add_argument('--config', default='config.yaml', help='配置文件（默认 config.yaml）')
+    parser.add_argument('--sizes', default='10,200', help='合成简历每个部分的条目数，逗号分隔（默认 10,200）')
+    parser.add_argument('--workers', default=None,
+                        help='并行渲染的进程数，逗号分隔（默认 1,2,4 和CPU核数）')
+    parser.add_argument('--runs', type=int, default=3, help='每种情况的执行次数，取最短耗时（默认3）')
+    args = parser.parse_args(argv)
+
+    template_path = os.path.join(PROJECT_ROOT, args.template)
+    config_path = os.path.join(PROJECT_ROOT, args.config)
+    if args.workers:
+        worker_counts = [int(count) for count in args.workers.split(',') if count.strip()]
+    else:
+        worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"CPU核数: {os.cpu_count()}")
+
+    all_same = True
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    for entries in sizes:
+        all_same = check_size(template_path, config_path, entries, worker_counts, args.runs) and all_same
+    all_same = check_incremental(template_path, config_path, sizes[0]) and all_same
+    print(f"\n{'✓ 并行渲染与顺序渲染输出一致' if all_same else '✗ 并行渲染与顺序渲染输出不一致'}")
+    return all_same
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
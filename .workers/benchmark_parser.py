@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+HTML解析器性能对比脚本
+分别使用 html.parser 和 lxml 对真实模板和约1MB的合成模板执行 解析、更新、序列化，
+统计各阶段耗时，并校验不同解析器的输出一致（忽略标签之间的空白，不会修改任何文件）
+"""
+
+import os
+import io
+import re
+import sys
+import time
+import argparse
+import statistics
+import contextlib
+
+from bs4 import BeautifulSoup
+
+from update_resume import ResumeUpdater, PROJECT_ROOT, HTML_PARSERS, clean_html, resolve_parser
+
+# 合成模板中插入的静态内容块（不包含任何需要更新的元素）
+FILLER_BLOCK = '''<div class="bg-white rounded-xl p-6 shadow-sm mb-4">
+<h3 class="text-lg font-semibold mb-2">静态内容块 {index}</h3>
+<p class="text-gray-600 leading-relaxed">这是用于性能测试的静态段落，包含<strong>加粗</strong>、<em>强调</em>和<span class="text-primary">高亮</span>文字。</p>
+<ul class="list-disc pl-6 text-gray-500"><li>条目一</li><li>条目二</li><li>条目三</li></ul>
+</div>
+'''
+
+# 标签之间的空白不影响页面显示，比较输出时忽略
+WHITESPACE_BETWEEN_TAGS = re.compile(r'>\s+<')
+
+
+def build_synthetic_template(template_content, target_size):
+    """在页脚之前插入静态内容块，生成指定大小的合成模板"""
+    blocks = []
+    size = len(template_content.encode('utf-8'))
+    index = 0
+    while size < target_size:
+        block = FILLER_BLOCK.format(index=index)
+        blocks.append(block)
+        size += len(block.encode('utf-8'))
+        index += 1
+    filler = '<section class="py-20" id="filler">\n<div class="container mx-auto px-4">\n' + ''.join(blocks) + '</div>\n</section>\n'
+    position = template_content.find('<footer')
+    if position == -1:
+        position = template_content.find('</body>')
+    return template_content[:position] + filler + template_content[position:]
+
+
+def normalize(html_content):
+    """去掉标签之间的空白，用于比较不同解析器的输出"""
+    return WHITESPACE_BETWEEN_TAGS.sub('><', html_content).strip()
+
+
+def measure_parser(updater, template_content, parser, runs):
+    """
+    使用指定解析器执行多次 解析、更新、序列化
+
+    Returns:
+        ({阶段: [耗时毫秒, ...]}, 最后一次的输出)
+    """
+    updater.parser = parser
+    timings = {'解析': [], '更新': [], '序列化': []}
+    html_content = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        updater.soup = BeautifulSoup(template_content, parser)
+        parsed = time.perf_counter()
+        updater.update_sections()
+        updated = time.perf_counter()
+        html_content = clean_html(str(updater.soup))
+        finished = time.perf_counter()
+        timings['解析'].append((parsed - start) * 1000)
+        timings['更新'].append((updated - parsed) * 1000)
+        timings['序列化'].append((finished - updated) * 1000)
+    return timings, html_content
+
+
+def run_benchmark(updater, name, template_content, parsers, runs):
+    """对一个模板运行所有解析器并输出结果，返回输出是否一致"""
+    print(f"\n=== {name}（{len(template_content.encode('utf-8')) / 1024:.1f} KB，{runs} 次） ===")
+    outputs = {}
+    for parser in parsers:
+        with contextlib.redirect_stdout(io.StringIO()):
+            timings, outputs[parser] = measure_parser(updater, template_content, parser, runs)
+        total = [sum(stage) for stage in zip(*timings.values())]
+        stages = '  '.join(f"{stage} {statistics.median(values):7.2f} ms" for stage, values in timings.items())
+        print(f"{parser:12s} {stages}  合计中位数 {statistics.median(total):7.2f} ms")
+
+    reference = normalize(outputs[parsers[0]])
+    same = all(normalize(outputs[parser]) == reference for parser in parsers[1:])
+    if same:
+        print("✓ 各解析器输出一致（忽略标签之间的空白）")
+    else:
+        print("✗ 各解析器输出不一致")
+    return same
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='对比不同HTML解析器的耗时')
+    parser.add_argument('--resume', default=os.path.join('resume', '简历.md'), help='简历Markdown文件（默认 resume/简历.md）')
+    parser.add_argument('--template', default='index.html', help='HTML模板文件（默认 index.html）')
+    parser.add_argument('--config', default='config.yaml', help='配置文件（默认 config.yaml）')
+    parser.add_argument('--runs', type=int, default=20, help='每种解析器的执行次数（默认20）')
+    parser.add_argument('--synthetic-size', type=int, default=1024 * 1024, help='合成模板大小（字节，默认1MB）')
+    args = parser.parse_args(argv)
+
+    parsers = [name for name in HTML_PARSERS if resolve_parser(name) == name]
+    if len(parsers) < 2:
+        print("✗ 未安装lxml，只能测试html.parser")
+
+    resume_path = os.path.join(PROJECT_ROOT, args.resume)
+    template_path = os.path.join(PROJECT_ROOT, args.template)
+    with open(template_path, 'r', encoding='utf-8') as f:
+        template_content = f.read()
+
+    updater = ResumeUpdater(resume_path, template_path, os.path.join(PROJECT_ROOT, args.config))
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not (updater.load_resume() and updater.load_config()):
+            print("✗ 加载简历或配置文件失败")
+            return False
+
+    same = run_benchmark(updater, os.path.basename(template_path), template_content, parsers, args.runs)
+    synthetic = build_synthetic_template(template_content, args.synthetic_size)
+    same = run_benchmark(updater, '合成模板', synthetic, parsers, max(1, args.runs // 4)) and same
+    return same
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
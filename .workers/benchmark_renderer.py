@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+渲染方式性能对比脚本
+对比 BeautifulSoup 修改DOM 与 预编译模板拼接字符串 两种方式的单次渲染耗时，
+并校验两者输出一致（不会修改任何文件）
+"""
+
+import os
+import io
+import sys
+import time
+import argparse
+import statistics
+import contextlib
+
+from update_resume import ResumeUpdater, PROJECT_ROOT, clean_html
+from template_renderer import TemplateRenderer
+
+
+def render_with_soup(updater, template_content):
+    """BeautifulSoup 方式：解析模板、逐部分修改DOM、序列化"""
+    updater.load_html(template_content)
+    updater.update_sections()
+    return clean_html(str(updater.soup))
+
+
+def render_with_template(updater, renderer):
+    """预编译模板方式：填充插槽并拼接字符串"""
+    return clean_html(renderer.render(updater))
+
+
+def measure(func, runs):
+    """执行多次并返回每次耗时（毫秒）和最后一次的结果"""
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, result
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='对比两种渲染方式的耗时')
+    parser.add_argument('--resume', default=os.path.join('resume', '简历.md'), help='简历Markdown文件（默认 resume/简历.md）')
+    parser.add_argument('--template', default='index.html', help='HTML模板文件（默认 index.html）')
+    parser.add_argument('--config', default='config.yaml', help='配置文件（默认 config.yaml）')
+    parser.add_argument('--runs', type=int, default=50, help='每种方式的渲染次数（默认50）')
+    args = parser.parse_args(argv)
+
+    resume_path = os.path.join(PROJECT_ROOT, args.resume)
+    template_path = os.path.join(PROJECT_ROOT, args.template)
+    with open(template_path, 'r', encoding='utf-8') as f:
+        template_content = f.read()
+
+    updater = ResumeUpdater(resume_path, template_path, os.path.join(PROJECT_ROOT, args.config))
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not (updater.load_resume() and updater.load_config()):
+            print("✗ 加载简历或配置文件失败")
+            return False
+
+        renderer = TemplateRenderer(template_content)
+        start = time.perf_counter()
+        renderer.render(updater)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        soup_timings, soup_html = measure(lambda: render_with_soup(updater, template_content), args.runs)
+        template_timings, template_html = measure(lambda: render_with_template(updater, renderer), args.runs)
+
+    print(f"=== 渲染耗时对比（{args.runs} 次，模板 {len(template_content) / 1024:.1f} KB） ===")
+    print(f"模板编译（仅一次）: {compile_ms:.2f} ms")
+    for name, timings in (('BeautifulSoup', soup_timings), ('预编译模板', template_timings)):
+        print(f"{name}: 平均 {statistics.mean(timings):8.2f} ms  中位数 {statistics.median(timings):8.2f} ms  "
+              f"最小 {min(timings):8.2f} ms")
+    print(f"加速比（中位数）: {statistics.median(soup_timings) / statistics.median(template_timings):.1f}x")
+
+    if soup_html == template_html:
+        print("✓ 两种方式输出一致")
+        return True
+    print("✗ 两种方式输出不一致")
+    return False
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
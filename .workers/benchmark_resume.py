@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+简历更新性能基准测试
+按 update_resume.py 要求的格式生成不同规模的合成简历（flex 标题行、主修课程、校园经历 YYYY.MM｜ 等），
+分别统计 load_html、各个 update_* 方法和 save_html 的冷启动耗时（不使用简历模型缓存和Markdown片段缓存），
+可记录为JSON基线，之后与基线对比，任一阶段变慢超过阈值时返回失败
+"""
+
+import gc
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+from update_resume import ResumeUpdater, PROJECT_ROOT, RECORD_SEPARATOR, MARKDOWN_FRAGMENT_CACHE
+
+# 默认基线文件（与机器相关，不纳入版本库）
+DEFAULT_BASELINE = os.path.join(PROJECT_ROOT, '.workers', 'benchmark_baseline.json')
+
+RESUME_HEADER = '''<div style="display: flex; justify-content: space-between; align-items: center; height:80px">
+<div style="flex: 1; text-align: center; ">
+<h1 style="margin-left: 70%;">测试用户</h1>
+</div>
+</div>
+
+
+> 电话：`+86 12345678901`&emsp;|&emsp;邮箱：[test@example.com](mailto:test@example.com)
+
+## 基本信息
+
+性别：男 &emsp;&emsp;&emsp;  年龄：22
+民族：汉 &emsp;&emsp;&emsp;  籍贯：北京
+**学历：本科**
+**网站：** [example.com](example.com)
+Github： [https://github.com/example](https://github.com/example)
+'''
+
+
+def record_header(left, center, right):
+    """生成 flex 三列的记录标题行"""
+    return (RECORD_SEPARATOR + '\n'
+            f' <div style="flex: 1; text-align: left;"><b>{left}</b></div>\n'
+            f' <div style="flex: 1; text-align: center;"><b>{center}</b></div>\n'
+            f' <div style="flex: 1; text-align: right;"><b>{right}</b></div>\n'
+            '</div>\n')
+
+
+def generate_resume(entries):
+    """
+    生成合成简历
+
+    Args:
+        entries: 每个部分的条目数
+
+    Returns:
+        简历Markdown内容
+    """
+    parts = [RESUME_HEADER, '\n## 教育背景\n\n']
+    for i in range(entries):
+        parts.append(record_header(f'{2000 + i % 20}.09 - {2004 + i % 20}.06', f'测试大学{i}', f'专业{i}'))
+        parts.append(f'- 主修课程：课程{i}A、课程{i}B、课程{i}C、课程{i}D\n\n')
+
+    for title, kind in (('实习经历', '实习'), ('工作经历', '工作')):
+        parts.append(f'## {title}\n\n')
+        for i in range(entries):
+            parts.append(record_header(f'测试公司{i}<br>（{kind}部门）', f'{2020 + i % 5}.01-{2020 + i % 5}.06', f'{kind}岗位{i}'))
+            parts.append(f'- **{kind}内容{i}：**负责数据整理、流程优化和报告撰写，完成了第{i}项任务。\n'
+                         f'- **成果：**效率提升{i % 50}%，获得团队认可。\n\n')
+
+    parts.append('## 校园经历\n\n')
+    for i in range(entries):
+        parts.append(f'- {2020 + i % 6}.{i % 12 + 1:02d}｜参加第{i}届校园活动 —— 锻炼组织与沟通能力\n')
+
+    parts.append('\n## 个人项目\n\n')
+    for i in range(entries):
+        parts.append(record_header(f'测试项目{i}', '', f'{2021 + i % 4}.{i % 12 + 1}——至今'))
+        parts.append(f'\n项目{i}的简介，介绍项目背景与主要功能。\n使用 **Python** 和 *Markdown* 实现，持续维护。\n\n')
+
+    parts.append('## 专业技能\n\n')
+    for i in range(entries):
+        parts.append(f'- 掌握第{i}项专业技能，能够独立完成相关工作。\n')
+
+    parts.append('\n## 自我评价\n\n')
+    parts.append('认真负责，学习能力强。' * max(1, entries // 10) + '\n\n**继续努力！**\n')
+    return ''.join(parts)
+
+
+def measure_stages(resume_path, template_path, config_path, output_path, runs, model_cache_dir):
+    """
+    统计各阶段耗时
+
+    每次执行前清空简历模型缓存目录和Markdown片段缓存，各次执行都是冷启动，
+    与第一次运行 update_resume.py 时一样包含正则提取和Markdown转换
+
+    Args:
+        model_cache_dir: 临时的简历模型缓存目录，避免写入和淘汰项目中的缓存
+
+    Returns:
+        {阶段名: 多次执行中的最短耗时（毫秒），最短耗时受系统抖动的影响最小}
+    """
+    timings = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(runs):
+            shutil.rmtree(model_cache_dir, ignore_errors=True)
+            MARKDOWN_FRAGMENT_CACHE.clear()
+            updater = ResumeUpdater(resume_path, output_path, config_path, template_path,
+                                    cache_path=output_path + '.cache.json', model_cache_dir=model_cache_dir)
+            if not (updater.load_resume() and updater.load_config()):
+                raise RuntimeError('加载简历或配置文件失败')
+            stages = [('load_html', updater.load_html)]
+            stages += [(step.__name__, step) for step in updater.update_steps()]
+            stages.append(('save_html', updater.save_html))
+            # 与 timeit 一样，计时期间关闭垃圾回收，减少抖动
+            gc.collect()
+            gc.disable()
+            try:
+                for name, stage in stages:
+                    start = time.perf_counter()
+                    stage()
+                    timings.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+            finally:
+                gc.enable()
+    return {name: min(values) for name, values in timings.items()}
+
+
+def run_benchmark(sizes, runs, template_path, config_path):
+    """
+    对每种规模生成合成简历并统计耗时
+
+    Returns:
+        {"条目数": {阶段名: 耗时毫秒}}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 复制模板，避免 save_html 修改项目中的文件
+        template_copy = os.path.join(tmp_dir, 'template.html')
+        shutil.copy(template_path, template_copy)
+        for entries in sizes:
+            resume_path = os.path.join(tmp_dir, f'简历_{entries}.md')
+            with open(resume_path, 'w', encoding='utf-8') as f:
+                f.write(generate_resume(entries))
+            output_path = os.path.join(tmp_dir, f'output_{entries}.html')
+            model_cache_dir = os.path.join(tmp_dir, 'model_cache')
+            results[str(entries)] = measure_stages(resume_path, template_copy, config_path, output_path, runs,
+                                                   model_cache_dir)
+            size_kb = os.path.getsize(resume_path) / 1024
+            total = sum(results[str(entries)].values())
+            print(f"✓ {entries} 条/部分（简历 {size_kb:.1f} KB）: 合计 {total:.2f} ms")
+    return results
+
+
+def print_results(results):
+    """按阶段输出耗时表格"""
+    sizes = list(results)
+    stages = list(results[sizes[0]])
+    print('\n' + f"{'阶段':28s}" + ''.join(f"{size + ' 条':>14s}" for size in sizes))
+    for stage in stages:
+        print(f"{stage:30s}" + ''.join(f"{results[size][stage]:11.2f} ms" for size in sizes))
+
+
+def compare_baseline(results, baseline, threshold, min_delta):
+    """
+    与基线对比
+
+    Args:
+        threshold: 允许变慢的比例（0.5 表示 50%）
+        min_delta: 忽略小于该值（毫秒）的差异，避免极短阶段的计时抖动
+
+    Returns:
+        变慢超过阈值的阶段列表 [(条目数, 阶段, 基线耗时, 当前耗时), ...]
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, elapsed in stages.items():
+            reference = baseline.get(size, {}).get(stage)
+            if reference is None:
+                continue
+            if elapsed > reference * (1 + threshold) and elapsed - reference > min_delta:
+                regressions.append((size, stage, reference, elapsed))
+    return regressions
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='简历更新各阶段性能基准测试')
+    parser.add_argument('--sizes', default='1,10,100,1000', help='每个部分的条目数，逗号分隔（默认 1,10,100,1000）')
+    parser.add_argument('--runs', type=int, default=5, help='每种规模的执行次数，取最短耗时（默认5）')
+    parser.add_argument('--template', default='index.html', help='HTML模板文件（默认 index.html）')
+    parser.add_argument('--config', default='config.yaml', help='配置文件（默认 config.yaml）')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='基线文件（默认 .workers/benchmark_baseline.json）')
+    parser.add_argument('--save-baseline', action='store_true', help='将本次结果保存为基线')
+    parser.add_argument('--threshold', type=float, default=0.5, help='允许变慢的比例（默认0.5，即50%%）')
+    parser.add_argument('--min-delta', type=float, default=2.0, help='忽略小于该值的差异（毫秒，默认2.0）')
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    template_path = os.path.join(PROJECT_ROOT, args.template)
+    config_path = os.path.join(PROJECT_ROOT, args.config)
+
+    print(f"=== 基准测试：{args.sizes} 条/部分，每种规模 {args.runs} 次 ===")
+    results = run_benchmark(sizes, args.runs, template_path, config_path)
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ 已保存基线: {os.path.relpath(args.baseline, PROJECT_ROOT)}")
+        return True
+
+    if not os.path.exists(args.baseline):
+        print("\n未找到基线文件，使用 --save-baseline 记录基线")
+        return True
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_baseline(results, baseline, args.threshold, args.min_delta)
+    if not regressions:
+        print(f"\n✓ 所有阶段均未超过基线 {args.threshold:.0%}")
+        return True
+    print(f"\n✗ 以下阶段比基线慢 {args.threshold:.0%} 以上:")
+    for size, stage, reference, elapsed in regressions:
+        print(f"  {size} 条 {stage}: {reference:.2f} ms -> {elapsed:.2f} ms (+{elapsed / reference - 1:.0%})")
+    return False
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+拼接模式校验与性能对比脚本
+先完整生成一次网页，再依次修改简历中的某一部分，分别使用完整更新和拼接模式（--splice）增量更新，
+校验两者输出一致、拼接模式重新渲染范围之外的内容逐字节不变，并对比耗时（在临时目录中进行，不会修改任何文件）
+"""
+
+import os
+import io
+import re
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+from update_resume import ResumeUpdater, PROJECT_ROOT, scan_ranges
+from benchmark_resume import generate_resume
+
+# 每次修改简历中的一处内容：(名称, 原文, 替换为)
+EDITS = [
+    ('实习经历', '实习内容0：', '实习内容（修改）：'),
+    ('工作经历', '工作内容0：', '工作内容（修改）：'),
+    ('校园经历', '参加第0届校园活动', '参加第0届校园活动（修改）'),
+    ('个人项目', '项目0的简介', '项目0的简介（修改）'),
+    ('专业技能', '掌握第0项专业技能', '掌握第0项专业技能（修改）'),
+    ('自我评价', '继续努力！', '持续努力！'),
+    ('教育背景', '课程0A', '课程0X'),
+    ('基本信息', '年龄：22', '年龄：23'),
+]
+
+# 最后更新时间每次都不同，比较时忽略
+LAST_UPDATED_PATTERN = re.compile(r'最后更新：[0-9: -]+')
+
+
+def run_update(directory, splice):
+    """
+    在目录中执行一次增量更新
+
+    Returns:
+        (耗时毫秒, 是否成功, 输出内容, 是否使用了拼接模式)
+    """
+    updater = ResumeUpdater(os.path.join(directory, 'resume.md'), os.path.join(directory, 'index.html'),
+                            os.path.join(directory, 'config.yaml'), cache_path=os.path.join(directory, 'cache.json'),
+                            model_cache_dir=os.path.join(directory, 'model_cache'), splice=splice)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        start = time.perf_counter()
+        success = updater.update_all()
+        elapsed = (time.perf_counter() - start) * 1000
+    with open(os.path.join(directory, 'index.html'), 'r', encoding='utf-8') as f:
+        return elapsed, success, f.read(), '拼接模式，重新渲染' in log.getvalue()
+
+
+def outside_unchanged(before, after):
+    """拼接模式重新渲染的部分和页脚之外，其余内容是否逐字节不变"""
+    before_ranges = scan_ranges(before)
+    after_ranges = scan_ranges(after)
+    if list(before_ranges) != list(after_ranges):
+        return False
+    before_pos = after_pos = 0
+    for key in before_ranges:
+        if before[before_pos:before_ranges[key][0]] != after[after_pos:after_ranges[key][0]]:
+            return False
+        before_pos, after_pos = before_ranges[key][1], after_ranges[key][1]
+    return before[before_pos:] == after[after_pos:]
+
+
+def check_edits(template_path, config_path, entries):
+    """对每处修改分别执行完整更新和拼接模式，返回是否全部一致"""
+    print(f"\n=== {os.path.basename(template_path)}，合成简历 {entries} 条/部分 ===")
+    all_same = True
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 增量缓存以输出文件路径为键，所有更新都在同一个目录中进行，每次之前恢复初始状态
+        work_dir = os.path.join(tmp_dir, 'work')
+        base_dir = os.path.join(tmp_dir, 'base')
+        os.makedirs(work_dir)
+        shutil.copy(template_path, os.path.join(work_dir, 'index.html'))
+        shutil.copy(config_path, os.path.join(work_dir, 'config.yaml'))
+        resume = generate_resume(entries)
+        with open(os.path.join(work_dir, 'resume.md'), 'w', encoding='utf-8') as f:
+            f.write(resume)
+        # 先完整生成一次，之后的更新都是增量更新
+        previous = run_update(work_dir, splice=False)[2]
+        shutil.copytree(work_dir, base_dir)
+
+        for name, old, new in EDITS:
+            if old not in resume:
+                continue
+            outputs = {}
+            timings = {}
+            spliced = False
+            for splice in (False, True):
+                shutil.rmtree(work_dir)
+                shutil.copytree(base_dir, work_dir)
+                with open(os.path.join(work_dir, 'resume.md'), 'w', encoding='utf-8') as f:
+                    f.write(resume.replace(old, new, 1))
+                timings[splice], success, outputs[splice], used = run_update(work_dir, splice)
+                spliced = spliced or used
+                if not success:
+                    print(f"✗ {name}: {'拼接模式' if splice else '完整更新'}失败")
+                    all_same = False
+            same = LAST_UPDATED_PATTERN.sub('', outputs[False]) == LAST_UPDATED_PATTERN.sub('', outputs[True])
+            kept = outside_unchanged(previous, outputs[True])
+            all_same = all_same and same and kept and spliced
+            mark = '✓' if same and kept and spliced else '✗'
+            note = '' if spliced else '（未使用拼接模式）'
+            print(f"{mark} {name:6s} 完整更新 {timings[False]:8.2f} ms  拼接模式 {timings[True]:8.2f} ms  "
+                  f"输出{'一致' if same else '不一致'}，其余内容{'不变' if kept else '有变化'}{note}")
+    return all_same
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='校验拼接模式与完整更新的输出一致，并对比耗时')
+    parser.add_argument('--template', default='index.html', help='HTML模板文件（默认 index.html）')
+    parser.add_argument('--config', default='config.yaml', help='配置文件（默认 config.yaml）')
+    parser.add_argument('--sizes', default='3,100', help='合成简历每个部分的条目数，逗号分隔（默认 3,100）')
+    args = parser.parse_args(argv)
+
+    template_path = os.path.join(PROJECT_ROOT, args.template)
+    config_path = os.path.join(PROJECT_ROOT, args.config)
+    all_same = True
+    for entries in [int(size) for size in args.sizes.split(',') if size.strip()]:
+        all_same = check_edits(template_path, config_path, entries) and all_same
+    print(f"\n{'✓ 拼接模式与完整更新输出一致' if all_same else '✗ 拼接模式与完整更新输出不一致'}")
+    return all_same
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+静态资源指纹构建脚本
+把 .workers/static 和 .workers/background 中的文件复制为带内容哈希的文件名（.workers/assets/ 下），
+写入资源清单 .workers/assets/manifest.json，把已生成页面中的资源引用改为带哈希的文件名，
+并生成缓存规则文件 _headers：带哈希的文件内容不会变化，可以长期缓存且无需重新验证
+"""
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+
+from asset_manifest import (PROJECT_ROOT, ASSET_DIRS, ASSETS_DIR, MANIFEST_PATH, HASH_LENGTH, WALLPAPERS_DIR,
+                            load_manifest, rewrite_references, write_atomic)
+
+# 缓存规则文件（Netlify、Cloudflare Pages 等静态托管使用的 _headers 格式）
+DEFAULT_HEADERS = os.path.join(PROJECT_ROOT, '_headers')
+HEADERS_COMMENT = '# 由 .workers/build_assets.py 生成，请勿手动修改\n'
+IMMUTABLE = 'public, max-age=31536000, immutable'
+NO_CACHE = 'no-cache'
+
+
+def file_hash(path):
+    """文件内容哈希（sha1的前几位）"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def fingerprint_assets(root_dir=PROJECT_ROOT):
+    """
+    把资源复制为带内容哈希的文件名（已存在的不重复复制），删除过期的指纹文件
+
+    Returns:
+        (清单, 新复制的文件数, 删除的文件数)
+    """
+    manifest = {}
+    copied = 0
+    for asset_dir in ASSET_DIRS:
+        source_dir = os.path.join(root_dir, asset_dir)
+        if not os.path.isdir(source_dir):
+            continue
+        for name in sorted(os.listdir(source_dir)):
+            source = os.path.join(source_dir, name)
+            if name.startswith('.') or not os.path.isfile(source):
+                continue
+            stem, ext = os.path.splitext(name)
+            target = f'{ASSETS_DIR}/{os.path.basename(asset_dir)}/{stem}.{file_hash(source)}{ext}'
+            target_path = os.path.join(root_dir, target)
+            if not os.path.exists(target_path):
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                shutil.copy2(source, target_path)
+                copied += 1
+            manifest[f'{asset_dir}/{name}'] = target
+
+    # 删除不在清单中的旧指纹文件
+    removed = 0
+    current = {os.path.normpath(os.path.join(root_dir, path)) for path in manifest.values()}
+    assets_root = os.path.join(root_dir, ASSETS_DIR)
+    for current_dir, _, files in os.walk(assets_root):
+        for name in files:
+            path = os.path.normpath(os.path.join(current_dir, name))
+            if path not in current and path != os.path.normpath(MANIFEST_PATH):
+                os.remove(path)
+                removed += 1
+    return manifest, copied, removed
+
+
+def find_pages(root_dir=PROJECT_ROOT):
+    """列出项目中的HTML页面（跳过隐藏目录），按路径排序"""
+    paths = []
+    for current_dir, dirs, files in os.walk(root_dir):
+        dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+        paths.extend(os.path.join(current_dir, name) for name in files if name.endswith('.html'))
+    return sorted(paths)
+
+
+def headers_rules(pages, root_dir=PROJECT_ROOT):
+    """
+    缓存规则：带指纹的资源和壁纸变体（文件名中带源文件哈希）永久缓存；页面和未加指纹的资源每次使用前向服务器验证
+
+    规则互不重叠，避免同一请求匹配多条规则时 Cache-Control 被合并
+    """
+    rules = [(f'/{ASSETS_DIR}/*', IMMUTABLE), (f'/{WALLPAPERS_DIR}/*', IMMUTABLE)]
+    rules += [(f'/{asset_dir}/*', NO_CACHE) for asset_dir in ASSET_DIRS]
+    for path in pages:
+        url = '/' + os.path.relpath(path, root_dir).replace('\\', '/')
+        rules.append((url, NO_CACHE))
+        if os.path.basename(path) == 'index.html':
+            rules.append((url[:-len('index.html')], NO_CACHE))
+    return HEADERS_COMMENT + ''.join(f'{url}\n  Cache-Control: {value}\n' for url, value in rules)
+
+
+def build(headers_path=DEFAULT_HEADERS):
+    """
+    生成带指纹的资源、清单和缓存规则，并更新页面中的引用
+
+    Returns:
+        是否成功
+    """
+    manifest, copied, removed = fingerprint_assets()
+    if manifest != load_manifest():
+        os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+        write_atomic(MANIFEST_PATH, [json.dumps(manifest, ensure_ascii=False, indent=2) + '\n'])
+    print(f"✓ 资源清单: {len(manifest)} 个文件，新复制 {copied} 个，删除过期文件 {removed} 个 "
+          f"({os.path.relpath(MANIFEST_PATH, PROJECT_ROOT)})")
+
+    updated = 0
+    pages = find_pages()
+    for path in pages:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        rewritten = rewrite_references(content, os.path.dirname(path), PROJECT_ROOT, manifest)
+        if rewritten != content:
+            write_atomic(path, [rewritten])
+            updated += 1
+            print(f"✓ 已更新引用: {os.path.relpath(path, PROJECT_ROOT)}")
+    if not updated:
+        print("✓ 页面中的资源引用已是最新")
+
+    rules = headers_rules(pages)
+    try:
+        with open(headers_path, 'r', encoding='utf-8') as f:
+            unchanged = f.read() == rules
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        write_atomic(headers_path, [rules])
+    print(f"✓ 缓存规则: {os.path.relpath(headers_path, PROJECT_ROOT)}")
+    return True
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='把静态资源复制为带内容哈希的文件名，更新页面引用并生成缓存规则')
+    parser.add_argument('--headers', default=DEFAULT_HEADERS, help='缓存规则文件（默认项目根目录的 _headers）')
+    args = parser.parse_args(argv)
+    return build(os.path.join(PROJECT_ROOT, args.headers))
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
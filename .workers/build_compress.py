@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+压缩构建脚本
+压缩（minify）生成的 HTML、CSS、JS 文件，并以最高压缩级别生成 .gz 和 .br 预压缩文件，
+静态服务器可以直接返回预压缩文件。内容没有变化的文件跳过，最后输出压缩前后的大小对比。
+
+默认在原文件旁边生成 file.html.gz、file.html.br，其中是原文件内容的预压缩版本（不做 minify，
+同一地址的压缩和未压缩响应内容一致），原文件保持不变，仍可作为 update_resume.py 的模板；
+使用 --dist 时把压缩后的文件和它们的预压缩文件写入单独的发布目录
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import hashlib
+import argparse
+
+from asset_manifest import PROJECT_ROOT, write_atomic
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 需要处理的文件类型，以及项目根目录之外额外包含的隐藏目录（生成的样式和脚本）
+EXTENSIONS = ('.html', '.css', '.js')
+EXTRA_DIRS = [os.path.join('.workers', 'static'), os.path.join('.workers', 'assets', 'static')]
+# 记录各文件内容哈希和大小的缓存文件
+DEFAULT_CACHE = os.path.join(PROJECT_ROOT, '.workers', '.build_compress_cache.json')
+# 发布目录中的标记文件：带标记的目录是本脚本的输出，之后的运行不再读取其中的文件
+DIST_MARKER = '.build_compress_dist'
+
+# HTML片段：注释、原样保留内容的元素、标签、文本
+HTML_TOKEN_PATTERN = re.compile(
+    r'<!--.*?-->'
+    r'|<(script|style|pre|textarea)\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>.*?</\1\s*>'
+    r'|<(?:[^>"\']|"[^"]*"|\'[^\']*\')*>'
+    r'|[^<]+|<',
+    re.DOTALL | re.IGNORECASE)
+RAW_ELEMENT_PATTERN = re.compile(r'(<(script|style)\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>)(.*)(</\2\s*>)',
+                                 re.DOTALL | re.IGNORECASE)
+TAG_NAME_PATTERN = re.compile(r'</?([a-zA-Z][\w-]*)')
+SCRIPT_TYPE_PATTERN = re.compile(r'\btype\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+# 块级元素和不显示的元素：与它们相邻的空白文本不影响显示，可以删除
+BLOCK_TAGS = {
+    'html', 'head', 'body', 'title', 'meta', 'link', 'script', 'style', 'base', 'noscript',
+    'address', 'article', 'aside', 'blockquote', 'details', 'dialog', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hgroup', 'hr',
+    'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'thead', 'tbody', 'tfoot', 'tr',
+    'td', 'th', 'caption', 'colgroup', 'col', 'ul', 'option', 'optgroup', 'br', 'template', '!doctype',
+}
+JS_TYPES = {'text/javascript', 'application/javascript', 'module'}
+# 这些字符或关键字之后的 / 是正则表达式的开始，而不是除号
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = ('return', 'typeof', 'case', 'do', 'else', 'in', 'instanceof', 'new', 'throw', 'void', 'delete')
+
+
+def minify_css(css):
+    """
+    压缩CSS：删除注释（保留 /*! */）和多余空白
+
+    只删除 { } ; , > 两侧和冒号之后的空白，不改变选择器和取值的含义
+    """
+    result = []
+    i = 0
+    length = len(css)
+    while i < length:
+        char = css[i]
+        if char in '"\'':
+            end = i + 1
+            while end < length and css[end] != char:
+                end += 2 if css[end] == '\\' else 1
+            result.append(css[i:end + 1])
+            i = end + 1
+        elif css.startswith('/*', i):
+            end = css.find('*/', i + 2)
+            end = length if end < 0 else end + 2
+            if css.startswith('/*!', i):
+                result.append(css[i:end])
+            i = end
+        elif char.isspace():
+            while i < length and css[i].isspace():
+                i += 1
+            previous = result[-1][-1:] if result else ''
+            following = css[i:i + 1]
+            if previous and previous not in '{};,>:' and following not in '{};,>' and following:
+                result.append(' ')
+        else:
+            result.append(char)
+            i += 1
+    return ''.join(result).replace(';}', '}')
+
+
+def minify_js(code):
+    """
+    压缩JS：删除注释、缩进和空行
+
+    保留换行（避免自动插入分号的规则改变语义），字符串、模板字符串和正则表达式原样保留
+    """
+    result = []
+    i = 0
+    length = len(code)
+    while i < length:
+        char = code[i]
+        if char in '"\'`':
+            end = i + 1
+            while end < length and code[end] != char:
+                end += 2 if code[end] == '\\' else 1
+            result.append(code[i:end + 1])
+            i = end + 1
+        elif code.startswith('//', i):
+            end = code.find('\n', i)
+            i = length if end < 0 else end
+        elif code.startswith('/*', i):
+            end = code.find('*/', i + 2)
+            end = length if end < 0 else end + 2
+            result.append('\n' if '\n' in code[i:end] else ' ')
+            i = end
+        elif char == '/':
+            previous = ''.join(result[-8:]).rstrip()
+            is_regex = (not previous or previous[-1] in REGEX_PRECEDERS
+                        or re.search(r'(?<![\w$])(?:' + '|'.join(REGEX_KEYWORDS) + r')$', previous))
+            if not is_regex:
+                result.append(char)
+                i += 1
+                continue
+            end = i + 1
+            in_class = False
+            while end < length and code[end] != '\n':
+                if code[end] == '\\':
+                    end += 2
+                    continue
+                if code[end] == '[':
+                    in_class = True
+                elif code[end] == ']':
+                    in_class = False
+                elif code[end] == '/' and not in_class:
+                    break
+                end += 1
+            end += 1
+            while end < length and code[end].isalnum():
+                end += 1
+            result.append(code[i:end])
+            i = end
+        elif char.isspace():
+            start = i
+            while i < length and code[i].isspace():
+                i += 1
+            newline = '\n' in code[start:i]
+            if not result or result[-1].endswith('\n'):
+                continue
+            result.append('\n' if newline else ' ')
+        else:
+            end = i + 1
+            while end < length and not code[end].isspace() and code[end] not in '"\'`/':
+                end += 1
+            result.append(code[i:end])
+            i = end
+    text = ''.join(result)
+    return re.sub(r'[ \t]+\n', '\n', text).strip()
+
+
+def tag_name(token):
+    """标签名（小写），不是标签时返回None"""
+    if token.lower().startswith('<!doctype'):
+        return '!doctype'
+    match = TAG_NAME_PATTERN.match(token)
+    return match.group(1).lower() if match else None
+
+
+def minify_html(html):
+    """
+    压缩HTML：删除注释（保留条件注释）、与块级元素相邻的空白文本，压缩内联的脚本和样式
+
+    有内容的文本和 pre、textarea 原样保留
+    """
+    tokens = [match.group(0) for match in HTML_TOKEN_PATTERN.finditer(html)]
+    result = []
+    for index, token in enumerate(tokens):
+        if token.startswith('<!--'):
+            if token.startswith('<!--[if'):
+                result.append(token)
+            continue
+        if token.startswith('<') and len(token) > 1:
+            raw = RAW_ELEMENT_PATTERN.match(token)
+            if raw:
+                open_tag, name, content, close_tag = raw.groups()
+                if name.lower() == 'style':
+                    content = minify_css(content)
+                else:
+                    script_type = SCRIPT_TYPE_PATTERN.search(open_tag)
+                    if not script_type or script_type.group(1).lower() in JS_TYPES:
+                        content = minify_js(content)
+                token = open_tag + content + close_tag
+            result.append(token)
+            continue
+        if token.strip():
+            result.append(token)
+            continue
+        # 空白文本：与块级元素相邻时删除，否则保留一个空格
+        previous = tag_name(result[-1]) if result and result[-1].startswith('<') else None
+        following = next((item for item in tokens[index + 1:] if not item.startswith('<!--')), '')
+        if not result or not following or previous in BLOCK_TAGS or tag_name(following) in BLOCK_TAGS:
+            continue
+        result.append(' ')
+    return ''.join(result)
+
+
+MINIFIERS = {'.html': minify_html, '.css': minify_css, '.js': minify_js}
+
+
+def find_files(root_dir=PROJECT_ROOT, exclude_dirs=()):
+    """
+    列出需要处理的文件（跳过隐藏目录，额外包含 .workers/static 及其带指纹的副本），按路径排序
+
+    发布目录（exclude_dirs 中的目录，以及之前运行写入了 DIST_MARKER 的目录）中是本脚本的输出，不再处理
+    """
+    excluded = {os.path.normpath(os.path.abspath(path)) for path in exclude_dirs}
+    paths = []
+    for current, dirs, files in os.walk(root_dir):
+        if os.path.normpath(current) in excluded or DIST_MARKER in files:
+            dirs[:] = []
+            continue
+        dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+        paths.extend(os.path.join(current, name) for name in files if name.endswith(EXTENSIONS))
+    for extra in EXTRA_DIRS:
+        extra_dir = os.path.join(root_dir, extra)
+        if os.path.isdir(extra_dir):
+            paths.extend(os.path.join(extra_dir, name) for name in os.listdir(extra_dir) if name.endswith(EXTENSIONS))
+    return sorted(paths)
+
+
+def compress_variants(data):
+    """
+    生成预压缩内容
+
+    Returns:
+        {后缀: 压缩后的内容}，未安装brotli时没有 .br
+    """
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, quality=11)
+    return variants
+
+
+def load_cache(cache_path):
+    """读取缓存，不存在或无效时返回空字典"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def format_size(size):
+    """格式化文件大小"""
+    if size is None:
+        return '-'
+    if size < 1024:
+        return f'{size} B'
+    return f'{size / 1024:.1f} KB'
+
+
+def build(dist_dir=None, cache_path=DEFAULT_CACHE, force=False):
+    """
+    压缩所有文件并生成预压缩文件
+
+    Args:
+        dist_dir: 发布目录，为None时在原文件旁边生成预压缩文件
+        cache_path: 缓存文件路径
+        force: 是否忽略缓存，全部重新生成
+
+    Returns:
+        是否成功
+    """
+    if brotli is None:
+        print("✗ 未安装brotli，跳过 .br 文件（pip install brotli）")
+    cache = {} if force else load_cache(cache_path)
+    new_cache = {}
+    rows = []
+    if dist_dir:
+        os.makedirs(dist_dir, exist_ok=True)
+        with open(os.path.join(dist_dir, DIST_MARKER), 'w', encoding='utf-8') as f:
+            f.write('由 .workers/build_compress.py 生成的发布目录，不会被再次处理\n')
+    for path in find_files(exclude_dirs=[dist_dir] if dist_dir else ()):
+        rel_path = os.path.relpath(path, PROJECT_ROOT).replace('\\', '/')
+        target = os.path.join(dist_dir, rel_path) if dist_dir else path
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha1(data).hexdigest()
+        key = (os.path.relpath(dist_dir, PROJECT_ROOT) + ':' if dist_dir else '') + rel_path
+        suffixes = ['.gz'] + (['.br'] if brotli is not None else [])
+        outputs = [target + suffix for suffix in suffixes] + ([target] if dist_dir else [])
+        cached = cache.get(key)
+        if (cached and cached['hash'] == digest and cached.get('minified') == bool(dist_dir)
+                and all(os.path.exists(output) for output in outputs)):
+            new_cache[key] = cached
+            rows.append((rel_path, cached['sizes'], False))
+            continue
+
+        # 只在发布目录中写入 minify 后的文件；原文件旁边的预压缩文件必须与原文件内容一致
+        minified = None
+        if dist_dir:
+            ext = os.path.splitext(path)[1]
+            try:
+                minified = MINIFIERS[ext](data.decode('utf-8')).encode('utf-8')
+            except UnicodeDecodeError:
+                minified = data
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            write_atomic(target, [minified])
+        variants = compress_variants(data if minified is None else minified)
+        for suffix, content in variants.items():
+            write_atomic(target + suffix, [content])
+        sizes = [len(data), None if minified is None else len(minified), len(variants['.gz']),
+                 len(variants['.br']) if '.br' in variants else None]
+        new_cache[key] = {'hash': digest, 'minified': bool(dist_dir), 'sizes': sizes}
+        rows.append((rel_path, sizes, True))
+
+    write_atomic(cache_path, [json.dumps(new_cache, ensure_ascii=False, indent=2)])
+
+    print(f"\n{'文件':40s} {'原始':>10s} {'压缩后':>10s} {'gzip':>10s} {'brotli':>10s}")
+    totals = [0, 0, 0, 0]
+    for rel_path, sizes, changed in rows:
+        for i, size in enumerate(sizes):
+            totals[i] += size or 0
+        print(f"{rel_path[:40]:40s} " + ' '.join(f'{format_size(size):>10s}' for size in sizes)
+              + ('' if changed else '  （未变化，跳过）'))
+    if brotli is None:
+        totals[3] = None
+    if not dist_dir:
+        totals[1] = None
+    print(f"{'合计':40s} " + ' '.join(f'{format_size(size):>10s}' for size in totals))
+    if totals[0]:
+        print(f"\n✓ 处理 {sum(1 for row in rows if row[2])} 个文件，跳过 {sum(1 for row in rows if not row[2])} 个未变化的文件；"
+              + (f"压缩后为原始大小的 {totals[1] / totals[0]:.1%}，" if totals[1] is not None else '')
+              + f"gzip 后为 {totals[2] / totals[0]:.1%}"
+              + (f"，brotli 后为 {totals[3] / totals[0]:.1%}" if totals[3] is not None else ''))
+    return True
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='压缩生成的 HTML、CSS、JS 文件，并生成 .gz 和 .br 预压缩文件')
+    parser.add_argument('--dist', default=None, help='发布目录：写入 minify 后的文件和预压缩文件（默认只在原文件旁边生成原内容的预压缩文件）')
+    parser.add_argument('--force', action='store_true', help='忽略缓存，重新生成所有文件')
+    args = parser.parse_args(argv)
+    dist_dir = os.path.join(PROJECT_ROOT, args.dist) if args.dist else None
+    return build(dist_dir, force=args.force)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,1220 @@
+#!/usr/bin/env python3
+"""
+Tailwind CSS 构建脚本
+收集生成的页面（index.html、resume/index.html、application/*.html）中实际用到的类名，
+按 Tailwind CSS v3 的规则生成只包含这些类的静态样式表 .workers/static/tailwind.css，
+并把页面中在浏览器里即时编译样式的 cdn.tailwindcss.com 脚本替换为该样式表
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import argparse
+
+from asset_manifest import PROJECT_ROOT, TAB_COLORS, write_atomic
+
+# 默认输出的样式表
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, '.workers', 'static', 'tailwind.css')
+# 主题配置（原页面中 tailwind.config 的 theme 部分），首次构建时从页面中提取
+DEFAULT_THEME = os.path.join(PROJECT_ROOT, '.workers', 'tailwind_theme.json')
+# 需要扫描并替换CDN脚本的页面（相对项目根目录的glob模式）
+DEFAULT_PAGES = ['index.html', 'resume/index.html', 'application/*.html']
+# 生成页面的脚本：其中的类名可能在简历内容变化后才出现在页面中，一并扫描
+SOURCE_FILES = ['.workers/update_resume.py', '.workers/template_renderer.py']
+
+# 页面中的 Tailwind CDN 脚本、配置脚本和需要 Tailwind 处理的样式
+CDN_SCRIPT_PATTERN = re.compile(r'<script\s+src="https://cdn\.tailwindcss\.com[^"]*"\s*>\s*</script>')
+CONFIG_SCRIPT_PATTERN = re.compile(r'(?:<!--[^>]*-->\n)?<script>\s*tailwind\.config\s*=\s*(\{.*?\})\s*;?\s*</script>\n?',
+                                   re.DOTALL)
+TAILWIND_STYLE_PATTERN = re.compile(r'<style type="text/tailwindcss">(.*?)</style>', re.DOTALL)
+LAYER_PATTERN = re.compile(r'@layer\s+[\w-]+\s*\{')
+# 候选类名：按空白、引号、尖括号等切分文件内容，与 Tailwind 扫描内容文件的方式相同
+CANDIDATE_PATTERN = re.compile(r'[^\s"\'`<>=;{}(),\\]+')
+CLASS_ATTR_PATTERN = re.compile(r'\bclass\s*=\s*"([^"]*)"')
+# 页面自身的样式、引用的本地样式表，以及其中定义的类名
+STYLE_PATTERN = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL)
+STYLESHEET_LINK_PATTERN = re.compile(r'<link\b[^>]*\bhref="([^"?#:]+\.css)"')
+CSS_CLASS_PATTERN = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+# Tailwind 工具类名的第一段（如 text-、bg-、grid-cols-），页面中这样的类没有生成样式时给出警告
+TAILWIND_ROOTS = frozenset((
+    'p', 'px', 'py', 'pt', 'pr', 'pb', 'pl', 'm', 'mx', 'my', 'mt', 'mr', 'mb', 'ml', 'space', 'gap',
+    'w', 'h', 'min', 'max', 'size', 'inset', 'top', 'right', 'bottom', 'left', 'z', 'order',
+    'flex', 'grid', 'col', 'row', 'basis', 'grow', 'shrink', 'items', 'justify', 'self', 'content', 'place',
+    'block', 'inline', 'hidden', 'table', 'contents', 'static', 'fixed', 'absolute', 'relative', 'sticky',
+    'visible', 'invisible', 'overflow', 'container', 'sr', 'not', 'pointer', 'select', 'cursor', 'resize',
+    'text', 'font', 'leading', 'tracking', 'whitespace', 'break', 'truncate', 'italic', 'underline',
+    'uppercase', 'lowercase', 'capitalize', 'antialiased', 'list', 'decoration', 'indent', 'align',
+    'bg', 'from', 'via', 'to', 'border', 'rounded', 'divide', 'outline', 'ring', 'shadow', 'opacity',
+    'transition', 'duration', 'delay', 'ease', 'animate', 'transform', 'translate', 'scale', 'rotate',
+    'skew', 'origin', 'filter', 'blur', 'backdrop', 'object', 'aspect', 'fill', 'stroke',
+))
+
+# 默认调色板：颜色 -> 50、100、200 ... 900、950 各级的色值
+COLOR_SHADES = ('50', '100', '200', '300', '400', '500', '600', '700', '800', '900', '950')
+PALETTE = {
+    'slate': '#f8fafc #f1f5f9 #e2e8f0 #cbd5e1 #94a3b8 #64748b #475569 #334155 #1e293b #0f172a #020617',
+    'gray': '#f9fafb #f3f4f6 #e5e7eb #d1d5db #9ca3af #6b7280 #4b5563 #374151 #1f2937 #111827 #030712',
+    'zinc': '#fafafa #f4f4f5 #e4e4e7 #d4d4d8 #a1a1aa #71717a #52525b #3f3f46 #27272a #18181b #09090b',
+    'neutral': '#fafafa #f5f5f5 #e5e5e5 #d4d4d4 #a3a3a3 #737373 #525252 #404040 #262626 #171717 #0a0a0a',
+    'stone': '#fafaf9 #f5f5f4 #e7e5e4 #d6d3d1 #a8a29e #78716c #57534e #44403c #292524 #1c1917 #0c0a09',
+    'red': '#fef2f2 #fee2e2 #fecaca #fca5a5 #f87171 #ef4444 #dc2626 #b91c1c #991b1b #7f1d1d #450a0a',
+    'orange': '#fff7ed #ffedd5 #fed7aa #fdba74 #fb923c #f97316 #ea580c #c2410c #9a3412 #7c2d12 #431407',
+    'amber': '#fffbeb #fef3c7 #fde68a #fcd34d #fbbf24 #f59e0b #d97706 #b45309 #92400e #78350f #451a03',
+    'yellow': '#fefce8 #fef9c3 #fef08a #fde047 #facc15 #eab308 #ca8a04 #a16207 #854d0e #713f12 #422006',
+    'lime': '#f7fee7 #ecfccb #d9f99d #bef264 #a3e635 #84cc16 #65a30d #4d7c0f #3f6212 #365314 #1a2e05',
+    'green': '#f0fdf4 #dcfce7 #bbf7d0 #86efac #4ade80 #22c55e #16a34a #15803d #166534 #14532d #052e16',
+    'emerald': '#ecfdf5 #d1fae5 #a7f3d0 #6ee7b7 #34d399 #10b981 #059669 #047857 #065f46 #064e3b #022c22',
+    'teal': '#f0fdfa #ccfbf1 #99f6e4 #5eead4 #2dd4bf #14b8a6 #0d9488 #0f766e #115e59 #134e4a #042f2e',
+    'cyan': '#ecfeff #cffafe #a5f3fc #67e8f9 #22d3ee #06b6d4 #0891b2 #0e7490 #155e75 #164e63 #083344',
+    'sky': '#f0f9ff #e0f2fe #bae6fd #7dd3fc #38bdf8 #0ea5e9 #0284c7 #0369a1 #075985 #0c4a6e #082f49',
+    'blue': '#eff6ff #dbeafe #bfdbfe #93c5fd #60a5fa #3b82f6 #2563eb #1d4ed8 #1e40af #1e3a8a #172554',
+    'indigo': '#eef2ff #e0e7ff #c7d2fe #a5b4fc #818cf8 #6366f1 #4f46e5 #4338ca #3730a3 #312e81 #1e1b4b',
+    'violet': '#f5f3ff #ede9fe #ddd6fe #c4b5fd #a78bfa #8b5cf6 #7c3aed #6d28d9 #5b21b6 #4c1d95 #2e1065',
+    'purple': '#faf5ff #f3e8ff #e9d5ff #d8b4fe #c084fc #a855f7 #9333ea #7e22ce #6b21a8 #581c87 #3b0764',
+    'fuchsia': '#fdf4ff #fae8ff #f5d0fe #f0abfc #e879f9 #d946ef #c026d3 #a21caf #86198f #701a75 #4a044e',
+    'pink': '#fdf2f8 #fce7f3 #fbcfe8 #f9a8d4 #f472b6 #ec4899 #db2777 #be185d #9d174d #831843 #500724',
+    'rose': '#fff1f2 #ffe4e6 #fecdd3 #fda4af #fb7185 #f43f5e #e11d48 #be123c #9f1239 #881337 #4c0519',
+}
+SPECIAL_COLORS = {'inherit': 'inherit', 'current': 'currentColor', 'transparent': 'transparent',
+                  'black': '#000', 'white': '#fff'}
+
+DEFAULT_FONT_FAMILY = {
+    'sans': ['ui-sans-serif', 'system-ui', 'sans-serif', '"Apple Color Emoji"', '"Segoe UI Emoji"',
+             '"Segoe UI Symbol"', '"Noto Color Emoji"'],
+    'serif': ['ui-serif', 'Georgia', 'Cambria', '"Times New Roman"', 'Times', 'serif'],
+    'mono': ['ui-monospace', 'SFMono-Regular', 'Menlo', 'Monaco', 'Consolas', '"Liberation Mono"',
+             '"Courier New"', 'monospace'],
+}
+
+# 间距：0.5、1、1.5 ... 96，数值n对应 n/4 rem
+SPACING = {'0': '0px', 'px': '1px'}
+for _step in ('0.5', '1', '1.5', '2', '2.5', '3', '3.5', '4', '5', '6', '7', '8', '9', '10', '11', '12', '14',
+              '16', '20', '24', '28', '32', '36', '40', '44', '48', '52', '56', '60', '64', '72', '80', '96'):
+    SPACING[_step] = f'{float(_step) / 4:g}rem'
+
+
+def fractions(*denominators):
+    """分数比例，例如 1/3 -> 33.333333%"""
+    result = {}
+    for denominator in denominators:
+        for numerator in range(1, denominator):
+            value = f'{numerator / denominator * 100:.6f}'.rstrip('0').rstrip('.')
+            result[f'{numerator}/{denominator}'] = value + '%'
+    return result
+
+
+INSET = {**SPACING, 'auto': 'auto', 'full': '100%', **fractions(2, 3, 4)}
+SIZE_KEYWORDS = {'auto': 'auto', 'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content'}
+WIDTH = {**SPACING, **SIZE_KEYWORDS, 'screen': '100vw', **fractions(2, 3, 4, 5, 6, 12)}
+HEIGHT = {**SPACING, **SIZE_KEYWORDS, 'screen': '100vh', **fractions(2, 3, 4, 5, 6)}
+MAX_HEIGHT = {**SPACING, 'none': 'none', 'full': '100%', 'screen': '100vh',
+              'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content'}
+MIN_HEIGHT = {**SPACING, 'full': '100%', 'screen': '100vh', 'min': 'min-content', 'max': 'max-content',
+              'fit': 'fit-content'}
+MIN_WIDTH = {**SPACING, 'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content'}
+MAX_WIDTH = {'0': '0rem', 'none': 'none', 'xs': '20rem', 'sm': '24rem', 'md': '28rem', 'lg': '32rem',
+             'xl': '36rem', '2xl': '42rem', '3xl': '48rem', '4xl': '56rem', '5xl': '64rem', '6xl': '72rem',
+             '7xl': '80rem', 'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content',
+             'prose': '65ch', 'screen-sm': '640px', 'screen-md': '768px', 'screen-lg': '1024px',
+             'screen-xl': '1280px', 'screen-2xl': '1536px'}
+FONT_SIZE = {'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+             'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+             '3xl': ('1.875rem', '2.25rem'), '4xl': ('2.25rem', '2.5rem'), '5xl': ('3rem', '1'),
+             '6xl': ('3.75rem', '1'), '7xl': ('4.5rem', '1'), '8xl': ('6rem', '1'), '9xl': ('8rem', '1')}
+FONT_WEIGHT = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500',
+               'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
+LINE_HEIGHT = {'none': '1', 'tight': '1.25', 'snug': '1.375', 'normal': '1.5', 'relaxed': '1.625', 'loose': '2',
+               **{str(n): f'{n / 4:g}rem' for n in range(3, 11)}}
+LETTER_SPACING = {'tighter': '-0.05em', 'tight': '-0.025em', 'normal': '0em', 'wide': '0.025em',
+                  'wider': '0.05em', 'widest': '0.1em'}
+BORDER_RADIUS = {'none': '0px', 'sm': '0.125rem', '': '0.25rem', 'md': '0.375rem', 'lg': '0.5rem',
+                 'xl': '0.75rem', '2xl': '1rem', '3xl': '1.5rem', 'full': '9999px'}
+BORDER_WIDTH = {'': '1px', '0': '0px', '2': '2px', '4': '4px', '8': '8px'}
+OPACITY = {str(n): f'{n / 100:g}' for n in range(0, 101, 5)}
+Z_INDEX = {'0': '0', '10': '10', '20': '20', '30': '30', '40': '40', '50': '50', 'auto': 'auto'}
+SCALE = {'0': '0', '50': '.5', '75': '.75', '90': '.9', '95': '.95', '100': '1', '105': '1.05', '110': '1.1',
+         '125': '1.25', '150': '1.5'}
+ROTATE = {'0': '0deg', '1': '1deg', '2': '2deg', '3': '3deg', '6': '6deg', '12': '12deg', '45': '45deg',
+          '90': '90deg', '180': '180deg'}
+DURATION = {str(n): f'{n}ms' for n in (0, 75, 100, 150, 200, 300, 500, 700, 1000)}
+BLUR = {'none': '', 'sm': '4px', '': '8px', 'md': '12px', 'lg': '16px', 'xl': '24px', '2xl': '40px', '3xl': '64px'}
+BOX_SHADOW = {
+    'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+    '': '0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+    'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+    'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+    'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+    '2xl': '0 25px 50px -12px rgb(0 0 0 / 0.25)',
+    'inner': 'inset 0 2px 4px 0 rgb(0 0 0 / 0.05)',
+    'none': '0 0 #0000',
+}
+RING_WIDTH = {'': '3px', '0': '0px', '1': '1px', '2': '2px', '4': '4px', '8': '8px'}
+GRADIENT_DIRECTIONS = {'t': 'top', 'tr': 'top right', 'r': 'right', 'br': 'bottom right', 'b': 'bottom',
+                       'bl': 'bottom left', 'l': 'left', 'tl': 'top left'}
+TRANSITION_PROPERTY = {
+    'none': 'none',
+    'all': 'all',
+    '': 'color, background-color, border-color, text-decoration-color, fill, stroke, opacity, box-shadow, '
+        'transform, filter, backdrop-filter, -webkit-backdrop-filter',
+    'colors': 'color, background-color, border-color, text-decoration-color, fill, stroke',
+    'opacity': 'opacity',
+    'shadow': 'box-shadow',
+    'transform': 'transform',
+}
+TIMING_FUNCTION = {'linear': 'linear', 'in': 'cubic-bezier(0.4, 0, 1, 1)', 'out': 'cubic-bezier(0, 0, 0.2, 1)',
+                   'in-out': 'cubic-bezier(0.4, 0, 0.2, 1)'}
+TRANSFORM_VALUE = ('translate(var(--tw-translate-x), var(--tw-translate-y)) rotate(var(--tw-rotate)) '
+                   'skewX(var(--tw-skew-x)) skewY(var(--tw-skew-y)) scaleX(var(--tw-scale-x)) scaleY(var(--tw-scale-y))')
+BACKDROP_FILTER_VALUE = ('var(--tw-backdrop-blur) var(--tw-backdrop-brightness) var(--tw-backdrop-contrast) '
+                         'var(--tw-backdrop-grayscale) var(--tw-backdrop-hue-rotate) var(--tw-backdrop-invert) '
+                         'var(--tw-backdrop-opacity) var(--tw-backdrop-saturate) var(--tw-backdrop-sepia)')
+FILTER_VALUE = ('var(--tw-blur) var(--tw-brightness) var(--tw-contrast) var(--tw-grayscale) var(--tw-hue-rotate) '
+                'var(--tw-invert) var(--tw-saturate) var(--tw-sepia) var(--tw-drop-shadow)')
+
+# 只有一种写法的工具类：类名 -> (插件, 声明)
+STATIC_UTILITIES = {
+    'sr-only': ('accessibility', [('position', 'absolute'), ('width', '1px'), ('height', '1px'), ('padding', '0'),
+                                  ('margin', '-1px'), ('overflow', 'hidden'), ('clip', 'rect(0, 0, 0, 0)'),
+                                  ('white-space', 'nowrap'), ('border-width', '0')]),
+    'pointer-events-none': ('pointerEvents', [('pointer-events', 'none')]),
+    'pointer-events-auto': ('pointerEvents', [('pointer-events', 'auto')]),
+    'visible': ('visibility', [('visibility', 'visible')]),
+    'invisible': ('visibility', [('visibility', 'hidden')]),
+    'collapse': ('visibility', [('visibility', 'collapse')]),
+    **{name: ('position', [('position', name)]) for name in ('static', 'fixed', 'absolute', 'relative', 'sticky')},
+    'mx-auto': ('margin', [('margin-left', 'auto'), ('margin-right', 'auto')]),
+    'my-auto': ('margin', [('margin-top', 'auto'), ('margin-bottom', 'auto')]),
+    **{name: ('display', [('display', name)]) for name in ('block', 'inline-block', 'inline', 'flex', 'inline-flex',
+                                                          'table', 'table-cell', 'table-row', 'grid',
+                                                          'inline-grid', 'contents', 'list-item')},
+    'hidden': ('display', [('display', 'none')]),
+    'flex-1': ('flex', [('flex', '1 1 0%')]),
+    'flex-auto': ('flex', [('flex', '1 1 auto')]),
+    'flex-initial': ('flex', [('flex', '0 1 auto')]),
+    'flex-none': ('flex', [('flex', 'none')]),
+    'shrink': ('flexShrink', [('flex-shrink', '1')]),
+    'shrink-0': ('flexShrink', [('flex-shrink', '0')]),
+    'flex-shrink-0': ('flexShrink', [('flex-shrink', '0')]),
+    'grow': ('flexGrow', [('flex-grow', '1')]),
+    'grow-0': ('flexGrow', [('flex-grow', '0')]),
+    'flex-grow': ('flexGrow', [('flex-grow', '1')]),
+    'transform': ('transform', [('transform', TRANSFORM_VALUE)]),
+    'transform-none': ('transform', [('transform', 'none')]),
+    'animate-none': ('animation', [('animation', 'none')]),
+    'cursor-pointer': ('cursor', [('cursor', 'pointer')]),
+    'cursor-default': ('cursor', [('cursor', 'default')]),
+    'cursor-not-allowed': ('cursor', [('cursor', 'not-allowed')]),
+    'select-none': ('userSelect', [('-webkit-user-select', 'none'), ('user-select', 'none')]),
+    'list-none': ('listStyleType', [('list-style-type', 'none')]),
+    'list-disc': ('listStyleType', [('list-style-type', 'disc')]),
+    'list-decimal': ('listStyleType', [('list-style-type', 'decimal')]),
+    'flex-row': ('flexDirection', [('flex-direction', 'row')]),
+    'flex-row-reverse': ('flexDirection', [('flex-direction', 'row-reverse')]),
+    'flex-col': ('flexDirection', [('flex-direction', 'column')]),
+    'flex-col-reverse': ('flexDirection', [('flex-direction', 'column-reverse')]),
+    'flex-wrap': ('flexWrap', [('flex-wrap', 'wrap')]),
+    'flex-wrap-reverse': ('flexWrap', [('flex-wrap', 'wrap-reverse')]),
+    'flex-nowrap': ('flexWrap', [('flex-wrap', 'nowrap')]),
+    **{f'items-{key}': ('alignItems', [('align-items', value)])
+       for key, value in (('start', 'flex-start'), ('end', 'flex-end'), ('center', 'center'),
+                          ('baseline', 'baseline'), ('stretch', 'stretch'))},
+    **{f'justify-{key}': ('justifyContent', [('justify-content', value)])
+       for key, value in (('normal', 'normal'), ('start', 'flex-start'), ('end', 'flex-end'), ('center', 'center'),
+                          ('between', 'space-between'), ('around', 'space-around'),
+                          ('evenly', 'space-evenly'), ('stretch', 'stretch'))},
+    **{f'self-{key}': ('alignSelf', [('align-self', value)])
+       for key, value in (('auto', 'auto'), ('start', 'flex-start'), ('end', 'flex-end'), ('center', 'center'),
+                          ('stretch', 'stretch'))},
+    **{f'overflow-{key}': ('overflow', [('overflow', key)]) for key in ('auto', 'hidden', 'clip', 'visible', 'scroll')},
+    **{f'overflow-x-{key}': ('overflow', [('overflow-x', key)]) for key in ('auto', 'hidden', 'visible', 'scroll')},
+    **{f'overflow-y-{key}': ('overflow', [('overflow-y', key)]) for key in ('auto', 'hidden', 'visible', 'scroll')},
+    'truncate': ('textOverflow', [('overflow', 'hidden'), ('text-overflow', 'ellipsis'), ('white-space', 'nowrap')]),
+    **{f'whitespace-{key}': ('whitespace', [('white-space', key)])
+       for key in ('normal', 'nowrap', 'pre', 'pre-line', 'pre-wrap', 'break-spaces')},
+    'break-words': ('wordBreak', [('overflow-wrap', 'break-word')]),
+    'break-all': ('wordBreak', [('word-break', 'break-all')]),
+    **{f'border-{key}': ('borderStyle', [('border-style', key)])
+       for key in ('solid', 'dashed', 'dotted', 'double', 'hidden', 'none')},
+    'bg-none': ('backgroundImage', [('background-image', 'none')]),
+    **{f'bg-{key}': ('backgroundSize', [('background-size', key)]) for key in ('auto', 'cover', 'contain')},
+    **{f'bg-{key}': ('backgroundAttachment', [('background-attachment', key)]) for key in ('fixed', 'local', 'scroll')},
+    **{f'bg-{key}': ('backgroundPosition', [('background-position', key.replace('-', ' '))])
+       for key in ('bottom', 'center', 'left', 'left-bottom', 'left-top', 'right', 'right-bottom', 'right-top', 'top')},
+    'bg-repeat': ('backgroundRepeat', [('background-repeat', 'repeat')]),
+    'bg-no-repeat': ('backgroundRepeat', [('background-repeat', 'no-repeat')]),
+    **{f'object-{key}': ('objectFit', [('object-fit', key)]) for key in ('contain', 'cover', 'fill', 'none', 'scale-down')},
+    **{f'text-{key}': ('textAlign', [('text-align', key)]) for key in ('left', 'center', 'right', 'justify', 'start', 'end')},
+    'align-middle': ('verticalAlign', [('vertical-align', 'middle')]),
+    'align-top': ('verticalAlign', [('vertical-align', 'top')]),
+    'uppercase': ('textTransform', [('text-transform', 'uppercase')]),
+    'lowercase': ('textTransform', [('text-transform', 'lowercase')]),
+    'capitalize': ('textTransform', [('text-transform', 'capitalize')]),
+    'normal-case': ('textTransform', [('text-transform', 'none')]),
+    'italic': ('fontStyle', [('font-style', 'italic')]),
+    'not-italic': ('fontStyle', [('font-style', 'normal')]),
+    'underline': ('textDecorationLine', [('text-decoration-line', 'underline')]),
+    'overline': ('textDecorationLine', [('text-decoration-line', 'overline')]),
+    'line-through': ('textDecorationLine', [('text-decoration-line', 'line-through')]),
+    'no-underline': ('textDecorationLine', [('text-decoration-line', 'none')]),
+    'antialiased': ('fontSmoothing', [('-webkit-font-smoothing', 'antialiased'), ('-moz-osx-font-smoothing', 'grayscale')]),
+    'outline-none': ('outlineStyle', [('outline', '2px solid transparent'), ('outline-offset', '2px')]),
+    'outline': ('outlineStyle', [('outline-style', 'solid')]),
+    'ring-inset': ('ringWidth', [('--tw-ring-inset', 'inset')]),
+    'filter': ('filter', [('filter', FILTER_VALUE)]),
+    'filter-none': ('filter', [('filter', 'none')]),
+    'backdrop-filter': ('backdropFilter', [('-webkit-backdrop-filter', BACKDROP_FILTER_VALUE),
+                                           ('backdrop-filter', BACKDROP_FILTER_VALUE)]),
+    'ease-linear': ('transitionTimingFunction', [('transition-timing-function', 'linear')]),
+    'ease-in': ('transitionTimingFunction', [('transition-timing-function', TIMING_FUNCTION['in'])]),
+    'ease-out': ('transitionTimingFunction', [('transition-timing-function', TIMING_FUNCTION['out'])]),
+    'ease-in-out': ('transitionTimingFunction', [('transition-timing-function', TIMING_FUNCTION['in-out'])]),
+}
+
+# 插件输出顺序，与 Tailwind 的 corePlugins 顺序一致，决定同一元素上规则的层叠顺序
+PLUGIN_ORDER = [
+    'container', 'accessibility', 'pointerEvents', 'visibility', 'position', 'inset', 'zIndex', 'gridColumn',
+    'margin', 'display', 'size', 'height', 'maxHeight', 'minHeight', 'width', 'minWidth', 'maxWidth', 'flex',
+    'flexShrink', 'flexGrow', 'translate', 'rotate', 'scale', 'transform', 'animation', 'cursor', 'userSelect',
+    'listStyleType', 'gridTemplateColumns', 'gridTemplateRows', 'flexDirection', 'flexWrap', 'alignItems',
+    'justifyContent', 'gap', 'space', 'alignSelf', 'overflow', 'textOverflow', 'whitespace', 'wordBreak',
+    'borderRadius', 'borderWidth', 'borderStyle', 'borderColor', 'backgroundColor', 'backgroundImage',
+    'gradientColorStops', 'backgroundSize', 'backgroundAttachment', 'backgroundPosition', 'backgroundRepeat',
+    'objectFit', 'padding', 'textAlign', 'verticalAlign', 'fontFamily', 'fontSize', 'fontWeight', 'textTransform',
+    'fontStyle', 'lineHeight', 'letterSpacing', 'textColor', 'textDecorationLine', 'fontSmoothing', 'opacity',
+    'boxShadow', 'outlineStyle', 'ringWidth', 'ringColor', 'ringOffsetWidth', 'blur', 'filter', 'backdropBlur',
+    'backdropFilter', 'transitionProperty', 'transitionDelay', 'transitionDuration', 'transitionTimingFunction',
+]
+# 状态变体：变体 -> 选择器后缀，按 Tailwind 的变体顺序排列
+PSEUDO_VARIANTS = {
+    'first': ':first-child', 'last': ':last-child', 'odd': ':nth-child(odd)', 'even': ':nth-child(even)',
+    'visited': ':visited', 'focus-within': ':focus-within', 'hover': ':hover', 'focus': ':focus',
+    'focus-visible': ':focus-visible', 'active': ':active', 'disabled': ':disabled',
+}
+GROUP_VARIANTS = {'group-hover': ':hover', 'group-focus': ':focus'}
+# 响应式断点
+SCREENS = {'sm': '640px', 'md': '768px', 'lg': '1024px', 'xl': '1280px', '2xl': '1536px'}
+
+# 所有元素的 CSS 变量默认值，各工具类组合使用（transform、shadow、ring、filter 等）
+PROPERTY_DEFAULTS = [
+    ('--tw-border-spacing-x', '0'), ('--tw-border-spacing-y', '0'), ('--tw-translate-x', '0'),
+    ('--tw-translate-y', '0'), ('--tw-rotate', '0'), ('--tw-skew-x', '0'), ('--tw-skew-y', '0'),
+    ('--tw-scale-x', '1'), ('--tw-scale-y', '1'), ('--tw-pan-x', ' '), ('--tw-pan-y', ' '),
+    ('--tw-pinch-zoom', ' '), ('--tw-scroll-snap-strictness', 'proximity'), ('--tw-gradient-from-position', ' '),
+    ('--tw-gradient-via-position', ' '), ('--tw-gradient-to-position', ' '), ('--tw-ordinal', ' '),
+    ('--tw-slashed-zero', ' '), ('--tw-numeric-figure', ' '), ('--tw-numeric-spacing', ' '),
+    ('--tw-numeric-fraction', ' '), ('--tw-ring-inset', ' '), ('--tw-ring-offset-width', '0px'),
+    ('--tw-ring-offset-color', '#fff'), ('--tw-ring-color', 'rgb(59 130 246 / 0.5)'),
+    ('--tw-ring-offset-shadow', '0 0 #0000'), ('--tw-ring-shadow', '0 0 #0000'), ('--tw-shadow', '0 0 #0000'),
+    ('--tw-shadow-colored', '0 0 #0000'), ('--tw-blur', ' '), ('--tw-brightness', ' '), ('--tw-contrast', ' '),
+    ('--tw-grayscale', ' '), ('--tw-hue-rotate', ' '), ('--tw-invert', ' '), ('--tw-saturate', ' '),
+    ('--tw-sepia', ' '), ('--tw-drop-shadow', ' '), ('--tw-backdrop-blur', ' '), ('--tw-backdrop-brightness', ' '),
+    ('--tw-backdrop-contrast', ' '), ('--tw-backdrop-grayscale', ' '), ('--tw-backdrop-hue-rotate', ' '),
+    ('--tw-backdrop-invert', ' '), ('--tw-backdrop-opacity', ' '), ('--tw-backdrop-saturate', ' '),
+    ('--tw-backdrop-sepia', ' '),
+]
+
+# Tailwind v3 的基础样式（Preflight），{sans} 和 {mono} 为主题中的默认字体
+PREFLIGHT = '''*,
+::before,
+::after {
+  box-sizing: border-box;
+  border-width: 0;
+  border-style: solid;
+  border-color: #e5e7eb;
+}
+
+::before,
+::after {
+  --tw-content: '';
+}
+
+html,
+:host {
+  line-height: 1.5;
+  -webkit-text-size-adjust: 100%;
+  -moz-tab-size: 4;
+  tab-size: 4;
+  font-family: {sans};
+  font-feature-settings: normal;
+  font-variation-settings: normal;
+  -webkit-tap-highlight-color: transparent;
+}
+
+body {
+  margin: 0;
+  line-height: inherit;
+}
+
+hr {
+  height: 0;
+  color: inherit;
+  border-top-width: 1px;
+}
+
+abbr:where([title]) {
+  -webkit-text-decoration: underline dotted;
+  text-decoration: underline dotted;
+}
+
+h1,
+h2,
+h3,
+h4,
+h5,
+h6 {
+  font-size: inherit;
+  font-weight: inherit;
+}
+
+a {
+  color: inherit;
+  text-decoration: inherit;
+}
+
+b,
+strong {
+  font-weight: bolder;
+}
+
+code,
+kbd,
+samp,
+pre {
+  font-family: {mono};
+  font-feature-settings: normal;
+  font-variation-settings: normal;
+  font-size: 1em;
+}
+
+small {
+  font-size: 80%;
+}
+
+sub,
+sup {
+  font-size: 75%;
+  line-height: 0;
+  position: relative;
+  vertical-align: baseline;
+}
+
+sub {
+  bottom: -0.25em;
+}
+
+sup {
+  top: -0.5em;
+}
+
+table {
+  text-indent: 0;
+  border-color: inherit;
+  border-collapse: collapse;
+}
+
+button,
+input,
+optgroup,
+select,
+textarea {
+  font-family: inherit;
+  font-feature-settings: inherit;
+  font-variation-settings: inherit;
+  font-size: 100%;
+  font-weight: inherit;
+  line-height: inherit;
+  letter-spacing: inherit;
+  color: inherit;
+  margin: 0;
+  padding: 0;
+}
+
+button,
+select {
+  text-transform: none;
+}
+
+button,
+input:where([type='button']),
+input:where([type='reset']),
+input:where([type='submit']) {
+  -webkit-appearance: button;
+  background-color: transparent;
+  background-image: none;
+}
+
+:-moz-focusring {
+  outline: auto;
+}
+
+:-moz-ui-invalid {
+  box-shadow: none;
+}
+
+progress {
+  vertical-align: baseline;
+}
+
+::-webkit-inner-spin-button,
+::-webkit-outer-spin-button {
+  height: auto;
+}
+
+[type='search'] {
+  -webkit-appearance: textfield;
+  outline-offset: -2px;
+}
+
+::-webkit-search-decoration {
+  -webkit-appearance: none;
+}
+
+::-webkit-file-upload-button {
+  -webkit-appearance: button;
+  font: inherit;
+}
+
+summary {
+  display: list-item;
+}
+
+blockquote,
+dl,
+dd,
+h1,
+h2,
+h3,
+h4,
+h5,
+h6,
+hr,
+figure,
+p,
+pre {
+  margin: 0;
+}
+
+fieldset {
+  margin: 0;
+  padding: 0;
+}
+
+legend {
+  padding: 0;
+}
+
+ol,
+ul,
+menu {
+  list-style: none;
+  margin: 0;
+  padding: 0;
+}
+
+dialog {
+  padding: 0;
+}
+
+textarea {
+  resize: vertical;
+}
+
+input::placeholder,
+textarea::placeholder {
+  opacity: 1;
+  color: #9ca3af;
+}
+
+button,
+[role="button"] {
+  cursor: pointer;
+}
+
+:disabled {
+  cursor: default;
+}
+
+img,
+svg,
+video,
+canvas,
+audio,
+iframe,
+embed,
+object {
+  display: block;
+  vertical-align: middle;
+}
+
+img,
+video {
+  max-width: 100%;
+  height: auto;
+}
+
+[hidden]:where(:not([hidden="until-found"])) {
+  display: none;
+}
+'''
+
+
+def css_escape(name):
+    """转义类名中的特殊字符，生成CSS类选择器"""
+    result = []
+    for i, char in enumerate(name):
+        if char.isalnum() and char.isascii() or char in '-_' or not char.isascii():
+            if i == 0 and char.isdigit():
+                result.append(f'\\3{char} ')
+            else:
+                result.append(char)
+        else:
+            result.append('\\' + char)
+    return ''.join(result)
+
+
+def split_variants(candidate):
+    """按不在方括号内的冒号拆分变体和工具类，例如 md:hover:bg-primary/90"""
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(candidate):
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+        elif char == ':' and depth == 0:
+            parts.append(candidate[start:i])
+            start = i + 1
+    parts.append(candidate[start:])
+    return parts[:-1], parts[-1]
+
+
+def hex_to_rgb(color):
+    """#rgb 或 #rrggbb 转换为 'r g b'，不是十六进制颜色时返回None"""
+    match = re.fullmatch(r'#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})', color)
+    if not match:
+        return None
+    value = match.group(1)
+    if len(value) == 3:
+        value = ''.join(char * 2 for char in value)
+    return ' '.join(str(int(value[i:i + 2], 16)) for i in (0, 2, 4))
+
+
+def js_object_to_json(text):
+    """把 tailwind.config 的对象字面量转换为JSON：单引号字符串、不带引号的键和末尾逗号"""
+    strings = []
+
+    def keep_string(match):
+        strings.append(match.group(1) if match.group(1) is not None else match.group(2))
+        return f'"\x00{len(strings) - 1}\x00"'
+
+    text = re.sub(r"'((?:[^'\\]|\\.)*)'|\"((?:[^\"\\]|\\.)*)\"", keep_string, text)
+    text = re.sub(r'//[^\n]*', '', text)
+    text = re.sub(r'([{,]\s*)([A-Za-z_$][\w$-]*)\s*:', r'\1"\2":', text)
+    text = re.sub(r',(\s*[}\]])', r'\1', text)
+    return re.sub('"\x00(\\d+)\x00"', lambda match: json.dumps(strings[int(match.group(1))]), text)
+
+
+def unwrap_layers(css):
+    """去掉 @layer xxx { ... } 外层，保留其中的规则（并减少一级缩进）"""
+    result = []
+    position = 0
+    for match in LAYER_PATTERN.finditer(css):
+        if match.start() < position:
+            continue
+        depth = 1
+        end = match.end()
+        while end < len(css) and depth:
+            depth += {'{': 1, '}': -1}.get(css[end], 0)
+            end += 1
+        result.append(css[position:match.start()].rstrip(' \t'))
+        inner = css[match.end():end - 1].strip('\n').rstrip()
+        result.append('\n'.join(line[4:] if line.startswith('    ') else line for line in inner.split('\n')))
+        position = end
+    result.append(css[position:])
+    return ''.join(result)
+
+
+class TailwindBuilder:
+    """按 Tailwind CSS v3 默认主题（加上页面配置的扩展）为用到的类名生成样式"""
+
+    def __init__(self, theme=None):
+        """
+        初始化
+
+        Args:
+            theme: tailwind.config 中的 theme 部分，支持 colors、fontFamily（含 extend）
+        """
+        theme = theme or {}
+        extend = theme.get('extend', {})
+        self.colors = {}
+        for name, shades in PALETTE.items():
+            for shade, value in zip(COLOR_SHADES, shades.split()):
+                self.colors[f'{name}-{shade}'] = value
+        self.colors.update(SPECIAL_COLORS)
+        if 'colors' in theme:
+            self.colors = dict(SPECIAL_COLORS)
+            self.add_colors(theme['colors'])
+        self.add_colors(extend.get('colors', {}))
+        self.font_family = dict(theme.get('fontFamily', DEFAULT_FONT_FAMILY))
+        self.font_family.update(extend.get('fontFamily', {}))
+
+    def add_colors(self, colors, prefix=''):
+        """添加主题颜色，嵌套的色阶展开为 名称-色阶，DEFAULT 对应名称本身"""
+        for name, value in colors.items():
+            key = prefix if name == 'DEFAULT' else (f'{prefix}-{name}' if prefix else name)
+            if isinstance(value, dict):
+                self.add_colors(value, key)
+            else:
+                self.colors[key] = value
+
+    @staticmethod
+    def lookup(scale, key):
+        """在取值表中查找，支持任意值写法 [value]（下划线表示空格）"""
+        if key.startswith('[') and key.endswith(']') and len(key) > 2:
+            return key[1:-1].replace('_', ' ')
+        return scale.get(key)
+
+    def color(self, key):
+        """
+        解析颜色及可选的不透明度，例如 primary/10
+
+        Returns:
+            (颜色值, 'r g b' 或 None, 不透明度或None)，不是颜色时返回None
+        """
+        opacity = None
+        if '/' in key:
+            key, alpha = key.rsplit('/', 1)
+            opacity = self.lookup(OPACITY, alpha)
+            if opacity is None:
+                return None
+        value = self.lookup(self.colors, key)
+        if value is None:
+            return None
+        return value, hex_to_rgb(value), opacity
+
+    def color_declarations(self, key, opacity_var, prop):
+        """颜色工具类：十六进制颜色带不透明度变量，与 Tailwind 的输出相同"""
+        parsed = self.color(key)
+        if parsed is None:
+            return None
+        value, rgb, opacity = parsed
+        if rgb is None:
+            return [(prop, value)]
+        if opacity is not None:
+            return [(prop, f'rgb({rgb} / {opacity})')]
+        return [(opacity_var, '1'), (prop, f'rgb({rgb} / var({opacity_var}))')]
+
+    def gradient_color(self, key):
+        """渐变色标的颜色值和透明版本"""
+        parsed = self.color(key)
+        if parsed is None:
+            return None
+        value, rgb, opacity = parsed
+        if rgb is None:
+            return value, 'rgb(255 255 255 / 0)' if value == 'transparent' else value
+        if opacity is not None:
+            value = f'rgb({rgb} / {opacity})'
+        return value, f'rgb({rgb} / 0)'
+
+    def resolve(self, utility):
+        """
+        解析单个工具类（不含变体）
+
+        Returns:
+            (插件, [(属性, 值), ...], 选择器后缀)，不是已知的工具类时返回None
+        """
+        if utility in STATIC_UTILITIES:
+            plugin, declarations = STATIC_UTILITIES[utility]
+            return plugin, declarations, ''
+        negative = utility.startswith('-')
+        name = utility[1:] if negative else utility
+
+        def signed(value):
+            if value is None or not negative:
+                return value
+            if value in ('0', '0px', 'auto'):
+                return None if value == 'auto' else value
+            return value[1:] if value.startswith('-') else '-' + value
+
+        # 外边距和内边距
+        for prefix, props in (('m', ('margin',)), ('mx', ('margin-left', 'margin-right')),
+                              ('my', ('margin-top', 'margin-bottom')), ('mt', ('margin-top',)),
+                              ('mr', ('margin-right',)), ('mb', ('margin-bottom',)), ('ml', ('margin-left',)),
+                              ('p', ('padding',)), ('px', ('padding-left', 'padding-right')),
+                              ('py', ('padding-top', 'padding-bottom')), ('pt', ('padding-top',)),
+                              ('pr', ('padding-right',)), ('pb', ('padding-bottom',)), ('pl', ('padding-left',))):
+            if name.startswith(prefix + '-'):
+                is_margin = prefix.startswith('m')
+                scale = {**SPACING, 'auto': 'auto'} if is_margin else SPACING
+                value = self.lookup(scale, name[len(prefix) + 1:])
+                value = signed(value) if is_margin else (None if negative else value)
+                if value is not None:
+                    return ('margin' if is_margin else 'padding'), [(prop, value) for prop in props], ''
+
+        # 定位
+        for prefix, props in (('inset', ('inset',)), ('inset-x', ('left', 'right')), ('inset-y', ('top', 'bottom')),
+                              ('top', ('top',)), ('right', ('right',)), ('bottom', ('bottom',)), ('left', ('left',))):
+            if name.startswith(prefix + '-'):
+                value = signed(self.lookup(INSET, name[len(prefix) + 1:]))
+                if value is not None:
+                    return 'inset', [(prop, value) for prop in props], ''
+
+        # 间隔：子元素之间的外边距
+        for axis in ('x', 'y'):
+            if name == f'space-{axis}-reverse':
+                return 'space', [(f'--tw-space-{axis}-reverse', '1')], ' > :not([hidden]) ~ :not([hidden])'
+            if name.startswith(f'space-{axis}-'):
+                value = signed(self.lookup(SPACING, name[8:]))
+                if value is None:
+                    continue
+                start, end = ('left', 'right') if axis == 'x' else ('top', 'bottom')
+                return 'space', [(f'--tw-space-{axis}-reverse', '0'),
+                                 (f'margin-{end}', f'calc({value} * var(--tw-space-{axis}-reverse))'),
+                                 (f'margin-{start}', f'calc({value} * calc(1 - var(--tw-space-{axis}-reverse)))')], \
+                    ' > :not([hidden]) ~ :not([hidden])'
+
+        # 平移、缩放、旋转
+        for prefix, variable in (('translate-x', '--tw-translate-x'), ('translate-y', '--tw-translate-y')):
+            if name.startswith(prefix + '-'):
+                value = signed(self.lookup({**SPACING, 'full': '100%', **fractions(2, 3, 4)}, name[len(prefix) + 1:]))
+                if value is not None:
+                    return 'translate', [(variable, value), ('transform', TRANSFORM_VALUE)], ''
+        for prefix, variables in (('scale', ('--tw-scale-x', '--tw-scale-y')), ('scale-x', ('--tw-scale-x',)),
+                                  ('scale-y', ('--tw-scale-y',))):
+            if name.startswith(prefix + '-'):
+                value = signed(self.lookup(SCALE, name[len(prefix) + 1:]))
+                if value is not None:
+                    return 'scale', [(variable, value) for variable in variables] + [('transform', TRANSFORM_VALUE)], ''
+        if name.startswith('rotate-'):
+            value = signed(self.lookup(ROTATE, name[7:]))
+            if value is not None:
+                return 'rotate', [('--tw-rotate', value), ('transform', TRANSFORM_VALUE)], ''
+
+        if negative:
+            return None
+        return self.resolve_positive(name)
+
+    def resolve_positive(self, name):
+        """解析不支持负值的工具类"""
+        if name == 'container':
+            return 'container', [('width', '100%')], ''
+
+        prefix, _, key = name.partition('-')
+        simple = {
+            'z': ('zIndex', Z_INDEX, 'z-index'),
+            'h': ('height', HEIGHT, 'height'),
+            'w': ('width', WIDTH, 'width'),
+            'opacity': ('opacity', OPACITY, 'opacity'),
+            'duration': ('transitionDuration', DURATION, 'transition-duration'),
+            'delay': ('transitionDelay', DURATION, 'transition-delay'),
+            'leading': ('lineHeight', LINE_HEIGHT, 'line-height'),
+            'tracking': ('letterSpacing', LETTER_SPACING, 'letter-spacing'),
+            'gap': ('gap', SPACING, 'gap'),
+        }
+        if prefix in simple and key:
+            plugin, scale, prop = simple[prefix]
+            value = self.lookup(scale, key)
+            if value is not None:
+                return plugin, [(prop, value)], ''
+        for sized, plugin, scale, prop in (('max-h', 'maxHeight', MAX_HEIGHT, 'max-height'),
+                                           ('min-h', 'minHeight', MIN_HEIGHT, 'min-height'),
+                                           ('max-w', 'maxWidth', MAX_WIDTH, 'max-width'),
+                                           ('min-w', 'minWidth', MIN_WIDTH, 'min-width'),
+                                           ('gap-x', 'gap', SPACING, 'column-gap'),
+                                           ('gap-y', 'gap', SPACING, 'row-gap')):
+            if name.startswith(sized + '-'):
+                value = self.lookup(scale, name[len(sized) + 1:])
+                if value is not None:
+                    return plugin, [(prop, value)], ''
+        if name.startswith('size-'):
+            value = self.lookup({**SPACING, **SIZE_KEYWORDS}, name[5:])
+            if value is not None:
+                return 'size', [('width', value), ('height', value)], ''
+
+        # 网格
+        match = re.fullmatch(r'grid-(cols|rows)-(\d+|none)', name)
+        if match:
+            plugin = 'gridTemplateColumns' if match.group(1) == 'cols' else 'gridTemplateRows'
+            prop = 'grid-template-columns' if match.group(1) == 'cols' else 'grid-template-rows'
+            count = match.group(2)
+            return plugin, [(prop, 'none' if count == 'none' else f'repeat({count}, minmax(0, 1fr))')], ''
+        match = re.fullmatch(r'col-span-(\d+|full)', name)
+        if match:
+            span = match.group(1)
+            return 'gridColumn', [('grid-column', '1 / -1' if span == 'full' else f'span {span} / span {span}')], ''
+
+        # 圆角
+        match = re.fullmatch(r'rounded(?:-([trbl]|tl|tr|br|bl))?(?:-(.+))?', name)
+        if match and (match.group(2) or '') in BORDER_RADIUS:
+            value = BORDER_RADIUS[match.group(2) or '']
+            corners = {None: ['border-radius'],
+                       't': ['border-top-left-radius', 'border-top-right-radius'],
+                       'r': ['border-top-right-radius', 'border-bottom-right-radius'],
+                       'b': ['border-bottom-right-radius', 'border-bottom-left-radius'],
+                       'l': ['border-top-left-radius', 'border-bottom-left-radius'],
+                       'tl': ['border-top-left-radius'], 'tr': ['border-top-right-radius'],
+                       'br': ['border-bottom-right-radius'], 'bl': ['border-bottom-left-radius']}
+            return 'borderRadius', [(prop, value) for prop in corners[match.group(1)]], ''
+
+        # 边框宽度和颜色
+        match = re.fullmatch(r'border(?:-([xytrbl]))?(?:-(\d+))?', name)
+        if match and (match.group(2) or '') in BORDER_WIDTH:
+            value = BORDER_WIDTH[match.group(2) or '']
+            sides = {None: ['border-width'], 'x': ['border-left-width', 'border-right-width'],
+                     'y': ['border-top-width', 'border-bottom-width'], 't': ['border-top-width'],
+                     'r': ['border-right-width'], 'b': ['border-bottom-width'], 'l': ['border-left-width']}
+            return 'borderWidth', [(prop, value) for prop in sides[match.group(1)]], ''
+        if name.startswith('border-'):
+            declarations = self.color_declarations(name[7:], '--tw-border-opacity', 'border-color')
+            if declarations:
+                return 'borderColor', declarations, ''
+
+        # 背景
+        if name.startswith('bg-gradient-to-') and name[15:] in GRADIENT_DIRECTIONS:
+            direction = GRADIENT_DIRECTIONS[name[15:]]
+            return 'backgroundImage', [('background-image', f'linear-gradient(to {direction}, var(--tw-gradient-stops))')], ''
+        if name.startswith('bg-'):
+            declarations = self.color_declarations(name[3:], '--tw-bg-opacity', 'background-color')
+            if declarations:
+                return 'backgroundColor', declarations, ''
+        for stop in ('from', 'via', 'to'):
+            if name.startswith(stop + '-'):
+                colors = self.gradient_color(name[len(stop) + 1:])
+                if colors is None:
+                    continue
+                value, transparent = colors
+                if stop == 'from':
+                    declarations = [('--tw-gradient-from', f'{value} var(--tw-gradient-from-position)'),
+                                    ('--tw-gradient-to', f'{transparent} var(--tw-gradient-to-position)'),
+                                    ('--tw-gradient-stops', 'var(--tw-gradient-from), var(--tw-gradient-to)')]
+                elif stop == 'via':
+                    declarations = [('--tw-gradient-to', f'{transparent} var(--tw-gradient-to-position)'),
+                                    ('--tw-gradient-stops', f'var(--tw-gradient-from), {value} '
+                                                            f'var(--tw-gradient-via-position), var(--tw-gradient-to)')]
+                else:
+                    declarations = [('--tw-gradient-to', f'{value} var(--tw-gradient-to-position)')]
+                return 'gradientColorStops', declarations, ''
+
+        # 文字
+        if name.startswith('font-'):
+            key = name[5:]
+            if key in self.font_family:
+                family = self.font_family[key]
+                return 'fontFamily', [('font-family', ', '.join(family) if isinstance(family, list) else family)], ''
+            if key in FONT_WEIGHT:
+                return 'fontWeight', [('font-weight', FONT_WEIGHT[key])], ''
+        if name.startswith('text-'):
+            key = name[5:]
+            if key in FONT_SIZE:
+                size, line_height = FONT_SIZE[key]
+                return 'fontSize', [('font-size', size), ('line-height', line_height)], ''
+            declarations = self.color_declarations(key, '--tw-text-opacity', 'color')
+            if declarations:
+                return 'textColor', declarations, ''
+
+        # 阴影、轮廓环和滤镜
+        match = re.fullmatch(r'shadow(?:-(.+))?', name)
+        if match and (match.group(1) or '') in BOX_SHADOW:
+            shadow = BOX_SHADOW[match.group(1) or '']
+            colored = re.sub(r'rgb\(0 0 0 / [\d.]+\)', 'var(--tw-shadow-color)', shadow)
+            return 'boxShadow', [('--tw-shadow', shadow), ('--tw-shadow-colored', colored),
+                                 ('box-shadow', 'var(--tw-ring-offset-shadow, 0 0 #0000), '
+                                                'var(--tw-ring-shadow, 0 0 #0000), var(--tw-shadow)')], ''
+        match = re.fullmatch(r'ring(?:-(\d+))?', name)
+        if match and (match.group(1) or '') in RING_WIDTH:
+            width = RING_WIDTH[match.group(1) or '']
+            return 'ringWidth', [
+                ('--tw-ring-offset-shadow', 'var(--tw-ring-inset) 0 0 0 var(--tw-ring-offset-width) var(--tw-ring-offset-color)'),
+                ('--tw-ring-shadow', f'var(--tw-ring-inset) 0 0 0 calc({width} + var(--tw-ring-offset-width)) var(--tw-ring-color)'),
+                ('box-shadow', 'var(--tw-ring-offset-shadow), var(--tw-ring-shadow), var(--tw-shadow, 0 0 #0000)')], ''
+        match = re.fullmatch(r'ring-offset-(\d+)', name)
+        if match and match.group(1) in RING_WIDTH:
+            return 'ringOffsetWidth', [('--tw-ring-offset-width', RING_WIDTH[match.group(1)])], ''
+        if name.startswith('ring-'):
+            declarations = self.color_declarations(name[5:], '--tw-ring-opacity', '--tw-ring-color')
+            if declarations:
+                return 'ringColor', declarations, ''
+        for prefix, plugin, variable, prop, value in (('blur', 'blur', '--tw-blur', 'filter', FILTER_VALUE),
+                                                      ('backdrop-blur', 'backdropBlur', '--tw-backdrop-blur',
+                                                       'backdrop-filter', BACKDROP_FILTER_VALUE)):
+            match = re.fullmatch(prefix + r'(?:-(.+))?', name)
+            if match and (match.group(1) or '') in BLUR:
+                size = BLUR[match.group(1) or '']
+                declarations = [(variable, f'blur({size})' if size else ' ')]
+                if prop == 'backdrop-filter':
+                    declarations.append(('-webkit-backdrop-filter', value))
+                declarations.append((prop, value))
+                return plugin, declarations, ''
+
+        # 过渡
+        match = re.fullmatch(r'transition(?:-(.+))?', name)
+        if match and (match.group(1) or '') in TRANSITION_PROPERTY:
+            prop = TRANSITION_PROPERTY[match.group(1) or '']
+            if prop == 'none':
+                return 'transitionProperty', [('transition-property', 'none')], ''
+            declarations = [('transition-property', prop)]
+            declarations += [('transition-timing-function', TIMING_FUNCTION['in-out']), ('transition-duration', '150ms')]
+            return 'transitionProperty', declarations, ''
+        return None
+
+    def rule(self, candidate):
+        """
+        为候选类名生成规则
+
+        Returns:
+            (排序键, @media条件或None, 选择器, 声明列表)，不是工具类时返回None
+        """
+        variants, utility = split_variants(candidate)
+        resolved = self.resolve(utility)
+        if resolved is None:
+            return None
+        plugin, declarations, suffix = resolved
+        selector = '.' + css_escape(candidate)
+        screen = 0
+        pseudo = 0
+        media = None
+        pseudo_names = list(PSEUDO_VARIANTS) + list(GROUP_VARIANTS)
+        for variant in variants:
+            if variant in SCREENS and screen == 0:
+                screen = list(SCREENS).index(variant) + 1
+                media = f'(min-width: {SCREENS[variant]})'
+            elif variant in PSEUDO_VARIANTS:
+                selector += PSEUDO_VARIANTS[variant]
+                pseudo = max(pseudo, pseudo_names.index(variant) + 1)
+            elif variant in GROUP_VARIANTS:
+                selector = f'.group{GROUP_VARIANTS[variant]} {selector}'
+                pseudo = max(pseudo, pseudo_names.index(variant) + 1)
+            else:
+                return None
+        return (screen, pseudo, PLUGIN_ORDER.index(plugin), candidate), media, selector + suffix, declarations
+
+    def build(self, candidates):
+        """
+        为候选类名生成完整的样式表
+
+        Returns:
+            (样式表内容, 生成了规则的类名列表)
+        """
+        rules = []
+        used = []
+        for candidate in sorted(set(candidates)):
+            rule = self.rule(candidate)
+            if rule is not None:
+                rules.append(rule)
+                used.append(candidate)
+        rules.sort(key=lambda rule: rule[0])
+
+        sans = ', '.join(self.font_family.get('sans', DEFAULT_FONT_FAMILY['sans']))
+        mono = ', '.join(self.font_family.get('mono', DEFAULT_FONT_FAMILY['mono']))
+        parts = ['/* 由 .workers/build_css.py 生成，请勿手动修改 */\n',
+                 format_rule('*, ::before, ::after', PROPERTY_DEFAULTS),
+                 format_rule('::backdrop', PROPERTY_DEFAULTS),
+                 PREFLIGHT.replace('{sans}', sans).replace('{mono}', mono)]
+        media = None
+        for _, rule_media, selector, declarations in rules:
+            if rule_media != media:
+                if media is not None:
+                    parts.append('}\n')
+                if rule_media is not None:
+                    parts.append(f'\n@media {rule_media} {{\n')
+                media = rule_media
+            text = format_rule(selector, declarations)
+            parts.append(text if media is None else indent(text))
+            if selector == '.container' and media is None:
+                # 容器在各断点下的最大宽度
+                for width in SCREENS.values():
+                    parts.append(f'\n@media (min-width: {width}) {{\n')
+                    parts.append(indent(format_rule('.container', [('max-width', width)])))
+                    parts.append('}\n')
+        if media is not None:
+            parts.append('}\n')
+        return ''.join(parts), used
+
+
+def format_rule(selector, declarations):
+    """格式化一条规则（两个空格缩进）"""
+    body = ''.join(f'  {prop}: {value};\n' for prop, value in declarations)
+    return f'\n{selector} {{\n{body}}}\n'
+
+
+def indent(text):
+    """@media 块内的规则增加一级缩进（空行不加）"""
+    return ''.join('  ' + line if line.strip() else line for line in text.splitlines(True))
+
+
+def collect_candidates(paths):
+    """
+    收集候选类名
+
+    Returns:
+        (所有候选类名集合, 页面class属性中出现的类名集合)
+    """
+    candidates = set()
+    class_names = set()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        for token in CANDIDATE_PATTERN.findall(content):
+            candidates.add(token.rstrip('.:'))
+        if path.endswith('.html'):
+            for value in CLASS_ATTR_PATTERN.findall(content):
+                class_names.update(value.split())
+    # 标签按钮的颜色由简历中的记录数决定，按 TAB_COLORS 全部保留
+    for color in TAB_COLORS:
+        candidates.update((color, f'hover:{color}/80', f'focus:ring-{color[3:]}/20'))
+    return candidates, class_names
+
+
+def defined_classes(paths, output_path):
+    """
+    页面 <style> 中和引用的本地样式表（生成的样式表除外）中定义的类名
+
+    Returns:
+        类名集合
+    """
+    classes = set()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        styles = STYLE_PATTERN.findall(content)
+        for href in STYLESHEET_LINK_PATTERN.findall(content):
+            css_path = os.path.normpath(os.path.join(os.path.dirname(path), href))
+            if css_path == os.path.normpath(output_path) or not os.path.exists(css_path):
+                continue
+            with open(css_path, 'r', encoding='utf-8') as f:
+                styles.append(f.read())
+        for style in styles:
+            classes.update(CSS_CLASS_PATTERN.findall(style))
+    return classes
+
+
+def looks_like_tailwind(name):
+    """类名是否像 Tailwind 工具类：带变体前缀，或第一段是常见的工具类名"""
+    variants, utility = split_variants(name)
+    return bool(variants) or utility.lstrip('-').split('-')[0] in TAILWIND_ROOTS
+
+
+def page_paths(patterns):
+    """按glob模式列出页面，按路径排序"""
+    paths = []
+    for pattern in patterns:
+        paths.extend(sorted(glob.glob(os.path.join(PROJECT_ROOT, pattern))))
+    return paths
+
+
+def extract_theme(page_paths_list):
+    """从页面的 tailwind.config 脚本中读取 theme，没有时返回None"""
+    for path in page_paths_list:
+        with open(path, 'r', encoding='utf-8') as f:
+            match = CONFIG_SCRIPT_PATTERN.search(f.read())
+        if match:
+            try:
+                return json.loads(js_object_to_json(match.group(1))).get('theme', {})
+            except ValueError as e:
+                print(f"✗ 无法解析 {os.path.relpath(path, PROJECT_ROOT)} 中的 tailwind.config: {e}")
+    return None
+
+
+def load_theme(theme_path, pages):
+    """读取主题：页面中仍有 tailwind.config 时以页面为准并保存，否则读取保存的主题文件"""
+    theme = extract_theme(pages)
+    if theme is not None:
+        with open(theme_path, 'w', encoding='utf-8') as f:
+            json.dump(theme, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"✓ 已从页面提取 Tailwind 主题配置: {os.path.relpath(theme_path, PROJECT_ROOT)}")
+        return theme
+    try:
+        with open(theme_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def link_stylesheet(path, css_path):
+    """
+    把页面中的 Tailwind CDN 脚本替换为静态样式表
+
+    同时移除 tailwind.config 脚本，<style type="text/tailwindcss"> 改为普通样式（去掉 @layer 外层）
+
+    Returns:
+        页面是否有变化
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    if not CDN_SCRIPT_PATTERN.search(content):
+        return False
+    href = os.path.relpath(css_path, os.path.dirname(path)).replace('\\', '/')
+    updated = CDN_SCRIPT_PATTERN.sub(lambda _: f'<link href="{href}" rel="stylesheet"/>', content, count=1)
+    updated = CONFIG_SCRIPT_PATTERN.sub('', updated)
+    updated = TAILWIND_STYLE_PATTERN.sub(lambda match: f'<style>{unwrap_layers(match.group(1))}</style>', updated)
+    if '@apply' in updated:
+        print(f"✗ {os.path.relpath(path, PROJECT_ROOT)} 的样式中使用了 @apply，需要手动改写为普通CSS")
+    write_atomic(path, [updated])
+    return True
+
+
+def build(page_patterns=None, output_path=DEFAULT_OUTPUT, theme_path=DEFAULT_THEME, verbose=False, strict=False):
+    """
+    生成样式表并替换页面中的CDN脚本
+
+    页面中像 Tailwind 工具类、但既没有生成样式也没有在页面样式中定义的类名会给出警告，
+    避免修改模板后样式悄悄丢失
+
+    Args:
+        strict: 有这样的类名时返回失败
+
+    Returns:
+        是否成功
+    """
+    pages = page_paths(page_patterns or DEFAULT_PAGES)
+    if not pages:
+        print("✗ 没有找到需要处理的页面")
+        return False
+    theme = load_theme(theme_path, pages)
+    sources = [os.path.join(PROJECT_ROOT, path) for path in SOURCE_FILES
+               if os.path.exists(os.path.join(PROJECT_ROOT, path))]
+    candidates, class_names = collect_candidates(pages + sources)
+
+    builder = TailwindBuilder(theme)
+    css, used = builder.build(candidates)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    write_atomic(output_path, [css])
+    rel_output = os.path.relpath(output_path, PROJECT_ROOT)
+    print(f"✓ 已生成 {rel_output}: {len(used)} 个工具类，{len(css.encode('utf-8')) / 1024:.1f} KB")
+
+    for path in pages:
+        if link_stylesheet(path, output_path):
+            print(f"✓ {os.path.relpath(path, PROJECT_ROOT)}: 已改为引用 {rel_output}")
+
+    unknown = sorted(name for name in class_names - set(used) if not name.startswith('fa'))
+    if verbose:
+        print(f"\n页面中未生成样式的类名（由页面自身或其他样式表定义）: {' '.join(unknown)}")
+    defined = defined_classes(pages, output_path)
+    missing = [name for name in unknown if name not in defined and looks_like_tailwind(name)]
+    if missing:
+        print(f"✗ 以下类名像 Tailwind 工具类，但没有生成样式，也没有在页面样式中定义"
+              f"（检查拼写，或在 build_css.py 中补充对应规则）: {' '.join(missing)}")
+        return not strict
+    return True
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='收集页面中用到的 Tailwind 类名，生成静态样式表并替换CDN脚本')
+    parser.add_argument('--pages', nargs='+', help='需要扫描的页面glob模式（默认 index.html resume/index.html application/*.html）')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='输出的样式表（默认 .workers/static/tailwind.css）')
+    parser.add_argument('--theme', default=DEFAULT_THEME, help='主题配置文件（默认 .workers/tailwind_theme.json）')
+    parser.add_argument('--verbose', action='store_true', help='列出页面中没有生成样式的类名')
+    parser.add_argument('--strict', action='store_true',
+                        help='页面中有像 Tailwind 工具类但没有生成样式的类名时返回非零退出码')
+    args = parser.parse_args(argv)
+    return build(args.pages, os.path.join(PROJECT_ROOT, args.output), os.path.join(PROJECT_ROOT, args.theme),
+                 args.verbose, args.strict)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Font Awesome 图标子集构建脚本
+收集生成的页面和生成脚本中用到的 fa-* 图标，从 Font Awesome 4.7.0 的SVG字体中取出这些图标的轮廓，
+生成只包含这些图标的本地样式表 .workers/static/icons.css（图标以内联SVG作为遮罩绘制，颜色随文字），
+并把页面中引用 jsdelivr 上完整 font-awesome.min.css 的链接替换为该样式表。
+页面中的 <i class="fa fa-xxx"> 写法保持不变
+"""
+
+import os
+import re
+import sys
+import html
+import glob
+import argparse
+import urllib.parse
+import urllib.request
+
+from asset_manifest import PROJECT_ROOT, write_atomic
+from build_css import DEFAULT_PAGES, SOURCE_FILES, CANDIDATE_PATTERN, page_paths
+
+FONT_AWESOME_VERSION = '4.7.0'
+# 下载 Font Awesome 的地址，以及下载后缓存的目录（结构与npm包相同：css/、fonts/）
+FONT_AWESOME_URL = f'https://cdn.jsdelivr.net/npm/font-awesome@{FONT_AWESOME_VERSION}/'
+FONT_AWESOME_FILES = ['css/font-awesome.css', 'fonts/fontawesome-webfont.svg']
+DEFAULT_SOURCE = os.path.join(PROJECT_ROOT, '.workers', '.font_awesome_cache')
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, '.workers', 'static', 'icons.css')
+
+# 页面中引用 Font Awesome 样式表的链接
+STYLESHEET_PATTERN = re.compile(r'<link\s[^>]*href="[^"]*font-awesome[^"]*\.css[^"]*"[^>]*>')
+# 样式表中的规则（不含嵌套），以及图标规则中的字符编码
+RULE_PATTERN = re.compile(r'([^{}]+)\{([^{}]*)\}')
+KEYFRAMES_PATTERN = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)\s*\{(?:[^{}]*\{[^{}]*\})*\s*\}')
+CONTENT_PATTERN = re.compile(r'content:\s*"\\([0-9a-fA-F]+)"')
+ICON_SELECTOR_PATTERN = re.compile(r'^\.(fa-[\w-]+):before$')
+CLASS_PATTERN = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+# SVG字体中的字形
+GLYPH_PATTERN = re.compile(r'<glyph\b([^>]*?)/?>', re.DOTALL)
+ATTRIBUTE_PATTERN = re.compile(r'([\w-]+)="([^"]*)"')
+
+# 图标以遮罩绘制：宽度为字形的步进宽度，高度为1em，基线与原字体一致（下沉 descent/units-per-em）
+BASE_RULES = '''
+.fa {
+  display: inline-block;
+  font-size: inherit;
+  line-height: 1;
+  text-rendering: auto;
+}
+
+.fa::before {
+  content: "";
+  display: inline-block;
+  width: var(--fa-width, 1em);
+  height: 1em;
+  vertical-align: {descent}em;
+  background-color: currentColor;
+  -webkit-mask: var(--fa-icon) center / 100% 100% no-repeat;
+  mask: var(--fa-icon) center / 100% 100% no-repeat;
+}
+'''
+
+
+def download_source(source_dir):
+    """
+    下载 Font Awesome 的样式表和SVG字体到缓存目录（已存在的文件不重复下载）
+
+    Returns:
+        是否成功
+    """
+    for name in FONT_AWESOME_FILES:
+        path = os.path.join(source_dir, name)
+        if os.path.exists(path):
+            continue
+        print(f"下载 {FONT_AWESOME_URL + name} ...")
+        try:
+            with urllib.request.urlopen(FONT_AWESOME_URL + name, timeout=30) as response:
+                data = response.read()
+        except OSError as e:
+            print(f"✗ 下载失败: {e}（可以使用 --source 指定本地的 Font Awesome {FONT_AWESOME_VERSION} 目录）")
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+    return True
+
+
+def find_source_file(source_dir, pattern):
+    """在 Font Awesome 目录中查找文件，优先未压缩的版本"""
+    paths = sorted(glob.glob(os.path.join(source_dir, pattern)), key=lambda path: ('.min.' in path, path))
+    return paths[0] if paths else None
+
+
+def load_icon_codes(css):
+    """
+    从 Font Awesome 样式表中读取图标类名对应的字符编码（包括别名）
+
+    Returns:
+        {类名: 编码}
+    """
+    codes = {}
+    for selectors, body in RULE_PATTERN.findall(css):
+        match = CONTENT_PATTERN.search(body)
+        if not match:
+            continue
+        for selector in selectors.split(','):
+            icon = ICON_SELECTOR_PATTERN.match(selector.strip())
+            if icon:
+                codes[icon.group(1)] = int(match.group(1), 16)
+    return codes
+
+
+def load_glyphs(svg_font):
+    """
+    读取SVG字体中的字形
+
+    Returns:
+        ({编码: (步进宽度, 轮廓路径)}, units-per-em, ascent, descent)
+    """
+    font = re.search(r'<font\b[^>]*horiz-adv-x="([\d.]+)"', svg_font)
+    face = dict(ATTRIBUTE_PATTERN.findall(re.search(r'<font-face\b([^>]*)>', svg_font).group(1)))
+    default_advance = float(font.group(1)) if font else float(face['units-per-em'])
+    glyphs = {}
+    for attributes in GLYPH_PATTERN.findall(svg_font):
+        attributes = dict(ATTRIBUTE_PATTERN.findall(attributes))
+        unicode = html.unescape(attributes.get('unicode', ''))
+        if len(unicode) != 1 or not attributes.get('d'):
+            continue
+        advance = float(attributes.get('horiz-adv-x', default_advance))
+        glyphs[ord(unicode)] = (advance, ' '.join(attributes['d'].split()))
+    return glyphs, float(face['units-per-em']), float(face['ascent']), float(face['descent'])
+
+
+def icon_data_uri(advance, path, units_per_em, ascent):
+    """字形转换为SVG的data URI（字体坐标y轴向上，需要翻转）"""
+    svg = (f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 {advance:g} {units_per_em:g}'>"
+           f"<path transform='matrix(1 0 0 -1 0 {ascent:g})' d='{path}'/></svg>")
+    return 'data:image/svg+xml,' + urllib.parse.quote(svg, safe=" '/=:.,-")
+
+
+def em(value):
+    """格式化em值，最多6位小数"""
+    return f'{value:.6f}'.rstrip('0').rstrip('.')
+
+
+def collect_icon_classes(paths):
+    """收集文件中出现的 fa-* 和 fa 类名"""
+    names = set()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        for token in CANDIDATE_PATTERN.findall(content):
+            names.update(re.findall(r'(?<![\w-])fa(?:-[a-z0-9]+)*', token))
+    return names
+
+
+def is_used_modifier(selector, names, icon_codes):
+    """选择器是否只涉及用到的类名，且包含 fa-* 修饰类（不含图标类）"""
+    classes = CLASS_PATTERN.findall(selector)
+    return (any(name.startswith('fa-') for name in classes)
+            and all(name in names and name not in icon_codes for name in classes))
+
+
+def modifier_rules(css, names, icon_codes):
+    """
+    Font Awesome 样式表中用到的修饰类规则（fa-lg、fa-fw、fa-spin 等），原样保留
+
+    Returns:
+        规则文本列表
+    """
+    rules = []
+    keyframes = {}
+    for match in KEYFRAMES_PATTERN.finditer(css):
+        keyframes.setdefault(match.group(1), []).append(match.group(0))
+    body_css = KEYFRAMES_PATTERN.sub('', css)
+    animations = set()
+    for selectors, body in RULE_PATTERN.findall(body_css):
+        selectors = selectors.strip()
+        if selectors.startswith('@') or 'font-family' in body or CONTENT_PATTERN.search(body):
+            continue
+        kept = [selector.strip() for selector in selectors.split(',') if is_used_modifier(selector, names, icon_codes)]
+        if not kept:
+            continue
+        rules.append(f"\n{', '.join(kept)} {{\n" + ''.join(f'  {declaration.strip()};\n'
+                                                          for declaration in body.split(';') if declaration.strip())
+                     + '}\n')
+        animations.update(re.findall(r'animation:\s*([\w-]+)', body))
+    for name in sorted(animations):
+        rules.extend('\n' + text + '\n' for text in keyframes.get(name, []))
+    return rules
+
+
+def link_stylesheet(path, css_path):
+    """
+    把页面中的 Font Awesome 样式表链接替换为本地子集样式表
+
+    Returns:
+        页面是否有变化
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    href = os.path.relpath(css_path, os.path.dirname(path)).replace('\\', '/')
+    updated = STYLESHEET_PATTERN.sub(lambda _: f'<link href="{href}" rel="stylesheet"/>', content)
+    if updated == content:
+        return False
+    write_atomic(path, [updated])
+    return True
+
+
+def build(page_patterns=None, output_path=DEFAULT_OUTPUT, source_dir=DEFAULT_SOURCE, verbose=False):
+    """
+    生成图标子集样式表并替换页面中的 Font Awesome 链接
+
+    Returns:
+        是否成功
+    """
+    if source_dir == DEFAULT_SOURCE and not download_source(source_dir):
+        return False
+    css_path = find_source_file(source_dir, os.path.join('css', 'font-awesome*.css'))
+    svg_path = find_source_file(source_dir, os.path.join('fonts', 'fontawesome-webfont*.svg'))
+    if not css_path or not svg_path:
+        print(f"✗ {source_dir} 中没有找到 css/font-awesome.css 或 fonts/fontawesome-webfont.svg")
+        return False
+    with open(css_path, 'r', encoding='utf-8') as f:
+        source_css = f.read()
+    with open(svg_path, 'r', encoding='utf-8') as f:
+        glyphs, units_per_em, ascent, descent = load_glyphs(f.read())
+    icon_codes = load_icon_codes(source_css)
+
+    pages = page_paths(page_patterns or DEFAULT_PAGES)
+    sources = [os.path.join(PROJECT_ROOT, path) for path in SOURCE_FILES
+               if os.path.exists(os.path.join(PROJECT_ROOT, path))]
+    names = collect_icon_classes(pages + sources)
+    icons = sorted(name for name in names if name in icon_codes and icon_codes[name] in glyphs)
+
+    parts = [f'/* 由 .workers/build_icons.py 生成，请勿手动修改。'
+             f'图标来自 Font Awesome {FONT_AWESOME_VERSION}（字体：SIL OFL 1.1，样式：MIT License） */\n',
+             BASE_RULES.replace('{descent}', em(descent / units_per_em))]
+    for name in icons:
+        advance, path = glyphs[icon_codes[name]]
+        declarations = [('--fa-icon', f'url("{icon_data_uri(advance, path, units_per_em, ascent)}")')]
+        if advance != units_per_em:
+            declarations.append(('--fa-width', em(advance / units_per_em) + 'em'))
+        parts.append(f'\n.{name} {{\n' + ''.join(f'  {prop}: {value};\n' for prop, value in declarations) + '}\n')
+    parts.extend(modifier_rules(source_css, names, icon_codes))
+    css = ''.join(parts)
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    write_atomic(output_path, [css])
+    rel_output = os.path.relpath(output_path, PROJECT_ROOT)
+    full_size = os.path.getsize(css_path)
+    woff2_path = svg_path[:-len('.svg')] + '.woff2'
+    if os.path.exists(woff2_path):
+        full_size += os.path.getsize(woff2_path)
+    print(f"✓ 已生成 {rel_output}: {len(icons)} 个图标，{len(css.encode('utf-8')) / 1024:.1f} KB"
+          f"（完整的样式表和字体 {full_size / 1024:.0f} KB）")
+
+    for path in pages:
+        if link_stylesheet(path, output_path):
+            print(f"✓ {os.path.relpath(path, PROJECT_ROOT)}: 已改为引用 {rel_output}")
+
+    if verbose:
+        print(f"\n图标: {' '.join(icons)}")
+        unknown = sorted(name for name in names if name.startswith('fa-') and name not in icon_codes)
+        if unknown:
+            print(f"不是图标的 fa-* 类名（修饰类或其他）: {' '.join(unknown)}")
+    return True
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='生成只包含页面用到的 Font Awesome 图标的本地样式表')
+    parser.add_argument('--pages', nargs='+', help='需要扫描的页面glob模式（默认 index.html resume/index.html application/*.html）')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='输出的样式表（默认 .workers/static/icons.css）')
+    parser.add_argument('--source', default=None,
+                        help=f'本地的 Font Awesome {FONT_AWESOME_VERSION} 目录（包含 css/ 和 fonts/，默认从 jsdelivr 下载并缓存）')
+    parser.add_argument('--verbose', action='store_true', help='列出生成的图标')
+    args = parser.parse_args(argv)
+    source_dir = os.path.abspath(args.source) if args.source else DEFAULT_SOURCE
+    return build(args.pages, os.path.join(PROJECT_ROOT, args.output), source_dir, args.verbose)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
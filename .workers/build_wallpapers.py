@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+壁纸变体构建脚本
+为 .workers/background 中的每张壁纸生成多个宽度的 WebP 和 AVIF 版本，以及一张很小的模糊占位图，
+写入 .workers/wallpapers/ 和清单 manifest.json。list.py 生成页面时先显示占位图，
+再由浏览器按视口大小和设备像素比选择合适的尺寸和格式，而不是下载原图。
+
+按源文件内容哈希缓存，内容和参数都没有变化的壁纸跳过；需要处理的壁纸在进程池中并行处理。
+需要安装 Pillow（pip install Pillow）；生成 AVIF 需要 Pillow 支持 AVIF（11.3 以上，或 pip install pillow-avif-plugin）
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import base64
+import hashlib
+import argparse
+import concurrent.futures
+
+from asset_manifest import PROJECT_ROOT, WALLPAPERS_DIR, WALLPAPER_MANIFEST_PATH, load_wallpaper_manifest, write_atomic
+
+try:
+    from PIL import Image, ImageFilter, ImageOps
+except ImportError:
+    Image = None
+
+# 源壁纸目录（相对项目根目录）
+BACKGROUND_DIR = '.workers/background'
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+# 生成的宽度（不超过原图宽度；原图比最大宽度小时另外生成原图宽度）
+WIDTHS = (640, 1280, 1920, 2560, 3840)
+# 各格式的编码参数
+FORMATS = {
+    'avif': {'quality': 50, 'speed': 4},
+    'webp': {'quality': 78, 'method': 6},
+}
+# 占位图宽度和模糊半径：内联在页面中，只有几百字节
+PLACEHOLDER_WIDTH = 24
+PLACEHOLDER_BLUR = 1.5
+
+
+def settings_key(formats):
+    """生成参数的哈希，参数变化时所有壁纸重新生成"""
+    settings = json.dumps([WIDTHS, {name: FORMATS[name] for name in formats}, PLACEHOLDER_WIDTH, PLACEHOLDER_BLUR])
+    return hashlib.sha1(settings.encode('utf-8')).hexdigest()[:8]
+
+
+def source_hash(path):
+    """源文件内容哈希"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def supported_formats():
+    """当前 Pillow 能写入的格式（按优先级）"""
+    try:
+        import pillow_avif  # noqa: F401  旧版本 Pillow 通过插件支持 AVIF
+    except ImportError:
+        pass
+    extensions = Image.registered_extensions()
+    return [name for name in FORMATS if '.' + name in extensions]
+
+
+def target_widths(width):
+    """原图宽度对应的变体宽度"""
+    widths = [target for target in WIDTHS if target < width]
+    if width <= WIDTHS[-1]:
+        widths.append(width)
+    elif not widths or widths[-1] != WIDTHS[-1]:
+        widths.append(WIDTHS[-1])
+    return widths
+
+
+def render_wallpaper(source_path, digest, formats, root=PROJECT_ROOT):
+    """
+    生成一张壁纸的所有变体（在进程池中执行）
+
+    Args:
+        root: 项目根目录，变体写入其中的 WALLPAPERS_DIR
+
+    Returns:
+        (清单条目, 耗时秒数)
+    """
+    start = time.perf_counter()
+    name = os.path.basename(source_path)
+    stem = os.path.splitext(name)[0]
+    with Image.open(source_path) as image:
+        image = ImageOps.exif_transpose(image).convert('RGB')
+    width, height = image.size
+
+    entry = {'hash': digest, 'width': width, 'height': height, 'variants': {}}
+    for image_format in formats:
+        variants = []
+        for target in target_widths(width):
+            resized = image if target == width else image.resize(
+                (target, max(1, round(height * target / width))), Image.LANCZOS)
+            path = f'{WALLPAPERS_DIR}/{stem}.{digest[:8]}.{target}.{image_format}'
+            resized.save(os.path.join(root, path), image_format.upper(), **FORMATS[image_format])
+            variants.append([target, path])
+        entry['variants'][image_format] = variants
+
+    placeholder = image.resize((PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width))),
+                               Image.BILINEAR).filter(ImageFilter.GaussianBlur(PLACEHOLDER_BLUR))
+    buffer = io.BytesIO()
+    placeholder.save(buffer, 'WEBP', quality=40)
+    entry['placeholder'] = 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+    return entry, time.perf_counter() - start
+
+
+def build(workers=None, force=False, root=PROJECT_ROOT):
+    """
+    生成所有壁纸的变体和清单
+
+    处理失败的壁纸保留上一次的清单条目和变体文件；只删除不再被清单引用的旧变体
+    （源文件已删除，或源文件内容变化后已成功重新生成）
+
+    Args:
+        root: 项目根目录，默认为当前项目
+
+    Returns:
+        是否成功
+    """
+    if Image is None:
+        print("✗ 未安装Pillow，无法生成壁纸变体（pip install Pillow）")
+        return False
+    formats = supported_formats()
+    if 'avif' not in formats:
+        print("✗ 当前 Pillow 不支持 AVIF，只生成 WebP（pip install pillow-avif-plugin）")
+    settings = settings_key(formats)
+
+    background_dir = os.path.join(root, BACKGROUND_DIR)
+    manifest_path = os.path.join(root, os.path.relpath(WALLPAPER_MANIFEST_PATH, PROJECT_ROOT))
+    sources = sorted(name for name in os.listdir(background_dir)
+                     if name.lower().endswith(IMAGE_EXTENSIONS) and not name.startswith('.'))
+    # 使用 --force 时也读取上一次的清单，处理失败的壁纸继续使用其中的变体
+    previous = load_wallpaper_manifest(manifest_path)
+    manifest = {}
+    jobs = []
+    for name in sources:
+        path = os.path.join(background_dir, name)
+        digest = source_hash(path)
+        entry = previous.get(name)
+        if (not force and entry and entry.get('hash') == digest and entry.get('settings') == settings
+                and all(os.path.exists(os.path.join(root, variant[1]))
+                        for variants in entry['variants'].values() for variant in variants)):
+            manifest[name] = entry
+        else:
+            jobs.append((name, path, digest))
+    print(f"=== 壁纸 {len(sources)} 张，需要处理 {len(jobs)} 张，跳过 {len(sources) - len(jobs)} 张未变化的壁纸 ===")
+
+    os.makedirs(os.path.join(root, WALLPAPERS_DIR), exist_ok=True)
+    start = time.perf_counter()
+    failed = []
+    if jobs:
+        # 图片缩放和编码是CPU密集型操作，使用进程池；大图先提交
+        jobs.sort(key=lambda job: os.path.getsize(job[1]), reverse=True)
+        workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(render_wallpaper, path, digest, formats, root): name
+                       for name, path, digest in jobs}
+            for future in concurrent.futures.as_completed(futures):
+                name = futures[future]
+                try:
+                    entry, elapsed = future.result()
+                except Exception as e:
+                    failed.append(name)
+                    if name in previous:
+                        manifest[name] = previous[name]
+                        print(f"✗ {name}: {e}（保留上一次生成的变体）")
+                    else:
+                        print(f"✗ {name}: {e}")
+                    continue
+                entry['settings'] = settings
+                manifest[name] = entry
+                sizes = [os.path.getsize(os.path.join(root, variant[1]))
+                         for variants in entry['variants'].values() for variant in variants]
+                print(f"✓ {name} ({entry['width']}x{entry['height']}): {len(sizes)} 个变体，"
+                      f"{sum(sizes) / 1024:.0f} KB，{elapsed:.2f} s")
+        print(f"共耗时 {time.perf_counter() - start:.2f} s（{workers} 个进程）")
+
+    # 删除不再被清单引用的旧变体（失败的壁纸已保留上一次的条目，其变体不会被删除）
+    current = {variant[1] for entry in manifest.values() for variants in entry['variants'].values()
+               for variant in variants}
+    for name in os.listdir(os.path.join(root, WALLPAPERS_DIR)):
+        path = os.path.join(root, WALLPAPERS_DIR, name)
+        if f'{WALLPAPERS_DIR}/{name}' not in current and path != manifest_path:
+            os.remove(path)
+
+    manifest = {name: manifest[name] for name in sources if name in manifest}
+    write_atomic(manifest_path, [json.dumps(manifest, ensure_ascii=False, indent=2) + '\n'])
+    original = sum(os.path.getsize(os.path.join(background_dir, name)) for name in manifest)
+    print(f"✓ 已写入 {os.path.relpath(manifest_path, root)}，"
+          f"原图共 {original / 1024 / 1024:.1f} MB；重新运行 list.py 以使用壁纸变体")
+    return not failed and len(manifest) == len(sources)
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='为背景壁纸生成多种宽度的 WebP/AVIF 版本和模糊占位图')
+    parser.add_argument('--workers', type=int, help='并行处理的进程数（默认CPU核数）')
+    parser.add_argument('--force', action='store_true', help='忽略缓存，重新生成所有壁纸')
+    args = parser.parse_args(argv)
+    return build(args.workers, args.force)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -1,8 +1,22 @@
 import os
+import io
+import sys
 import datetime
 import markdown
 import json
+import time
 import random
+import hashlib
+import argparse
+import contextlib
+import concurrent.futures
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from asset_manifest import asset_url, load_manifest, load_wallpaper_manifest, write_atomic
+
+# 增量生成清单：所有文件的（路径、大小、修改时间、inode）和每个目录子树的摘要
+LIST_MANIFEST = '.list_manifest.json'
 
 def load_config():
     """加载配置文件"""
@@ -13,7 +27,10 @@ def load_config():
         "hidden_patterns": [
             ".*",  # 隐藏以点开头的文件和目录
             "list.html",  # 隐藏根目录生成的索引文件
-            "index.html"  # 隐藏子目录生成的索引文件
+            "index.html",  # 隐藏子目录生成的索引文件
+            "*.gz",  # 隐藏 build_compress.py 生成的预压缩文件
+            "*.br",
+            "_headers"  # 隐藏 build_assets.py 生成的缓存规则
         ],
         "default_expanded": [
             ""  # 根目录默认展开
@@ -58,6 +75,173 @@ def is_hidden(filepath, hidden_patterns):
     
     return False
 
+@dataclass
+class FileEntry:
+    """扫描得到的文件，大小、修改时间和inode读取失败时为None"""
+    name: str
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+    inode: Optional[int] = None
+
+@dataclass
+class DirectoryEntry:
+    """
+    扫描得到的目录，entries 为按名称排序的未隐藏的文件和子目录
+
+    newest_mtime 为子树中最新的文件修改时间（作为页面的生成时间），
+    digest 为子树中所有文件名、大小、修改时间和inode的摘要（子树没有变化时不重新生成页面）
+    """
+    name: str
+    path: str
+    entries: List[object] = field(default_factory=list)
+    newest_mtime: Optional[float] = field(default=None, compare=False)
+    digest: str = field(default='', compare=False)
+
+    def subdirectories(self):
+        """未隐藏的子目录"""
+        return [entry for entry in self.entries if isinstance(entry, DirectoryEntry)]
+
+def hidden_matcher(hidden_patterns):
+    """
+    把隐藏模式编译为按文件名判断的函数，规则与 is_hidden 相同，扫描时不必对每个文件重复遍历模式列表
+
+    Returns:
+        判断文件名是否隐藏的函数
+    """
+    names = set(hidden_patterns)
+    prefixes = []
+    suffixes = []
+    for pattern in hidden_patterns:
+        if pattern == ".*":
+            prefixes.append('.')
+        elif pattern.startswith('*'):
+            suffixes.append(pattern[1:])
+        elif pattern.endswith('*'):
+            prefixes.append(pattern[:-1])
+    prefixes = tuple(prefixes)
+    suffixes = tuple(suffixes)
+    
+    def matches(filename):
+        return filename in names or filename.startswith(prefixes) or filename.endswith(suffixes)
+    
+    return matches
+
+def scan_directory(path, hidden_patterns, scandir=os.scandir):
+    """
+    扫描目录树，所有索引页面共用扫描结果
+
+    使用 os.scandir：目录项的类型来自目录读取结果，不需要额外的系统调用，
+    每个文件只调用一次 stat() 得到大小和修改时间
+
+    Args:
+        path: 目录路径
+        hidden_patterns: 隐藏模式列表
+        scandir: 读取目录的函数（性能测试时替换为统计系统调用次数的版本）
+
+    Returns:
+        目录树（DirectoryEntry）
+    """
+    is_hidden_name = hidden_matcher(hidden_patterns)
+    
+    def scan(current_path, name):
+        node = DirectoryEntry(name, current_path)
+        try:
+            with scandir(current_path) as iterator:
+                items = [item for item in iterator if not is_hidden_name(item.name)]
+        except PermissionError:
+            return node
+        
+        # 按名称排序
+        items.sort(key=lambda item: item.name)
+        
+        for item in items:
+            try:
+                is_dir = item.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                node.entries.append(scan(item.path, item.name))
+                continue
+            entry = FileEntry(item.name)
+            try:
+                stat_result = item.stat()
+                entry.size = stat_result.st_size
+                entry.mtime = stat_result.st_mtime
+                entry.inode = stat_result.st_ino
+            except OSError:
+                pass
+            node.entries.append(entry)
+        summarize_directory(node)
+        return node
+    
+    return scan(path, os.path.basename(path))
+
+def summarize_directory(node):
+    """根据子项计算目录的 newest_mtime 和 digest（子目录需已计算）"""
+    digest = hashlib.sha1()
+    for entry in node.entries:
+        if isinstance(entry, DirectoryEntry):
+            newest = entry.newest_mtime
+            line = f'd {entry.name} {entry.digest}\n'
+        else:
+            newest = entry.mtime
+            line = f'f {entry.name} {entry.size} {entry.mtime!r} {entry.inode}\n'
+        digest.update(line.encode('utf-8', 'surrogateescape'))
+        if newest is not None and (node.newest_mtime is None or newest > node.newest_mtime):
+            node.newest_mtime = newest
+    node.digest = digest.hexdigest()
+
+def iter_directories(node):
+    """目录树中的所有目录（先根目录，再按名称顺序深度优先）"""
+    yield node
+    for subdirectory in node.subdirectories():
+        yield from iter_directories(subdirectory)
+
+def collect_file_records(node, prefix=''):
+    """
+    目录树中所有文件的记录
+
+    Returns:
+        {相对路径: [大小, 修改时间, inode]}
+    """
+    records = {}
+    for entry in node.entries:
+        path = prefix + entry.name
+        if isinstance(entry, DirectoryEntry):
+            records.update(collect_file_records(entry, path + '/'))
+        else:
+            records[path] = [entry.size, entry.mtime, entry.inode]
+    return records
+
+def format_generated_time(node):
+    """页面的生成时间：子树中最新的文件修改时间，内容不变时页面也不变"""
+    if node.newest_mtime is None:
+        return "-"
+    return datetime.datetime.fromtimestamp(node.newest_mtime).strftime("%Y-%m-%d %H:%M:%S")
+
+def index_file_path(target_dir, root_dir):
+    """目录的索引文件：根目录为 list.html，子目录为 index.html"""
+    if os.path.normpath(target_dir) == os.path.normpath(root_dir):
+        return os.path.join(target_dir, 'list.html')
+    return os.path.join(target_dir, 'index.html')
+
+def render_key(config, all_wallpapers):
+    """影响所有页面的输入（本脚本、配置、壁纸和资源清单）的摘要，变化时重新生成所有页面"""
+    digest = hashlib.sha1()
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest.update(f.read())
+    inputs = [config, all_wallpapers, load_manifest(), load_wallpaper_manifest()]
+    digest.update(json.dumps(inputs, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+def load_list_manifest(manifest_path):
+    """读取增量生成清单，不存在或无法解析时返回空字典"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
 def read_readme(directory):
     """读取目录下的readme文件内容"""
     # 优先检查HTML文件，然后是MD文件，最后是TXT文件
@@ -162,95 +346,192 @@ def get_random_wallpaper():
     # 随机选择一张图片
     return random.choice(image_files)
 
-def generate_index_for_directory(target_dir, root_dir):
-    """为指定目录生成索引HTML文件"""
+def get_wallpaper_variants(wallpapers, target_dir, root_dir):
+    """
+    按 build_wallpapers.py 生成的清单构建壁纸变体列表
+
+    Returns:
+        壁纸变体的JSON数组（每项包含原图地址、尺寸、占位图和各格式的srcset），没有清单时返回None
+    """
+    manifest = load_wallpaper_manifest()
+    if not manifest:
+        return None
+    
+    variants = []
+    for wallpaper in wallpapers:
+        item = {'src': asset_url('.workers/background/' + wallpaper, target_dir, root_dir)}
+        entry = manifest.get(wallpaper)
+        if entry:
+            item['width'] = entry['width']
+            item['height'] = entry['height']
+            item['placeholder'] = entry['placeholder']
+            for image_format, files in entry['variants'].items():
+                item[image_format] = ', '.join(asset_url(path, target_dir, root_dir) + f' {width}w'
+                                               for width, path in files)
+        variants.append(item)
+    return json.dumps(variants, ensure_ascii=False, separators=(',', ':'))
+
+def get_all_wallpapers():
+    """获取背景目录中的所有图片文件名"""
+    # 检查.workers/background目录
+    background_dir = os.path.join(os.getcwd(), '.workers', 'background')
+    if not os.path.exists(background_dir):
+        # 如果不存在，检查当前目录下的background目录
+        background_dir = os.path.join(os.getcwd(), 'background')
+        if not os.path.exists(background_dir):
+            print(f"背景目录不存在: {background_dir}")
+            return []
+    
+    # 获取目录中的所有图片文件
+    image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
+    image_files = []
+    
+    try:
+        for file in sorted(os.listdir(background_dir)):
+            if any(file.lower().endswith(ext) for ext in image_extensions):
+                image_files.append(file)
+        print(f"找到 {len(image_files)} 张背景图片")
+    except Exception as e:
+        print(f"读取背景目录时出错: {e}")
+        return []
+    
+    return image_files
+
+def generate_index_for_directory(target_dir, root_dir, node=None, config=None, all_wallpapers=None):
+    """
+    为指定目录生成索引HTML文件
+
+    页面按片段流式写入同目录下的临时文件，完成后原子替换目标文件，内存占用与目录树大小无关
+
+    Args:
+        target_dir: 目录路径
+        root_dir: 根目录路径
+        node: 该目录的扫描结果，为None时扫描该目录
+        config: 配置，为None时读取配置文件
+        all_wallpapers: 壁纸文件名列表，为None时读取背景目录
+
+    Returns:
+        是否写入了索引文件（生成的内容与原文件相同时不写入）
+    """
     # 加载配置
-    config = load_config()
-    hidden_patterns = config.get('hidden_patterns', ['.*', 'index.html', 'list.html'])
-    default_expanded = config.get('default_expanded', [""])
-    default_collapsed = config.get('default_collapsed', [])
-    enable_online_wallpaper = config.get('enable_online_wallpaper', False)
+    if config is None:
+        config = load_config()
+    if node is None:
+        node = scan_directory(target_dir, config.get('hidden_patterns', ['.*', 'index.html', 'list.html']))
+    # 获取所有壁纸文件名
+    if all_wallpapers is None:
+        all_wallpapers = get_all_wallpapers()
     
     # 定义输出文件路径
-    if os.path.normpath(target_dir) == os.path.normpath(root_dir):
-        output_file = os.path.join(target_dir, 'list.html')
+    output_file = index_file_path(target_dir, root_dir)
+    if os.path.basename(output_file) == 'list.html':
         print(f"在根目录生成list.html: {output_file}")
     else:
-        output_file = os.path.join(target_dir, 'index.html')
         print(f"在子目录生成index.html: {output_file}")
     
-    # 读取readme文件内容
-    readme_content = read_readme(target_dir)
-    
-    # 计算相对路径到root_dir
-    rel_path_to_root = os.path.relpath(root_dir, target_dir).replace('\\', '/')
-    if rel_path_to_root == '.':
-        rel_path_to_root = ''
-    else:
-        rel_path_to_root += '/'
+    # 内容没有变化时不替换原文件，避免修改时间变化引起 rsync、git 等的无效同步
+    chunks = render_index(target_dir, root_dir, node, config, all_wallpapers)
+    if write_atomic(output_file, chunks, skip_unchanged=True) is None:
+        print(f"索引文件未变化: {output_file}")
+        return False
     
-    # 获取背景目录中的所有图片文件名
-    def get_all_wallpapers():
-        """获取背景目录中的所有图片文件名"""
-        # 检查.workers/background目录
-        background_dir = os.path.join(os.getcwd(), '.workers', 'background')
-        if not os.path.exists(background_dir):
-            # 如果不存在，检查当前目录下的background目录
-            background_dir = os.path.join(os.getcwd(), 'background')
-            if not os.path.exists(background_dir):
-                print(f"背景目录不存在: {background_dir}")
-                return []
-        
-        # 获取目录中的所有图片文件
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-        image_files = []
-        
-        try:
-            for file in os.listdir(background_dir):
-                if any(file.lower().endswith(ext) for ext in image_extensions):
-                    image_files.append(file)
-            print(f"找到 {len(image_files)} 张背景图片")
-        except Exception as e:
-            print(f"读取背景目录时出错: {e}")
-            return []
-        
-        return image_files
+    print(f"索引文件已生成: {output_file}")
+    return True
+
+def render_index(target_dir, root_dir, node, config, all_wallpapers):
+    """
+    按顺序生成目录索引页面的HTML片段（每个文件或目录一个片段）
+
+    Args:
+        target_dir: 目录路径
+        root_dir: 根目录路径
+        node: 该目录的扫描结果
+        config: 配置
+        all_wallpapers: 壁纸文件名列表
+
+    Yields:
+        HTML片段
+    """
+    default_expanded = config.get('default_expanded', [""])
+    default_collapsed = config.get('default_collapsed', [])
+    enable_online_wallpaper = config.get('enable_online_wallpaper', False)
     
-    # 获取所有壁纸文件名
-    all_wallpapers = get_all_wallpapers()
+    # 读取readme文件内容
+    readme_content = read_readme(target_dir)
     
-    # 开始构建HTML内容
-    html_content = '''<!DOCTYPE html>
+    # 开始生成HTML内容
+    yield '''<!DOCTYPE html>
 <html lang="zh-CN">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>我的简历</title>
-    <link rel="stylesheet" href="''' + rel_path_to_root + '''.workers/static/style.css">
-    <script src="''' + rel_path_to_root + '''.workers/static/script.js"></script>
+    <link rel="stylesheet" href="''' + asset_url('.workers/static/style.css', target_dir, root_dir) + '''">
+    <script src="''' + asset_url('.workers/static/script.js', target_dir, root_dir) + '''"></script>
     <style>
     </style>
 '''
     
     # 添加内联JavaScript，实现随机背景图片
     if all_wallpapers:
-        # 构建壁纸文件名数组的JavaScript代码
-        wallpapers_array = '[' + ','.join(['"' + w + '"' for w in all_wallpapers]) + ']'
-        wallpaper_base_path = rel_path_to_root + '.workers/background/'
+        # 构建壁纸地址数组的JavaScript代码（运行过 build_assets.py 时为带内容哈希的文件名）
+        wallpapers_array = '[' + ','.join(['"' + asset_url('.workers/background/' + w, target_dir, root_dir) + '"'
+                                           for w in all_wallpapers]) + ']'
+        
+        # 运行过 build_wallpapers.py 时使用按视口选择的壁纸变体
+        wallpaper_variants = None if enable_online_wallpaper else get_wallpaper_variants(all_wallpapers, target_dir, root_dir)
         
-        if not enable_online_wallpaper:
-            html_content += '''    <script>
+        if wallpaper_variants:
+            yield '''    <script>
+        // 随机背景图片设置：先显示模糊占位图，再按视口大小和设备像素比加载合适的尺寸和格式
+        document.addEventListener('DOMContentLoaded', function() {
+            // 所有背景图片及其变体
+            var wallpapers = ''' + wallpaper_variants + ''';
+            // 随机选择一张图片
+            var wallpaper = wallpapers[Math.floor(Math.random() * wallpapers.length)];
+            var style = document.body.style;
+            // 确保背景图片正确显示
+            style.backgroundSize = "cover";
+            style.backgroundPosition = "center";
+            style.backgroundRepeat = "no-repeat";
+            style.backgroundAttachment = "fixed";
+            if (wallpaper.placeholder) {
+                style.backgroundImage = "url('" + wallpaper.placeholder + "')";
+            }
+            // 铺满视口（cover）需要的CSS像素宽度，浏览器再乘以设备像素比并选择支持的格式
+            var width = window.innerWidth;
+            if (wallpaper.width && wallpaper.height) {
+                width = Math.max(width, window.innerHeight * wallpaper.width / wallpaper.height);
+            }
+            var sizes = Math.ceil(width) + "px";
+            var picture = document.createElement("picture");
+            ["avif", "webp"].forEach(function(type) {
+                if (wallpaper[type]) {
+                    var source = document.createElement("source");
+                    source.type = "image/" + type;
+                    source.srcset = wallpaper[type];
+                    source.sizes = sizes;
+                    picture.appendChild(source);
+                }
+            });
+            var image = document.createElement("img");
+            image.onload = function() {
+                style.backgroundImage = "url('" + (image.currentSrc || image.src) + "')";
+            };
+            picture.appendChild(image);
+            image.src = wallpaper.src;
+        });
+    </script>
+'''
+        elif not enable_online_wallpaper:
+            yield '''    <script>
         // 随机背景图片设置
         document.addEventListener('DOMContentLoaded', function() {
-            // 所有背景图片文件名
+            // 所有背景图片地址
             var wallpapers = ''' + wallpapers_array + ''';
-            // 背景图片基础路径
-            var basePath = "''' + wallpaper_base_path + '''";
             // 随机选择一张图片
             var randomIndex = Math.floor(Math.random() * wallpapers.length);
-            var randomWallpaper = wallpapers[randomIndex];
-            // 完整背景图片路径
-            var wallpaperPath = basePath + randomWallpaper;
+            var wallpaperPath = wallpapers[randomIndex];
             // 设置背景图片
             document.body.style.backgroundImage = "url('" + wallpaperPath + "')";
             // 确保背景图片正确显示
@@ -262,18 +543,14 @@ def generate_index_for_directory(target_dir, root_dir):
     </script>
 '''
         else:
-            html_content += '''    <script>
+            yield '''    <script>
         // 随机背景图片设置
         document.addEventListener('DOMContentLoaded', function() {
-            // 所有背景图片文件名
+            // 所有背景图片地址
             var wallpapers = ''' + wallpapers_array + ''';
-            // 背景图片基础路径
-            var basePath = "''' + wallpaper_base_path + '''";
             // 随机选择一张图片
             var randomIndex = Math.floor(Math.random() * wallpapers.length);
-            var randomWallpaper = wallpapers[randomIndex];
-            // 完整背景图片路径
-            var localWallpaper = basePath + randomWallpaper;
+            var localWallpaper = wallpapers[randomIndex];
             var onlineWallpaper = "https://trae-api-cn.mchost.guru/api/ide/v1/text_to_image?prompt=modern%20abstract%20tech%20background%20with%20blue%20and%20purple%20gradients&image_size=landscape_16_9";
             // 设置背景图片
             document.body.style.backgroundImage = "url('" + onlineWallpaper + "'), url('" + localWallpaper + "')";
@@ -286,13 +563,13 @@ def generate_index_for_directory(target_dir, root_dir):
     </script>
 '''
     
-    html_content += '''</head>
+    yield '''</head>
 <body>
     <div class="container">
         <header>
             <h3>📁我的简历</h3>
             <div class="header-info">
-                <p>生成时间: ''' + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + '''</p>
+                <p>生成时间: ''' + format_generated_time(node) + '''</p>
                 <p> 我的简历——索引目录</p>
             </div>
         </header>
@@ -321,7 +598,7 @@ def generate_index_for_directory(target_dir, root_dir):
     # 检查是否需要添加上级目录链接
     if target_dir != root_dir:
         # 添加上级目录链接，指向list.html
-        html_content += '''                <div class="file-item">
+        yield '''                <div class="file-item">
                     <div class="file-name">
                         <span class="directory-icon">📁</span>
                         <a href="../list.html">.. /</a>
@@ -331,34 +608,22 @@ def generate_index_for_directory(target_dir, root_dir):
                 </div>
 '''
     
+    # 目录显示路径的前缀（从根目录开始），子项只需拼接相对路径
+    target_from_root = os.path.relpath(target_dir, root_dir).replace('\\', '/')
+    display_prefix = '/' if target_from_root == '.' else '/' + target_from_root + '/'
+    
     # 遍历目录结构
-    def traverse_directory(current_path, level=0, current_rel_path=""):
-        """递归遍历目录并生成HTML"""
-        nonlocal html_content
-        # 获取当前目录下的所有文件和子目录
-        try:
-            items = os.listdir(current_path)
-        except PermissionError:
-            return
-        
-        # 按名称排序
-        items.sort()
-        
-        for item in items:
-            item_path = os.path.join(current_path, item)
-            
-            # 跳过隐藏文件和目录
-            if is_hidden(item_path, hidden_patterns):
-                continue
-            
+    def traverse_directory(current_node, level=0, current_rel_path=""):
+        """递归遍历扫描结果，逐项生成HTML片段"""
+        for entry in current_node.entries:
             # 计算相对路径（相对于target_dir）
-            relative_path = os.path.relpath(item_path, target_dir).replace('\\', '/')
+            relative_path = current_rel_path + '/' + entry.name if current_rel_path else entry.name
+            indent = '                ' * (level + 1)
             
-            if os.path.isdir(item_path):
+            if isinstance(entry, DirectoryEntry):
                 # 处理目录
-                # 计算从根目录开始的路径
-                path_from_root = os.path.relpath(item_path, root_dir).replace('\\', '/')
-                display_path = '/' + path_from_root
+                # 从根目录开始的路径
+                display_path = display_prefix + relative_path
                 # 检查是否应该默认折叠
                 is_collapsed = False
                 if relative_path in default_collapsed:
@@ -368,50 +633,45 @@ def generate_index_for_directory(target_dir, root_dir):
                     is_collapsed = True
                 
                 # 创建目录项容器
-                indent = '                ' * (level + 1)
-                html_content += indent + '<details' + (' open' if not is_collapsed else '') + ' class="directory-details">\n'
-                html_content += indent + '    <summary class="directory-summary">\n'
-                html_content += indent + '        <div class="file-item">\n'
-                html_content += indent + '            <div class="file-name">\n'
-                html_content += indent + '                <span class="directory-icon">' + ('📂' if not is_collapsed else '📁') + '</span>\n'
-                html_content += indent + '                <a href="' + relative_path + '/">' + display_path + '</a>\n'
-                html_content += indent + '            </div>\n'
-                html_content += indent + '            <div class="file-size">-</div>\n'
-                html_content += indent + '            <div class="file-date">-</div>\n'
-                html_content += indent + '        </div>\n'
-                html_content += indent + '    </summary>\n'
-                html_content += indent + '    <div class="subdirectory">\n'
+                yield (indent + '<details' + (' open' if not is_collapsed else '') + ' class="directory-details">\n' +
+                       indent + '    <summary class="directory-summary">\n' +
+                       indent + '        <div class="file-item">\n' +
+                       indent + '            <div class="file-name">\n' +
+                       indent + '                <span class="directory-icon">' + ('📂' if not is_collapsed else '📁') + '</span>\n' +
+                       indent + '                <a href="' + relative_path + '/">' + display_path + '</a>\n' +
+                       indent + '            </div>\n' +
+                       indent + '            <div class="file-size">-</div>\n' +
+                       indent + '            <div class="file-date">-</div>\n' +
+                       indent + '        </div>\n' +
+                       indent + '    </summary>\n' +
+                       indent + '    <div class="subdirectory">\n')
                 
                 # 递归处理子目录
-                traverse_directory(item_path, level + 1, relative_path)
+                yield from traverse_directory(entry, level + 1, relative_path)
                 
                 # 关闭子目录容器
-                html_content += indent + '    </div>\n'
-                html_content += indent + '</details>\n'
+                yield indent + '    </div>\n' + indent + '</details>\n'
             else:
                 # 处理文件
-                # 获取文件大小
-                try:
-                    file_size = os.path.getsize(item_path)
-                    # 格式化文件大小
-                    if file_size < 1024:
-                        size_str = str(file_size) + " B"
-                    elif file_size < 1024 * 1024:
-                        size_str = "{:.2f}".format(file_size / 1024) + " KB"
-                    else:
-                        size_str = "{:.2f}".format(file_size / (1024 * 1024)) + " MB"
-                except:
+                # 格式化文件大小
+                file_size = entry.size
+                if file_size is None:
                     size_str = "N/A"
+                elif file_size < 1024:
+                    size_str = str(file_size) + " B"
+                elif file_size < 1024 * 1024:
+                    size_str = "{:.2f}".format(file_size / 1024) + " KB"
+                else:
+                    size_str = "{:.2f}".format(file_size / (1024 * 1024)) + " MB"
                 
-                # 获取文件修改时间
+                # 格式化文件修改时间
                 try:
-                    mod_time = os.path.getmtime(item_path)
-                    mod_str = datetime.datetime.fromtimestamp(mod_time).strftime("%Y-%m-%d %H:%M")
-                except:
+                    mod_str = datetime.datetime.fromtimestamp(entry.mtime).strftime("%Y-%m-%d %H:%M")
+                except (TypeError, ValueError, OverflowError, OSError):
                     mod_str = "N/A"
                 
                 # 根据文件类型选择图标
-                file_ext = os.path.splitext(item)[1].lower()
+                file_ext = os.path.splitext(entry.name)[1].lower()
                 if file_ext in ['.pdf']:
                     icon = '📄'
                 elif file_ext in ['.doc', '.docx']:
@@ -425,21 +685,20 @@ def generate_index_for_directory(target_dir, root_dir):
                 else:
                     icon = '📄'
                 
-                indent = '                ' * (level + 1)
-                html_content += indent + '<div class="file-item">\n'
-                html_content += indent + '    <div class="file-name">\n'
-                html_content += indent + '        <span class="file-icon">' + icon + '</span>\n'
-                html_content += indent + '        <a href="' + relative_path + '">' + item + '</a>\n'
-                html_content += indent + '    </div>\n'
-                html_content += indent + '    <div class="file-size">' + size_str + '</div>\n'
-                html_content += indent + '    <div class="file-date">' + mod_str + '</div>\n'
-                html_content += indent + '</div>\n'
+                yield (indent + '<div class="file-item">\n' +
+                       indent + '    <div class="file-name">\n' +
+                       indent + '        <span class="file-icon">' + icon + '</span>\n' +
+                       indent + '        <a href="' + relative_path + '">' + entry.name + '</a>\n' +
+                       indent + '    </div>\n' +
+                       indent + '    <div class="file-size">' + size_str + '</div>\n' +
+                       indent + '    <div class="file-date">' + mod_str + '</div>\n' +
+                       indent + '</div>\n')
     
     # 开始遍历
-    traverse_directory(target_dir)
+    yield from traverse_directory(node)
     
     # 结束HTML内容，移除JavaScript引用
-    html_content += '''                    </div>
+    yield '''                    </div>
                 </details>
             </div>
         </div>
@@ -450,55 +709,157 @@ def generate_index_for_directory(target_dir, root_dir):
                '</div>' if readme_content else '') + '''
         
         <div class="footer">
-            <p>索引由自动生成工具创建 | 生成时间: ''' + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + '''</p>
+            <p>索引由自动生成工具创建 | 生成时间: ''' + format_generated_time(node) + '''</p>
         </div>
     </div>
 </body>
 </html>
 '''
-    
-    # 写入HTML文件
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print(f"索引文件已生成: {output_file}")
 
-def generate_index():
-    """生成所有目录的索引HTML文件"""
+# 并行生成时进程内缓存的根目录、配置和壁纸列表
+INDEX_WORKER_STATE = {}
+
+def init_index_worker(root_dir, config, all_wallpapers):
+    """并行生成进程初始化：根目录、配置和壁纸列表每个进程只传递一次"""
+    INDEX_WORKER_STATE['root_dir'] = root_dir
+    INDEX_WORKER_STATE['config'] = config
+    INDEX_WORKER_STATE['all_wallpapers'] = all_wallpapers
+
+def render_index_job(node):
+    """
+    在进程池中生成单个目录的索引页面
+
+    Returns:
+        (是否写入, 耗时秒数, 日志)
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        written = generate_index_for_directory(node.path, INDEX_WORKER_STATE['root_dir'], node,
+                                               INDEX_WORKER_STATE['config'], INDEX_WORKER_STATE['all_wallpapers'])
+    return written, time.perf_counter() - start, log.getvalue()
+
+def render_parallel(jobs, root_dir, config, all_wallpapers, workers=None):
+    """
+    使用进程池生成多个目录的索引页面，按目录顺序输出进度和每个页面的耗时
+
+    Args:
+        jobs: [(目录相对路径, 扫描结果), ...]
+        workers: 进程数，为None时使用CPU核数
+
+    Returns:
+        (写入的页面数, 生成失败的目录相对路径列表)
+    """
+    written = 0
+    failed = []
+    busy = 0.0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                initializer=init_index_worker,
+                                                initargs=(root_dir, config, all_wallpapers)) as executor:
+        # 按目录顺序提交（根目录的页面最大，最先开始），并按同样的顺序输出结果
+        futures = [executor.submit(render_index_job, node) for _, node in jobs]
+        for index, ((relative_dir, _), future) in enumerate(zip(jobs, futures), 1):
+            name = '/' + relative_dir
+            try:
+                page_written, elapsed, _ = future.result()
+            except Exception as e:
+                failed.append(relative_dir)
+                print(f"[{index}/{len(jobs)}] ✗ {name}: {e}")
+                continue
+            busy += elapsed
+            written += page_written
+            print(f"[{index}/{len(jobs)}] ✓ {name} {'已写入' if page_written else '未变化'} ({elapsed * 1000:.1f} ms)")
+    print(f"各页面生成耗时合计 {busy:.2f} s（{workers or os.cpu_count()} 个进程）")
+    return written, failed
+
+def generate_index(force=False, parallel=False, workers=None):
+    """
+    生成所有目录的索引HTML文件
+
+    根据上次保存的清单增量生成：只重新生成子树发生变化的目录，生成的内容与原文件相同时不写入
+
+    Args:
+        force: 忽略清单，重新生成所有目录
+        parallel: 在进程池中并行生成各目录的页面
+        workers: 并行生成的进程数，为None时使用CPU核数
+
+    Returns:
+        是否成功
+    """
+    start = time.perf_counter()
     # 加载配置
     config = load_config()
     hidden_patterns = config.get('hidden_patterns', ['.*', 'index.html'])
     
     # 获取当前目录路径作为根目录
     root_dir = os.path.abspath(os.getcwd())
+    manifest_path = os.path.join(root_dir, '.workers', LIST_MANIFEST)
+    
+    # 只扫描一次文件系统，所有索引页面共用扫描结果和壁纸列表
+    tree = scan_directory(root_dir, hidden_patterns)
+    all_wallpapers = get_all_wallpapers()
+    
+    # 配置、壁纸、资源清单或本脚本变化时，所有目录都需要重新生成
+    key = render_key(config, all_wallpapers)
+    previous = {} if force else load_list_manifest(manifest_path)
+    previous_directories = previous.get('directories', {}) if previous.get('render_key') == key else {}
+    
+    # 找出根目录和所有子目录中需要重新生成的目录
+    directories = {}
+    jobs = []
+    for node in iter_directories(tree):
+        relative_dir = os.path.relpath(node.path, root_dir).replace('\\', '/')
+        relative_dir = '' if relative_dir == '.' else relative_dir
+        directories[relative_dir] = node.digest
+        if (previous_directories.get(relative_dir) != node.digest
+                or not os.path.exists(index_file_path(node.path, root_dir))):
+            jobs.append((relative_dir, node))
     
-    # 为根目录生成索引
-    generate_index_for_directory(root_dir, root_dir)
+    # 各目录的页面互不依赖，可以在进程池中并行生成；只有一个页面时不启动进程池
+    failed = []
+    if parallel and len(jobs) > 1:
+        written, failed = render_parallel(jobs, root_dir, config, all_wallpapers, workers)
+    else:
+        written = 0
+        for _, node in jobs:
+            if generate_index_for_directory(node.path, root_dir, node, config, all_wallpapers):
+                written += 1
+    rendered = len(jobs)
     
-    # 递归为所有子目录生成索引
-    def traverse_directories(current_path):
-        """递归遍历所有目录并生成索引"""
-        # 获取当前目录下的所有子目录
+    # 保存清单
+    files = collect_file_records(tree)
+    if previous.get('files') is not None:
+        previous_files = previous['files']
+        added = sum(1 for path in files if path not in previous_files)
+        removed = sum(1 for path in previous_files if path not in files)
+        modified = sum(1 for path, record in files.items()
+                       if path in previous_files and previous_files[path] != record)
+        print(f"文件变化: 新增 {added} 个，修改 {modified} 个，删除 {removed} 个")
+    # 生成失败的目录不记入清单，下次运行时重新生成
+    saved_directories = {path: digest for path, digest in directories.items() if path not in failed}
+    manifest = {'render_key': key, 'directories': saved_directories, 'files': files}
+    if manifest != previous:
         try:
-            items = os.listdir(current_path)
-        except PermissionError:
-            return
-        
-        for item in items:
-            item_path = os.path.join(current_path, item)
-            
-            # 跳过隐藏文件和目录
-            if is_hidden(item_path, hidden_patterns):
-                continue
-            
-            if os.path.isdir(item_path):
-                # 为子目录生成索引
-                generate_index_for_directory(item_path, root_dir)
-                # 递归处理更深层的目录
-                traverse_directories(item_path)
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+        except OSError as e:
+            print(f"✗ 保存增量生成清单失败: {e}")
     
-    # 开始遍历所有目录
-    traverse_directories(root_dir)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"✓ 索引页面 {len(directories)} 个：重新生成 {rendered} 个，写入 {written} 个，"
+          f"未变化跳过 {len(directories) - rendered} 个（{elapsed:.0f} ms）")
+    if failed:
+        print(f"✗ {len(failed)} 个目录生成失败")
+    return not failed
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='为项目根目录和所有子目录生成文件索引页面')
+    parser.add_argument('--force', action='store_true', help='忽略增量生成清单，重新生成所有目录')
+    parser.add_argument('--parallel', action='store_true', help='在进程池中并行生成各目录的页面')
+    parser.add_argument('--workers', type=int, help='并行生成的进程数（默认CPU核数）')
+    args = parser.parse_args(argv)
+    return generate_index(args.force, args.parallel, args.workers)
 
 if __name__ == "__main__":
-    generate_index()
\ No newline at end of file
+    sys.exit(0 if main() else 1)
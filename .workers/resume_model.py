@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+简历数据模型
+用带 __slots__ 的数据类表示解析后的简历（个人信息、教育背景、经历、项目、校园经历、技能），
+并按简历Markdown内容和提取代码的哈希缓存到磁盘，渲染器、导出脚本和索引生成脚本可以直接读取，
+无需重新执行正则提取
+"""
+
+import os
+import json
+import hashlib
+import functools
+import contextlib
+import dataclasses
+from dataclasses import dataclass
+
+from asset_manifest import write_atomic
+
+# 模型格式版本，字段变化时递增，旧缓存自动失效
+MODEL_VERSION = 1
+# 提取简历模型的源文件（与本模块位于同一目录），修改后旧缓存自动失效
+EXTRACTOR_SOURCES = ('update_resume.py', 'resume_model.py')
+# 默认缓存目录，每份简历内容一个文件
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.resume_model_cache')
+# 缓存目录中默认最多保留的文件数（按最近使用时间淘汰；批量渲染时至少保留整个批次）
+MAX_CACHE_FILES = 32
+
+
+class Record:
+    """
+    简历记录基类
+
+    字段为None表示简历中没有该项。为兼容原有的字典用法，
+    支持 record['key']、'key' in record、record.get('key') 和真值判断，只读
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def field_names(cls):
+        """按定义顺序返回字段名"""
+        return [field.name for field in dataclasses.fields(cls)]
+
+    def __getitem__(self, key):
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return key in self.__slots__ and getattr(self, key) is not None
+
+    def __bool__(self):
+        # 与空字典一致：没有任何字段时为假
+        return any(getattr(self, name) is not None for name in self.__slots__)
+
+    def get(self, key, default=None):
+        """获取字段值，字段不存在时返回default"""
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def to_dict(self):
+        """转换为字典（省略不存在的字段）"""
+        return {name: getattr(self, name) for name in self.field_names() if getattr(self, name) is not None}
+
+    @classmethod
+    def from_dict(cls, data):
+        """从提取函数返回的字典创建记录"""
+        return cls(*(data.get(name) for name in cls.field_names()))
+
+    def to_list(self):
+        """紧凑格式：按字段顺序排列的值列表"""
+        return [getattr(self, name) for name in self.field_names()]
+
+    @classmethod
+    def from_list(cls, values):
+        """从紧凑格式创建记录"""
+        return cls(*values)
+
+
+@dataclass
+class PersonalInfo(Record):
+    """个人基本信息"""
+    __slots__ = ('name', 'phone', 'email', 'gender', 'age', 'nation', 'origin', 'education', 'website', 'github')
+    name: str
+    phone: str
+    email: str
+    gender: str
+    age: str
+    nation: str
+    origin: str
+    education: str
+    website: str
+    github: str
+
+
+@dataclass
+class Education(Record):
+    """教育背景"""
+    __slots__ = ('time', 'school', 'major', 'courses')
+    time: str
+    school: str
+    major: str
+    courses: list
+
+
+@dataclass
+class Experience(Record):
+    """实习经历或工作经历"""
+    __slots__ = ('company', 'time', 'position', 'description')
+    company: str
+    time: str
+    position: str
+    description: str
+
+
+@dataclass
+class Project(Record):
+    """个人项目"""
+    __slots__ = ('name', 'time', 'description')
+    name: str
+    time: str
+    description: str
+
+
+@dataclass
+class CampusEvent(Record):
+    """校园经历"""
+    __slots__ = ('time', 'activity', 'description')
+    time: str
+    activity: str
+    description: str
+
+
+@dataclass
+class Skills:
+    """专业技能列表，可以像列表一样遍历"""
+    __slots__ = ('items',)
+    items: list
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+
+@dataclass
+class ResumeModel:
+    """解析后的完整简历"""
+    __slots__ = ('personal_info', 'education', 'experience', 'work_experience',
+                 'campus_experience', 'projects', 'skills', 'self_evaluation')
+    personal_info: PersonalInfo
+    education: list
+    experience: list
+    work_experience: list
+    campus_experience: list
+    projects: list
+    skills: Skills
+    self_evaluation: str
+
+    @classmethod
+    def from_updater(cls, updater):
+        """使用 ResumeUpdater 的提取方法解析简历"""
+        return cls(
+            PersonalInfo.from_dict(updater.extract_personal_info()),
+            [Education.from_dict(item) for item in updater.extract_education()],
+            [Experience.from_dict(item) for item in updater.extract_experience()],
+            [Experience.from_dict(item) for item in updater.extract_work_experience()],
+            [CampusEvent.from_dict(item) for item in updater.extract_campus_experience()],
+            [Project.from_dict(item) for item in updater.extract_projects()],
+            Skills(updater.extract_skills()),
+            updater.extract_self_evaluation(),
+        )
+
+    def to_compact(self):
+        """转换为紧凑的可JSON序列化结构"""
+        return {
+            'version': MODEL_VERSION,
+            'personal_info': self.personal_info.to_list(),
+            'education': [item.to_list() for item in self.education],
+            'experience': [item.to_list() for item in self.experience],
+            'work_experience': [item.to_list() for item in self.work_experience],
+            'campus_experience': [item.to_list() for item in self.campus_experience],
+            'projects': [item.to_list() for item in self.projects],
+            'skills': self.skills.items,
+            'self_evaluation': self.self_evaluation,
+        }
+
+    @classmethod
+    def from_compact(cls, data):
+        """从紧凑结构恢复，版本不一致时返回None"""
+        if data.get('version') != MODEL_VERSION:
+            return None
+        return cls(
+            PersonalInfo.from_list(data['personal_info']),
+            [Education.from_list(item) for item in data['education']],
+            [Experience.from_list(item) for item in data['experience']],
+            [Experience.from_list(item) for item in data['work_experience']],
+            [CampusEvent.from_list(item) for item in data['campus_experience']],
+            [Project.from_list(item) for item in data['projects']],
+            Skills(data['skills']),
+            data['self_evaluation'],
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def extractor_hash():
+    """提取代码（EXTRACTOR_SOURCES）的源码哈希，文件不存在时跳过"""
+    digest = hashlib.sha1()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in EXTRACTOR_SOURCES:
+        try:
+            with open(os.path.join(directory, name), 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def content_hash(resume_content):
+    """简历Markdown内容和提取代码的哈希，作为缓存键"""
+    digest = hashlib.sha1(extractor_hash().encode('ascii'))
+    digest.update(resume_content.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def cache_file(resume_content, cache_dir=None):
+    """简历内容对应的缓存文件路径"""
+    return os.path.join(cache_dir or DEFAULT_CACHE_DIR, content_hash(resume_content) + '.json')
+
+
+def load_cached_model(resume_content, cache_dir=None):
+    """
+    读取缓存的简历模型
+
+    读取成功时更新缓存文件的修改时间，清理缓存时按最近使用的顺序保留
+
+    Returns:
+        ResumeModel，没有缓存或缓存无效时返回None
+    """
+    path = cache_file(resume_content, cache_dir)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            model = ResumeModel.from_compact(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return model
+
+
+def save_cached_model(resume_content, model, cache_dir=None, max_files=MAX_CACHE_FILES):
+    """
+    保存简历模型缓存（原子写入，批量渲染的其他进程不会读到写了一半的文件），并清理最久未使用的缓存文件
+
+    Args:
+        max_files: 缓存目录中最多保留的文件数
+    """
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = cache_file(resume_content, cache_dir)
+        write_atomic(path, [json.dumps(model.to_compact(), ensure_ascii=False, separators=(',', ':'))])
+        files = []
+        for name in os.listdir(cache_dir):
+            if name.endswith('.json'):
+                # 其他进程可能同时在清理，已被删除的文件跳过
+                with contextlib.suppress(FileNotFoundError):
+                    files.append((os.path.getmtime(os.path.join(cache_dir, name)), os.path.join(cache_dir, name)))
+        if len(files) > max_files:
+            files.sort()
+            for _, old_path in files[:len(files) - max_files]:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(old_path)
+        return True
+    except OSError as e:
+        print(f"✗ 保存简历模型缓存失败: {e}")
+        return False
+
+
+def load_resume_model(resume_path, cache_dir=None):
+    """
+    按简历文件读取缓存的模型，供导出、索引生成等脚本使用
+
+    Returns:
+        ResumeModel，没有缓存时返回None（需要先运行 update_resume.py）
+    """
+    with open(resume_path, 'r', encoding='utf-8') as f:
+        return load_cached_model(f.read(), cache_dir)
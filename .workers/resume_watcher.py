@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+简历监听模式
+监听 resume/*.md、config.yaml 和模板文件，变化后自动增量重新生成网页。
+进程常驻，模板内容、配置、预编译模板和Markdown转换器在多次重新生成之间保持加载状态
+"""
+
+import os
+import glob
+import time
+import ctypes
+import ctypes.util
+import select
+
+from update_resume import PROJECT_ROOT, read_template
+
+# inotify 事件：写入完成、移入、新建、删除（编辑器通常通过重命名方式保存文件）
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+
+def create_inotify(directories):
+    """
+    创建inotify实例并监听指定目录
+
+    Returns:
+        inotify文件描述符，系统不支持时返回None
+    """
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    for directory in directories:
+        if libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+    return fd
+
+
+def drain_events(fd):
+    """读取并丢弃所有待处理的inotify事件，只关心“有变化”"""
+    try:
+        while os.read(fd, 65536):
+            pass
+    except BlockingIOError:
+        pass
+
+
+class ResumeWatcher:
+    """监听简历相关文件并增量重新生成网页"""
+
+    def __init__(self, updater, engine='soup', debounce=0.3, poll_interval=0.5, use_inotify=True):
+        """
+        初始化监听器
+
+        Args:
+            updater: 简历更新器（ResumeUpdater）
+            engine: 渲染方式（soup 或 template）
+            debounce: 去抖时间（秒），最后一次变化之后等待这么久才重新生成
+            poll_interval: 轮询模式下检查文件修改时间的间隔（秒）
+            use_inotify: 是否优先使用inotify
+        """
+        self.updater = updater
+        self.engine = engine
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        # 常驻内存的模板内容、配置和预编译模板
+        self.template_content = None
+        self.config = None
+        self.renderer = None
+        # 文件路径 -> 内容哈希，用于过滤没有实际变化的事件（包括本进程自己写入的文件）
+        self.hashes = {}
+
+    def watched_files(self):
+        """需要监听的文件：resume/*.md、配置文件和模板文件"""
+        files = sorted(glob.glob(os.path.join(PROJECT_ROOT, 'resume', '*.md')))
+        files.append(self.updater.config_path)
+        files.append(self.updater.template_path)
+        return files
+
+    def snapshot(self):
+        """计算所有监听文件的内容哈希"""
+        return {path: self.updater.file_hash(path) for path in self.watched_files()}
+
+    def stat_snapshot(self):
+        """轮询模式下使用的修改时间和大小快照"""
+        result = {}
+        for path in self.watched_files():
+            try:
+                stat = os.stat(path)
+                result[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                result[path] = None
+        return result
+
+    def changed_files(self):
+        """对比内容哈希，返回真正发生变化的文件"""
+        hashes = self.snapshot()
+        changed = [path for path in hashes if hashes[path] != self.hashes.get(path)]
+        changed += [path for path in self.hashes if path not in hashes]
+        return changed
+
+    def reload(self, changed):
+        """重新加载发生变化的模板和配置，其余内容保持常驻"""
+        template_changed = self.updater.template_path in changed
+        if self.template_content is None or template_changed:
+            self.template_content = read_template(self.updater.template_path, self.updater.html_path)
+        if template_changed:
+            self.renderer = None
+        if self.config is None or self.updater.config_path in changed:
+            self.updater.load_config()
+            self.config = self.updater.config
+            # 配置中的html_parser可能变化，需要重新编译模板
+            self.renderer = None
+        if self.engine == 'template' and self.renderer is None:
+            from template_renderer import TemplateRenderer
+            self.renderer = TemplateRenderer(self.template_content, self.updater.html_parser())
+
+    def rebuild(self, changed, force=False):
+        """重新生成网页，返回是否成功"""
+        start = time.perf_counter()
+        self.reload(changed)
+        success = self.updater.update_all(force=force, renderer=self.renderer,
+                                          template_content=self.template_content, config=self.config)
+        # 记录本次写入后的内容哈希，自己写入的网页和配置文件不会再触发重新生成
+        self.hashes = self.snapshot()
+        if self.updater.template_path == self.updater.html_path:
+            # 模板即输出文件时，下次以本次生成的结果为模板
+            self.template_content = None
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{'✓' if success else '✗'} 重新生成{'完成' if success else '失败'} ({elapsed:.1f} ms)")
+        return success
+
+    def wait_inotify(self, fd):
+        """等待inotify事件，并在最后一次事件之后去抖"""
+        select.select([fd], [], [])
+        drain_events(fd)
+        while select.select([fd], [], [], self.debounce)[0]:
+            drain_events(fd)
+
+    def wait_polling(self):
+        """轮询文件修改时间，发现变化后等待文件稳定"""
+        previous = self.stat_snapshot()
+        while True:
+            time.sleep(self.poll_interval)
+            current = self.stat_snapshot()
+            if current != previous:
+                break
+        # 去抖：直到一个去抖周期内没有新的变化
+        while True:
+            time.sleep(self.debounce)
+            stable = self.stat_snapshot()
+            if stable == current:
+                return
+            current = stable
+
+    def run(self, force=False):
+        """首次生成后持续监听，按 Ctrl+C 退出"""
+        self.rebuild(self.watched_files(), force)
+
+        directories = sorted({os.path.dirname(os.path.abspath(path)) for path in self.watched_files()})
+        fd = create_inotify(directories) if self.use_inotify else None
+        mode = 'inotify' if fd is not None else f'轮询（每 {self.poll_interval} 秒）'
+        print(f"\n=== 正在监听 {len(self.watched_files())} 个文件（{mode}），按 Ctrl+C 退出 ===")
+        try:
+            while True:
+                if fd is not None:
+                    self.wait_inotify(fd)
+                else:
+                    self.wait_polling()
+                changed = self.changed_files()
+                if not changed:
+                    continue
+                names = ', '.join(os.path.relpath(path, PROJECT_ROOT) for path in changed)
+                print(f"\n检测到变化: {names}")
+                self.rebuild(changed)
+        except KeyboardInterrupt:
+            print("\n✓ 已停止监听")
+        finally:
+            if fd is not None:
+                os.close(fd)
+        return True
@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+简历模板渲染器
+将 index.html 预编译为带命名插槽的模板，渲染时只用字符串拼接填充插槽，
+不再对整个页面做 BeautifulSoup 解析、DOM 修改和序列化
+"""
+
+import re
+import functools
+from bs4 import BeautifulSoup
+
+from update_resume import (
+    TAB_COLORS, SKILL_ICONS,
+    EDUCATION_TAB_SCRIPT, EDUCATION_TAB_STYLE, SINGLE_EDUCATION_SCRIPT,
+    SECTION_SCHEMAS, CONFIG_LINKS, ElementIndex,
+    CONTAINER_PROTOTYPE, SECTION_TITLE_PROTOTYPE, CONTENT_PROTOTYPE, TAB_BAR_PROTOTYPE, TAB_WRAPPER_PROTOTYPE,
+    TAB_PANEL_PROTOTYPE, HIDDEN_TAB_PANEL_PROTOTYPE, RECORD_LIST_PROTOTYPE, tab_button_prototype,
+    parsed_markdown, remove_section, ensure_section, ensure_nav_link,
+)
+
+# 插槽标记：使用私有区字符，序列化时不会被转义
+SLOT_START = '\ue000'
+SLOT_END = '\ue001'
+# 属性插槽连同两侧引号一起匹配，渲染时按 BeautifulSoup 的规则重新加引号
+SLOT_PATTERN = re.compile('"' + SLOT_START + '([^' + SLOT_END + ']*)' + SLOT_END + '"|'
+                          + SLOT_START + '([^' + SLOT_END + ']*)' + SLOT_END)
+
+# 原型字符串模板中子元素的插槽名
+CHILDREN_SLOT = '*'
+
+# 教育背景的常用片段（ResumeUpdater.update_education 逐个创建元素，没有对应的原型）
+CARD_OPEN = '<div class="bg-white rounded-xl p-8 shadow-lg overflow-hidden border border-gray-100 mb-8">'
+CALENDAR_ICON = '<i class="fa fa-calendar text-primary"></i>'
+COURSE_OPEN = ('<div class="bg-white px-4 py-3 rounded-lg text-sm text-medium shadow-sm hover:shadow-md '
+               'transition-all duration-300 transform hover:scale-105 border border-gray-100">')
+INFO_P_OPEN = '<p class="text-medium mb-1">'
+
+
+def escape_text(text):
+    """按 BeautifulSoup minimal 格式转义文本"""
+    return str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def quote_attr(value):
+    """按 BeautifulSoup minimal 格式转义属性值并加引号"""
+    value = escape_text(value)
+    if '"' in value:
+        if "'" in value:
+            return '"' + value.replace('"', '&quot;') + '"'
+        return "'" + value + "'"
+    return '"' + value + '"'
+
+
+def split_slots(html):
+    """
+    按插槽切分序列化后的HTML
+
+    Returns:
+        静态片段与 (插槽名, 是否为属性插槽) 交替排列的列表（偶数位为静态片段）
+    """
+    chunks = []
+    pos = 0
+    for match in SLOT_PATTERN.finditer(html):
+        chunks.append(html[pos:match.start()])
+        if match.group(1) is not None:
+            chunks.append((match.group(1), True))
+        else:
+            chunks.append((match.group(2), False))
+        pos = match.end()
+    chunks.append(html[pos:])
+    return chunks
+
+
+class StringPrototype:
+    """
+    原型（update_resume.Prototype）的字符串模板
+
+    编译时把原型克隆一次（占位文本和指定的根元素属性换成插槽，末尾加上子元素插槽）并序列化，
+    渲染时只做字符串拼接，结果与 ResumeUpdater 克隆原型后序列化的内容一致；
+    卡片等标记只在原型中写一次
+    """
+
+    def __init__(self, prototype, attrs=(), children_path=()):
+        """
+        Args:
+            prototype: 原型
+            attrs: 渲染时指定的根元素属性名，如 ('id',)
+            children_path: 子元素插入位置：从根元素起逐层的子节点下标，默认插入根元素末尾
+        """
+        node = prototype.clone({field: SLOT_START + field + SLOT_END for field in prototype.slots.values()},
+                               {attr: SLOT_START + attr + SLOT_END for attr in attrs})
+        parent = node
+        for i in children_path:
+            parent = parent.contents[i]
+        parent.append(SLOT_START + CHILDREN_SLOT + SLOT_END)
+        self.chunks = split_slots(str(node))
+
+    def render(self, record=None, children='', **attrs):
+        """
+        渲染原型
+
+        Args:
+            record: 填充占位符的记录（字段为None时填充空字符串）
+            children: 已序列化的子元素
+            attrs: 根元素属性值
+        """
+        parts = []
+        for i, chunk in enumerate(self.chunks):
+            if i % 2 == 0:
+                parts.append(chunk)
+                continue
+            name, is_attr = chunk
+            if is_attr:
+                parts.append(quote_attr(attrs[name]))
+            elif name == CHILDREN_SLOT:
+                parts.append(children)
+            else:
+                value = record[name]
+                parts.append('' if value is None else escape_text(value))
+        return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def string_prototype(prototype):
+    """部分描述中的卡片、标题行等原型的字符串模板，每个原型只编译一次"""
+    return StringPrototype(prototype)
+
+
+@functools.lru_cache(maxsize=None)
+def tab_button_template(icon, color, active):
+    """标签按钮的字符串模板，按 图标、颜色、是否选中 缓存"""
+    return StringPrototype(tab_button_prototype(icon, color, active), attrs=('id',))
+
+
+# 各部分通用元素的字符串模板
+CONTAINER = StringPrototype(CONTAINER_PROTOTYPE)
+SECTION_TITLE = StringPrototype(SECTION_TITLE_PROTOTYPE)
+CONTENT = StringPrototype(CONTENT_PROTOTYPE)
+TAB_BAR = StringPrototype(TAB_BAR_PROTOTYPE, children_path=(0,))
+TAB_WRAPPER = StringPrototype(TAB_WRAPPER_PROTOTYPE)
+TAB_PANEL = StringPrototype(TAB_PANEL_PROTOTYPE, attrs=('id',))
+HIDDEN_TAB_PANEL = StringPrototype(HIDDEN_TAB_PANEL_PROTOTYPE, attrs=('id',))
+RECORD_LIST = StringPrototype(RECORD_LIST_PROTOTYPE)
+
+
+def tab_bar(name, icon, count):
+    """标签栏：count 个标签按钮，id 为 tab-<name>-<序号>"""
+    buttons = ''.join(tab_button_template(icon, TAB_COLORS[i % len(TAB_COLORS)], i == 0).render(id=f'tab-{name}-{i + 1}')
+                      for i in range(count))
+    return TAB_BAR.render(children=buttons)
+
+
+def tab_panel(name, i, children):
+    """第 i 个标签面板（第一个显示，其余隐藏），id 为 panel-<name>-<序号>"""
+    return (TAB_PANEL if i == 0 else HIDDEN_TAB_PANEL).render(children=children, id=f'panel-{name}-{i + 1}')
+
+
+class CompiledTemplate:
+    """预编译模板：静态片段与插槽名交替排列"""
+
+    def __init__(self, chunks, defaults, links):
+        """
+        Args:
+            chunks: 静态片段与插槽名交替的列表（偶数位为静态片段）
+            defaults: 插槽名 -> 数据缺失时使用的已序列化内容
+            links: 链接插槽名 -> 可覆盖该链接的配置项列表
+        """
+        self.chunks = chunks
+        self.defaults = defaults
+        self.links = links
+
+    def fill(self, values):
+        """用已序列化的插槽内容拼接页面"""
+        parts = self.chunks[:]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = values[name] if name in values else self.defaults.get(name, '')
+        return ''.join(parts)
+
+
+class TemplateRenderer:
+    """基于预编译模板的简历渲染器"""
+
+    def __init__(self, template_content, parser='html.parser'):
+        """
+        初始化模板渲染器
+
+        Args:
+            template_content: HTML模板内容
+            parser: 编译模板和规范化Markdown片段时使用的HTML解析器
+        """
+        self.template_content = template_content
+        self.parser = parser
+        # 按“哪些部分有数据”缓存编译结果，同一组合只编译一次
+        self.compiled = {}
+
+    def compile(self, present):
+        """
+        编译模板
+
+        与 ResumeUpdater 的各 update_* 方法保持同样的结构调整（删除无数据的部分、
+        补充缺失的部分和导航链接），再把数据相关的位置替换为插槽
+
+        Args:
+            present: 有数据的部分id集合
+        """
+        key = frozenset(present)
+        if key in self.compiled:
+            return self.compiled[key]
+
+        soup = BeautifulSoup(self.template_content, self.parser)
+        index = ElementIndex(soup)
+        defaults = {}
+        links = {}
+
+        def text_slot(elem, name):
+            defaults[name] = elem.decode_contents()
+            elem.string = SLOT_START + name + SLOT_END
+
+        def attr_slot(elem, attr, name):
+            defaults[name] = quote_attr(elem.get(attr, ''))
+            elem[attr] = SLOT_START + name + SLOT_END
+
+        def content_slot(elem, name):
+            elem.append(SLOT_START + name + SLOT_END)
+
+        # 个人信息
+        name_elem = index.find_having_class('h1', lambda value: value == 'text-4xl')
+        if name_elem:
+            text_slot(name_elem, 'name')
+        for elem in index.find_class('div', 'flex items-center gap-2 text-medium'):
+            icon = elem.find('i')
+            if not icon:
+                continue
+            icon_class = icon.get('class', [])
+            if 'fa-phone' in icon_class:
+                span = elem.find('span')
+                if span:
+                    text_slot(span, 'phone')
+            else:
+                for field in ('envelope', 'globe', 'github'):
+                    if 'fa-' + field in icon_class:
+                        a = elem.find('a')
+                        if a:
+                            text_slot(a, field)
+                            attr_slot(a, 'href', field + '_href')
+                        break
+        info_grid = index.find_having_class('div', lambda value: 'grid' in value)
+        if info_grid:
+            info_items = info_grid.find_all('div', recursive=False)
+            if len(info_items) >= 2:
+                for side, info_div in (('info_left', info_items[0]), ('info_right', info_items[1])):
+                    for p in info_div.find_all('p'):
+                        p.decompose()
+                    content_slot(info_div, side)
+
+        # 各部分
+        self.prepare_education(index, 'education' in present, content_slot)
+        for schema in SECTION_SCHEMAS.values():
+            self.prepare_record_section(index, schema, schema.section_id in present, content_slot)
+        self.prepare_skills(index, 'skills' in present, content_slot)
+        self.prepare_self_evaluation(index, 'self-evaluation' in present, content_slot)
+
+        # 配置相关内容
+        title_elem = index.find('title')
+        if title_elem:
+            text_slot(title_elem, 'head_title')
+        for nav_title_elem in index.find_class('div', 'text-xl font-bold text-primary')[:1]:
+            text_slot(nav_title_elem, 'page_title')
+        link_words = [word for _, words in CONFIG_LINKS for word in words]
+        for i, a in enumerate(index.links_containing(*link_words)):
+            text = a.get_text()
+            name = f'link_{i}'
+            links[name] = [key for key, words in CONFIG_LINKS if any(word in text for word in words)]
+            attr_slot(a, 'href', name)
+        for footer_div in index.find_class('div', 'border-t border-gray-800 mt-8 pt-8 text-center text-gray-400')[:1]:
+            footer_ps = footer_div.find_all('p')
+            if footer_ps:
+                text_slot(footer_ps[0], 'footer_info')
+            if len(footer_ps) >= 2:
+                text_slot(footer_ps[1], 'last_updated')
+
+        # 序列化并按插槽切分（属性插槽的值已在填充时加好引号，只保留插槽名）
+        chunks = [chunk if i % 2 == 0 else chunk[0] for i, chunk in enumerate(split_slots(str(soup)))]
+
+        compiled = CompiledTemplate(chunks, defaults, links)
+        self.compiled[key] = compiled
+        return compiled
+
+    def prepare_education(self, index, present, content_slot):
+        """教育背景：无数据时移除，否则清空并放置插槽"""
+        if not present:
+            remove_section(index, 'education', '<!-- 教育背景 -->')
+            return
+        section = index.get('education', 'section')
+        if section:
+            section.clear()
+            content_slot(section, 'education')
+
+    def prepare_record_section(self, index, schema, present, content_slot):
+        """
+        按部分描述（SectionSchema）准备经历类部分，与 ResumeUpdater.prepare_record_section 保持同样的结构：
+        需要新建的部分清空后整体替换为插槽；其余部分保留模板中的容器和标题，标题之后放置插槽
+        """
+        if not present:
+            remove_section(index, schema.section_id, schema.marker)
+            return
+        if schema.create:
+            section = ensure_section(index, schema.section_id, schema.background, schema.anchors)
+            section.clear()
+            content_slot(section, schema.section_id)
+        else:
+            section = index.get(schema.section_id, 'section')
+            if not section:
+                return
+            for child in section.find_all(recursive=False):
+                if child.name != 'div' or 'container' not in child.get('class', []):
+                    child.decompose()
+            container = section.find('div', class_='container')
+            if not container:
+                container = CONTAINER_PROTOTYPE.clone()
+                section.append(container)
+            title_div = container.find('div', class_='text-center')
+            if not title_div:
+                container.append(SECTION_TITLE_PROTOTYPE.clone({'title': schema.title}))
+            else:
+                for child in container.find_all(recursive=False):
+                    if child != title_div:
+                        child.decompose()
+            content_slot(container, schema.section_id)
+        ensure_nav_link(index, schema.section_id, schema.title, schema.nav_after)
+
+    def prepare_skills(self, index, present, content_slot):
+        """专业技能"""
+        if not present:
+            remove_section(index, 'skills', '<!-- 专业技能 -->')
+            return
+        section = index.get('skills', 'section')
+        if section:
+            skill_container = section.find('div', class_='space-y-6')
+            if skill_container:
+                skill_container.clear()
+                content_slot(skill_container, 'skills')
+
+    def prepare_self_evaluation(self, index, present, content_slot):
+        """自我评价"""
+        if not present:
+            remove_section(index, 'self-evaluation', '<!-- 自我评价 -->')
+            return
+        section = index.get('self-evaluation', 'section')
+        if section:
+            eval_card = section.find('div', class_='bg-white rounded-xl p-8 shadow-sm')
+            if eval_card:
+                eval_p = eval_card.find('p', class_='text-medium')
+                if eval_p:
+                    eval_p.clear()
+                    for sibling in eval_p.find_next_siblings():
+                        sibling.decompose()
+                    content_slot(eval_p, 'self-evaluation')
+
+    def markdown_fragment(self, text):
+        """将Markdown转换为与 BeautifulSoup 序列化结果一致的HTML片段"""
+        return ''.join(str(node) for node in parsed_markdown(text, self.parser))
+
+    def render_info_left(self, info):
+        """个人信息左侧：性别、年龄、民族、籍贯"""
+        parts = []
+        for key, label in (('gender', '性别'), ('age', '年龄'), ('nation', '民族'), ('origin', '籍贯')):
+            if key in info:
+                parts.append(INFO_P_OPEN + escape_text(f'{label}：{info[key]}') + '</p>')
+        return ''.join(parts)
+
+    def render_info_right(self, education_list):
+        """个人信息右侧：学历、专业、毕业院校（取第一段教育背景）"""
+        if not education_list:
+            return ''
+        first_education = education_list[0]
+        school = first_education.get('school', '未知学校')
+        education_level = '本科'
+        if '（本科）' in school:
+            education_level = '本科'
+        elif '（硕士）' in school:
+            education_level = '硕士研究生'
+        elif '（博士）' in school:
+            education_level = '博士研究生'
+        school_name = school.split('（')[0] if '（' in school and '）' in school else school
+        return (INFO_P_OPEN + escape_text(f'学历：{education_level}') + '</p>'
+                + INFO_P_OPEN + escape_text(f'专业：{first_education.get("major", "未知专业")}') + '</p>'
+                + INFO_P_OPEN + escape_text(f'毕业院校：{school_name}') + '</p>')
+
+    def render_education_body(self, education, suffix):
+        """单段教育背景的内容（学校、时间、专业、主修课程）"""
+        parts = ['<div class="font-semibold text-xl flex items-center gap-3 mb-4">'
+                 '<i class="fa fa-graduation-cap text-primary text-xl"></i><span>',
+                 escape_text(education['school']) if 'school' in education else '',
+                 '</span></div><div class="text-primary font-medium mb-4 flex items-center gap-2">', CALENDAR_ICON,
+                 escape_text(education['time']) if 'time' in education else '',
+                 '</div><div class="text-medium bg-primary/10 text-primary px-4 py-2 rounded-full text-sm mb-6 inline-block">',
+                 escape_text(education['major']) if 'major' in education else '',
+                 '</div>']
+        courses = education.get('courses')
+        if courses:
+            parts.append('<div class="bg-gradient-to-br from-purple-50 to-blue-50 rounded-xl p-6 shadow-sm mt-6">'
+                         '<h3 class="font-medium mb-6 flex items-center gap-3 text-lg text-gray-800">'
+                         '<i class="fa fa-book text-primary"></i><span>主修课程</span></h3><div class="relative">'
+                         '<div class="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 gap-4 max-h-64 overflow-hidden '
+                         'transition-all duration-500" id="courses-grid-' + suffix + '">')
+            for course in courses:
+                parts.append(COURSE_OPEN + escape_text(course) + '</div>')
+            parts.append('</div></div>')
+            if len(courses) > 8:
+                parts.append('<button class="mt-4 text-primary font-medium flex items-center gap-2 hover:underline '
+                             'focus:outline-none" id="toggle-courses-' + suffix + '">展开全部'
+                             '<i class="fa fa-chevron-down"></i></button>')
+            parts.append('</div>')
+        return ''.join(parts)
+
+    def render_education(self, education_list):
+        """教育背景：两段时使用标签栏，否则逐段展示"""
+        if len(education_list) == 2:
+            panels = ''.join(tab_panel('education', i, self.render_education_body(education_list[i], str(i + 1)))
+                             for i in range(2))
+            content = CONTENT.render(children=tab_bar('education', 'fa-graduation-cap', 2)
+                                     + TAB_WRAPPER.render(children=panels))
+            scripts = '<script>' + EDUCATION_TAB_SCRIPT + '</script><style>' + EDUCATION_TAB_STYLE + '</style>'
+        else:
+            content = CONTENT.render(children=''.join(CARD_OPEN + self.render_education_body(education, 'single') + '</div>'
+                                                      for education in education_list))
+            scripts = '<script>' + SINGLE_EDUCATION_SCRIPT + '</script>'
+        return CONTAINER.render(children=SECTION_TITLE.render({'title': '教育背景'}) + content + scripts)
+
+    def render_record(self, schema, record):
+        """单条记录的内容：标题行和Markdown描述，与 ResumeUpdater.fill_record 对应"""
+        parts = []
+        if schema.header is not None and all(field in record for field in schema.header_fields):
+            parts.append(string_prototype(schema.header).render(record))
+        if record.get('description'):
+            parts.append(self.markdown_fragment(record['description']))
+        return ''.join(parts)
+
+    def render_record_section(self, schema, records):
+        """
+        按部分描述渲染经历类部分，与 ResumeUpdater.update_record_section 结构相同
+
+        Returns:
+            新建的部分返回完整容器；保留模板标题的部分只返回标题之后的内容
+        """
+        card = string_prototype(schema.card)
+        script = ''
+        if schema.layout == 'list':
+            items = []
+            for record in records:
+                detail = ''
+                if schema.detail is not None and record['description']:
+                    detail = string_prototype(schema.detail).render(record)
+                items.append(card.render(record, detail))
+            content = RECORD_LIST.render(children=''.join(items))
+        elif len(records) > 1:
+            panels = ''.join(tab_panel(schema.tab_name, i, self.render_record(schema, record))
+                             for i, record in enumerate(records))
+            content = (tab_bar(schema.tab_name, schema.tab_icon, len(records))
+                       + TAB_WRAPPER.render(children=panels))
+            script = '<script>' + schema.tab_script + '</script>'
+        else:
+            content = ''.join(card.render(children=self.render_record(schema, record)) for record in records)
+        body = CONTENT.render(children=content) + script
+        if not schema.create:
+            return body
+        return CONTAINER.render(children=SECTION_TITLE.render({'title': schema.title}) + body)
+
+    def render_skills(self, skills):
+        """专业技能时间线"""
+        parts = []
+        for i, skill in enumerate(skills):
+            parts.append('<div class="flex gap-4"><div class="relative"><div class="w-8 h-8 bg-primary rounded-full '
+                         'flex items-center justify-center text-white z-10"><i class="fa '
+                         + SKILL_ICONS[i % len(SKILL_ICONS)] + '"></i></div></div><div class="bg-white p-4 '
+                         'rounded-lg shadow-sm flex-1 hover:shadow-md transition-shadow duration-300">'
+                         '<p class="text-medium">' + escape_text(skill) + '</p></div></div>')
+        return ''.join(parts)
+
+    def render(self, updater):
+        """
+        渲染完整页面
+
+        Args:
+            updater: 已加载简历和配置的 ResumeUpdater，用于提取简历数据
+
+        Returns:
+            渲染后的HTML内容（未做注释和空行清理），失败时返回None
+        """
+        rendered = self.render_sections(updater)
+        if rendered is None:
+            return None
+        return self.render_config(rendered[0], rendered[1], updater.config)
+
+    def render_sections(self, updater):
+        """
+        渲染个人信息和各部分的插槽内容
+
+        Returns:
+            (编译后的模板, 插槽内容)，配置未加载或个人信息缺失时返回None
+        """
+        if not updater.config:
+            print("✗ 配置文件未加载，无法更新配置内容")
+            return None
+        model = updater.resume_model()
+        info = model.personal_info
+        if not info:
+            print("✗ 未提取到个人信息")
+            return None
+        education_list = model.education
+        skills = model.skills
+        evaluation = model.self_evaluation
+
+        records = {schema.section_id: (schema, getattr(model, schema.model_field)) for schema in SECTION_SCHEMAS.values()}
+        data = {
+            'education': education_list,
+            **{section_id: value for section_id, (_, value) in records.items()},
+            'skills': skills,
+            'self-evaluation': evaluation,
+        }
+        compiled = self.compile({section_id for section_id, value in data.items() if value})
+
+        values = {}
+        # 个人信息
+        if 'name' in info:
+            values['name'] = escape_text(info['name'])
+        if 'phone' in info:
+            values['phone'] = escape_text(info['phone'])
+        if 'email' in info:
+            values['envelope'] = escape_text(info['email'])
+            values['envelope_href'] = quote_attr(f'mailto:{info["email"]}')
+        if 'website' in info:
+            values['globe'] = escape_text(info['website'])
+            values['globe_href'] = quote_attr(f'https://{info["website"]}')
+        if 'github' in info:
+            github = info['github']
+            values['github'] = escape_text(github.split('/')[-1] if '/' in github else github)
+            values['github_href'] = quote_attr(github)
+        values['info_left'] = self.render_info_left(info)
+        values['info_right'] = self.render_info_right(education_list)
+
+        # 各部分
+        if education_list:
+            values['education'] = self.render_education(education_list)
+        for section_id, (schema, section_records) in records.items():
+            if section_records:
+                values[section_id] = self.render_record_section(schema, section_records)
+        if skills:
+            values['skills'] = self.render_skills(skills)
+        if evaluation:
+            values['self-evaluation'] = self.markdown_fragment(evaluation)
+
+        return compiled, values
+
+    def render_config(self, compiled, values, config):
+        """填充配置相关的插槽并拼接页面"""
+        values = dict(values)
+        for key in ('head_title', 'page_title', 'footer_info'):
+            if key in config:
+                values[key] = escape_text(config[key])
+        if 'last_updated' in config:
+            values['last_updated'] = escape_text(f"最后更新：{config['last_updated']}")
+        for name, keys in compiled.links.items():
+            for key in keys:
+                if key in config:
+                    values[name] = quote_attr(config[key])
+
+        return compiled.fill(values)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+build_wallpapers.py 的测试
+在临时目录中生成几张很小的图片并构建壁纸变体，检查清单、跳过未变化的壁纸、
+处理失败时保留上一次的变体，以及源文件删除后清理旧变体。未安装Pillow时跳过
+
+运行：python .workers/test_build_wallpapers.py 或 python -m pytest .workers
+"""
+
+import os
+import io
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import build_wallpapers
+from build_wallpapers import BACKGROUND_DIR, WALLPAPERS_DIR, Image
+
+
+@unittest.skipIf(Image is None, '未安装Pillow')
+class BuildWallpapersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix='build_wallpapers_')
+        os.makedirs(os.path.join(self.root, BACKGROUND_DIR))
+        self.save_image('a.png', (40, 30), 'red')
+        self.save_image('b.png', (32, 32), 'blue')
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def save_image(self, name, size, color):
+        Image.new('RGB', size, color).save(os.path.join(self.root, BACKGROUND_DIR, name))
+
+    def build(self, force=False):
+        """执行构建，返回 (是否成功, 清单)"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            success = build_wallpapers.build(workers=1, force=force, root=self.root)
+        with open(os.path.join(self.root, WALLPAPERS_DIR, 'manifest.json'), 'r', encoding='utf-8') as f:
+            return success, json.load(f)
+
+    def variant_paths(self, entry):
+        return [os.path.join(self.root, variant[1])
+                for variants in entry['variants'].values() for variant in variants]
+
+    def test_build_and_skip_unchanged(self):
+        success, manifest = self.build()
+        self.assertTrue(success)
+        self.assertEqual(sorted(manifest), ['a.png', 'b.png'])
+        entry = manifest['a.png']
+        self.assertEqual((entry['width'], entry['height']), (40, 30))
+        self.assertEqual(entry['variants']['webp'][0][0], 40)
+        self.assertTrue(entry['placeholder'].startswith('data:image/webp;base64,'))
+        self.assertTrue(all(os.path.exists(path) for path in self.variant_paths(entry)))
+
+        mtimes = {path: os.path.getmtime(path) for path in self.variant_paths(entry)}
+        success, again = self.build()
+        self.assertTrue(success)
+        self.assertEqual(again, manifest)
+        self.assertEqual({path: os.path.getmtime(path) for path in mtimes}, mtimes)
+
+    def test_failed_job_keeps_previous_variants(self):
+        _, manifest = self.build()
+        # 源文件内容变化但无法解码：处理失败，继续使用上一次的变体
+        with open(os.path.join(self.root, BACKGROUND_DIR, 'b.png'), 'wb') as f:
+            f.write(b'not an image')
+        for force in (False, True):
+            success, current = self.build(force=force)
+            self.assertFalse(success)
+            self.assertEqual(current['b.png'], manifest['b.png'])
+            self.assertTrue(all(os.path.exists(path) for path in self.variant_paths(manifest['b.png'])))
+
+    def test_removed_source_variants_are_deleted(self):
+        _, manifest = self.build()
+        os.remove(os.path.join(self.root, BACKGROUND_DIR, 'a.png'))
+        success, current = self.build()
+        self.assertTrue(success)
+        self.assertEqual(list(current), ['b.png'])
+        self.assertFalse(any(os.path.exists(path) for path in self.variant_paths(manifest['a.png'])))
+        self.assertTrue(all(os.path.exists(path) for path in self.variant_paths(manifest['b.png'])))
+
+
+if __name__ == '__main__':
+    unittest.main()
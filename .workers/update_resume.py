@@ -6,48 +6,1131 @@
 
 import os
 import re
+import io
+import sys
+import copy
+import dataclasses
+import glob
+import collections
+import json
+import hashlib
+import time
+import argparse
+import tracemalloc
+import contextlib
+import functools
+import concurrent.futures
 import markdown
-from bs4 import BeautifulSoup
+import bs4
+from bs4 import BeautifulSoup, Comment, Tag
 import yaml
 import datetime
 
+from asset_manifest import PROJECT_ROOT, TAB_COLORS, rewrite_references, write_atomic
+from resume_model import MAX_CACHE_FILES, ResumeModel, Skills, load_cached_model, save_cached_model
+
+# 二级标题（## 标题）匹配，用于一次性建立章节索引
+SECTION_HEADING_PATTERN = re.compile(r'^## +(.+?)[ \t]*$', re.MULTILINE)
+# 基本信息字段匹配
+BASIC_FIELD_PATTERN = re.compile(r'(性别|年龄|民族|籍贯)：([^\n]*?)(?=(?:性别|年龄|民族|籍贯)：|\n|$)')
+# 记录头部（flex 三列）的分隔标记
+RECORD_SEPARATOR = '<div style="display: flex; justify-content: space-between; align-items: center;">'
+BOLD_PATTERN = re.compile(r'<b>(.*?)</b>', re.DOTALL)
+EDU_TIME_PATTERN = re.compile(r'<div style="flex: 1; text-align: left;"><b>(.*?)</b></div>')
+EDU_SCHOOL_PATTERN = re.compile(r'<div style="flex: 1; text-align: center;"><b>(.*?)</b></div>')
+EDU_MAJOR_PATTERN = re.compile(r'<div style="flex: 1; text-align: right;"><b>(.*?)</b></div>')
+
+# 各更新步骤依赖的简历章节（''表示第一个标题之前的姓名、联系方式部分）
+STEP_SECTIONS = {
+    'update_personal_info': ('', '基本信息', '教育背景'),
+    'update_education': ('教育背景',),
+    'update_experience': ('实习经历',),
+    'update_work_experience': ('工作经历',),
+    'update_campus_experience': ('校园经历',),
+    'update_projects': ('个人项目',),
+    'update_skills': ('专业技能',),
+    'update_self_evaluation': ('自我评价',),
+}
+
+# 专业技能图标（循环使用）
+SKILL_ICONS = [
+    'fa-language', 'fa-line-chart', 'fa-pencil',
+    'fa-code', 'fa-magic', 'fa-html5',
+    'fa-film', 'fa-file-excel-o', 'fa-terminal'
+]
+
+# 教育背景标签切换及主修课程折叠脚本
+EDUCATION_TAB_SCRIPT = '''
+                        // 教育背景标签切换逻辑
+                        document.addEventListener('DOMContentLoaded', function() {
+                            const tabs = document.querySelectorAll('[id^="tab-education-"]');
+                            const panels = document.querySelectorAll('[id^="panel-education-"]');
+                            
+                            tabs.forEach((tab, index) => {
+                                tab.addEventListener('click', function() {
+                                    // 激活当前标签
+                                    tabs.forEach(t => {
+                                        // 移除所有激活状态的类
+                                        t.classList.remove('shadow-lg', 'transform', 'scale-105');
+                                        t.classList.add('shadow-md');
+                                    });
+                                    // 激活当前标签
+                                    tab.classList.add('shadow-lg', 'transform', 'scale-105');
+                                    tab.classList.remove('shadow-md');
+                                    
+                                    // 显示当前面板
+                                    panels.forEach(p => {
+                                        p.classList.add('hidden');
+                                        p.classList.remove('animate-fade-in');
+                                    });
+                                    panels[index].classList.remove('hidden');
+                                    panels[index].classList.add('animate-fade-in');
+                                });
+                            });
+                            
+                            // 主修课程折叠逻辑
+                            const toggleBtn1 = document.getElementById('toggle-courses-1');
+                            const coursesGrid1 = document.getElementById('courses-grid-1');
+                            
+                            if (toggleBtn1 && coursesGrid1) {
+                                toggleBtn1.addEventListener('click', function() {
+                                    if (coursesGrid1.classList.contains('max-h-64')) {
+                                        // 展开
+                                        coursesGrid1.classList.remove('max-h-64');
+                                        coursesGrid1.classList.add('max-h-[none]');
+                                        toggleBtn1.innerHTML = '收起 <i class="fa fa-chevron-up"></i>';
+                                    } else {
+                                        // 收起
+                                        coursesGrid1.classList.add('max-h-64');
+                                        coursesGrid1.classList.remove('max-h-[none]');
+                                        toggleBtn1.innerHTML = '展开全部 <i class="fa fa-chevron-down"></i>';
+                                    }
+                                });
+                            }
+                            
+                            const toggleBtn2 = document.getElementById('toggle-courses-2');
+                            const coursesGrid2 = document.getElementById('courses-grid-2');
+                            
+                            if (toggleBtn2 && coursesGrid2) {
+                                toggleBtn2.addEventListener('click', function() {
+                                    if (coursesGrid2.classList.contains('max-h-64')) {
+                                        // 展开
+                                        coursesGrid2.classList.remove('max-h-64');
+                                        coursesGrid2.classList.add('max-h-[none]');
+                                        toggleBtn2.innerHTML = '收起 <i class="fa fa-chevron-up"></i>';
+                                    } else {
+                                        // 收起
+                                        coursesGrid2.classList.add('max-h-64');
+                                        coursesGrid2.classList.remove('max-h-[none]');
+                                        toggleBtn2.innerHTML = '展开全部 <i class="fa fa-chevron-down"></i>';
+                                    }
+                                });
+                            }
+                        });
+                    '''
+
+# 教育背景标签面板动画样式
+EDUCATION_TAB_STYLE = '''
+                        /* 教育背景样式 */
+                        @keyframes fadeIn {
+                            from {
+                                opacity: 0;
+                                transform: translateY(10px);
+                            }
+                            to {
+                                opacity: 1;
+                                transform: translateY(0);
+                            }
+                        }
+                        
+                        .animate-fade-in {
+                            animation: fadeIn 0.5s ease-out forwards;
+                        }
+                    '''
+
+# 单一教育背景的主修课程折叠脚本
+SINGLE_EDUCATION_SCRIPT = '''
+                        // 单一教育背景的主修课程折叠逻辑
+                        document.addEventListener('DOMContentLoaded', function() {
+                            const toggleBtn = document.getElementById('toggle-courses-single');
+                            const coursesGrid = document.getElementById('courses-grid-single');
+                            
+                            if (toggleBtn && coursesGrid) {
+                                toggleBtn.addEventListener('click', function() {
+                                    if (coursesGrid.classList.contains('max-h-64')) {
+                                        // 展开
+                                        coursesGrid.classList.remove('max-h-64');
+                                        coursesGrid.classList.add('max-h-[none]');
+                                        toggleBtn.innerHTML = '收起 <i class="fa fa-chevron-up"></i>';
+                                    } else {
+                                        // 收起
+                                        coursesGrid.classList.add('max-h-64');
+                                        coursesGrid.classList.remove('max-h-[none]');
+                                        toggleBtn.innerHTML = '展开全部 <i class="fa fa-chevron-down"></i>';
+                                    }
+                                });
+                            }
+                        });
+                    '''
+
+# 实习经历标签切换脚本
+EXPERIENCE_TAB_SCRIPT = '''
+                    // 实习经历标签切换逻辑
+                    document.addEventListener('DOMContentLoaded', function() {
+                        const tabs = document.querySelectorAll('[id^="tab-experience-"]');
+                        const panels = document.querySelectorAll('[id^="panel-experience-"]');
+                        
+                        tabs.forEach((tab, index) => {
+                            tab.addEventListener('click', function() {
+                                // 激活当前标签
+                                tabs.forEach(t => {
+                                    // 移除所有激活状态的类
+                                    t.classList.remove('shadow-lg', 'transform', 'scale-105');
+                                    t.classList.add('shadow-md');
+                                });
+                                // 激活当前标签
+                                tab.classList.add('shadow-lg', 'transform', 'scale-105');
+                                tab.classList.remove('shadow-md');
+                                
+                                // 显示当前面板
+                                panels.forEach(p => {
+                                    p.classList.add('hidden');
+                                    p.classList.remove('animate-fade-in');
+                                });
+                                panels[index].classList.remove('hidden');
+                                panels[index].classList.add('animate-fade-in');
+                            });
+                        });
+                    });
+                '''
+
+# 工作经历标签切换脚本
+WORK_TAB_SCRIPT = '''
+                    // 工作经历标签切换逻辑
+                    document.addEventListener('DOMContentLoaded', function() {
+                        const tabs = document.querySelectorAll('[id^="tab-work-"]');
+                        const panels = document.querySelectorAll('[id^="panel-work-"]');
+                        
+                        tabs.forEach((tab, index) => {
+                            tab.addEventListener('click', function() {
+                                // 激活当前标签
+                                tabs.forEach(t => {
+                                    // 移除所有激活状态的类
+                                    t.classList.remove('shadow-lg', 'transform', 'scale-105');
+                                    t.classList.add('shadow-md');
+                                });
+                                // 激活当前标签
+                                tab.classList.add('shadow-lg', 'transform', 'scale-105');
+                                tab.classList.remove('shadow-md');
+                                
+                                // 显示当前面板
+                                panels.forEach(p => {
+                                    p.classList.add('hidden');
+                                    p.classList.remove('animate-fade-in');
+                                });
+                                panels[index].classList.remove('hidden');
+                                panels[index].classList.add('animate-fade-in');
+                            });
+                        });
+                    });
+                '''
+
+# 个人项目标签切换脚本
+PROJECT_TAB_SCRIPT = '''
+                        // 个人项目标签切换逻辑
+                        document.addEventListener('DOMContentLoaded', function() {
+                            const tabs = document.querySelectorAll('[id^="tab-project-"]');
+                            const panels = document.querySelectorAll('[id^="panel-project-"]');
+                            
+                            tabs.forEach((tab, index) => {
+                                tab.addEventListener('click', function() {
+                                    // 激活当前标签
+                                    tabs.forEach(t => {
+                                        // 移除所有激活状态的类
+                                        t.classList.remove('shadow-lg', 'transform', 'scale-105');
+                                        t.classList.add('shadow-md');
+                                    });
+                                    // 激活当前标签
+                                    tab.classList.add('shadow-lg', 'transform', 'scale-105');
+                                    tab.classList.remove('shadow-md');
+                                    
+                                    // 显示当前面板
+                                    panels.forEach(p => {
+                                        p.classList.add('hidden');
+                                        p.classList.remove('animate-fade-in');
+                                    });
+                                    panels[index].classList.remove('hidden');
+                                    panels[index].classList.add('animate-fade-in');
+                                });
+                            });
+                        });
+                    '''
+
+# 配置链接：(配置项, 按钮文字关键词)，按顺序应用，后者覆盖前者
+CONFIG_LINKS = [
+    ('resume_list_url', ('简历文件列表',)),
+    ('recruitment_info_url', ('招聘须知',)),
+    ('resume_pdf_url', ('简历下载', '下载简历')),
+    ('resume_job_pdf_url', ('求职版简历', '简历（求职）')),
+]
+
+# 各部分的注释标记，保存时移除
+SECTION_MARKERS = (
+    '<!-- 实习经历 -->', '<!-- 校园经历 -->', '<!-- 工作经历 -->', '<!-- 教育背景 -->',
+    '<!-- 个人项目 -->', '<!-- 专业技能 -->', '<!-- 自我评价 -->',
+)
+# 多余的空行
+BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+# 流式序列化时逐层展开的深度（html > body > section），更深的节点整体序列化为一个片段
+STREAM_DEPTH = 3
+# 序列化字符串时的片段大小
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def clean_html(html_content):
+    """移除各部分的注释标记和多余的空行"""
+    # 移除所有部分的注释标记
+    for marker in SECTION_MARKERS:
+        html_content = html_content.replace(marker, '')
+    
+    # 移除多余的空行
+    return BLANK_LINES_PATTERN.sub('\n\n', html_content)
+
+
+def iter_soup_chunks(node, soup, depth=0):
+    """
+    按节点流式序列化文档，输出与 str(soup) 拼接后完全一致
+    
+    前 STREAM_DEPTH 层的元素只输出开始和结束标签并展开子节点，更深的节点整体序列化
+    """
+    for child in node.contents:
+        if isinstance(child, Tag) and child.contents and depth < STREAM_DEPTH:
+            # 用同名同属性的空元素生成开始标签，保证属性的转义和引号与 BeautifulSoup 一致
+            closing = f'</{child.name}>'
+            yield soup.new_tag(child.name, attrs=child.attrs).decode()[:-len(closing)]
+            yield from iter_soup_chunks(child, soup, depth + 1)
+            yield closing
+        elif isinstance(child, Tag):
+            yield child.decode()
+        else:
+            yield child.output_ready('minimal')
+
+
+def iter_string_chunks(html_content, size=STREAM_CHUNK_SIZE):
+    """按换行切分字符串，注释标记不含换行，因此不会被切开"""
+    start = 0
+    while start < len(html_content):
+        end = html_content.find('\n', start + size)
+        end = len(html_content) if end == -1 else end + 1
+        yield html_content[start:end]
+        start = end
+
+
+def iter_clean_chunks(chunks):
+    """
+    流式版本的 clean_html：逐个片段移除注释标记并合并多余的空行
+    
+    要求每个注释标记完整地出现在同一个片段中（iter_soup_chunks 和 iter_string_chunks 均满足）；
+    片段末尾的空白可能与下一个片段的空白相连，保留到下一个片段一起处理
+    """
+    pending = ''
+    for chunk in chunks:
+        for marker in SECTION_MARKERS:
+            if marker in chunk:
+                chunk = chunk.replace(marker, '')
+        buffer = pending + chunk
+        end = len(buffer)
+        while end and buffer[end - 1].isspace():
+            end -= 1
+        pending = buffer[end:]
+        if end:
+            yield BLANK_LINES_PATTERN.sub('\n\n', buffer[:end])
+    if pending:
+        yield BLANK_LINES_PATTERN.sub('\n\n', pending)
+
+
+def read_template(template_path, output_path=None):
+    """
+    读取HTML模板，并按资源清单把静态资源引用改为带内容哈希的文件名（运行过 build_assets.py 时）
+    
+    Args:
+        template_path: 模板文件路径
+        output_path: 输出文件路径，资源地址相对其所在目录；为None时相对模板所在目录
+    """
+    with open(template_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return rewrite_references(content, os.path.dirname(os.path.abspath(output_path or template_path)))
+
+
+# 拼接模式扫描的元素：注释、脚本和样式整体跳过，其中的文本不会被当成标签
+SPLICE_TOKEN_PATTERN = re.compile(
+    r'<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>|<(/?)(section|footer)\b([^>]*)>', re.DOTALL | re.IGNORECASE)
+ID_ATTR_PATTERN = re.compile(r'''\bid\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''')
+# 拼接模式可以只更新自身部分的步骤：步骤名 -> (部分id, 决定部分是否存在的模型字段，None表示始终存在)
+SPLICE_STEPS = {
+    'update_personal_info': ('info', None),
+    'update_education': ('education', 'education'),
+    'update_experience': ('experience', 'experience'),
+    'update_work_experience': ('work', 'work_experience'),
+    'update_campus_experience': ('campus', 'campus_experience'),
+    'update_projects': ('projects', 'projects'),
+    'update_skills': ('skills', 'skills'),
+    'update_self_evaluation': ('self-evaluation', 'self_evaluation'),
+}
+# 拼接模式中始终重新渲染的页脚（最后更新时间）
+SPLICE_FOOTER = 'footer'
+# 并行渲染时页面其余部分中代替各部分的占位注释内容，使用私有区字符，不会与页面内容冲突
+FRAGMENT_SLOT = '\ue000{}\ue001'
+FRAGMENT_SLOT_PATTERN = re.compile('<!--\ue000([^\ue001]*)\ue001-->')
+
+
+def scan_ranges(html_content):
+    """
+    扫描顶层 <section> 和 <footer> 元素在页面中的位置，不构建DOM
+    
+    Returns:
+        {id（没有id时为标签名）: (起始位置, 结束位置)}，同一id只记录第一个
+    """
+    ranges = {}
+    stack = []
+    for match in SPLICE_TOKEN_PATTERN.finditer(html_content):
+        name = match.group(3)
+        if name is None:
+            continue
+        name = name.lower()
+        if not match.group(2):
+            stack.append((name, match.start(), match.group(4)))
+            continue
+        # 结束标签：找到对应的开始标签，忽略未闭合的元素
+        while stack:
+            open_name, start, attrs = stack.pop()
+            if open_name == name:
+                break
+        else:
+            continue
+        if not stack:
+            id_match = ID_ATTR_PATTERN.search(attrs)
+            key = next(value for value in id_match.groups() if value is not None) if id_match else name
+            ranges.setdefault(key, (start, match.end()))
+    return ranges
+
+# 可选的HTML解析器后端
+HTML_PARSERS = ('html.parser', 'lxml')
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_parser(name=None):
+    """
+    解析要使用的HTML解析器，lxml未安装时回退到html.parser
+    
+    Args:
+        name: 解析器名称（html.parser 或 lxml），为空时使用html.parser
+    
+    Returns:
+        实际可用的解析器名称
+    """
+    name = name or 'html.parser'
+    if name not in HTML_PARSERS:
+        print(f"✗ 不支持的HTML解析器 {name}，使用html.parser")
+        return 'html.parser'
+    if name == 'lxml':
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            print("✗ 未安装lxml，使用html.parser")
+            return 'html.parser'
+    return name
+
+
+# 影响渲染结果的源文件（与本脚本位于同一目录）
+RENDER_SOURCES = ('update_resume.py', 'resume_model.py', 'template_renderer.py')
+
+
+@functools.lru_cache(maxsize=None)
+def render_key(engine, parser=None):
+    """
+    渲染代码和渲染方式的摘要，变化时增量缓存失效，重新生成所有部分
+    
+    Args:
+        engine: 渲染方式（soup 或 template）
+        parser: 命令行指定的HTML解析器（配置文件中的设置由配置文件哈希覆盖）
+    
+    Returns:
+        本脚本、数据模型、预编译模板的源码，渲染方式、解析器和 BeautifulSoup、markdown 版本的哈希
+    """
+    digest = hashlib.sha1()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in RENDER_SOURCES:
+        with open(os.path.join(directory, name), 'rb') as f:
+            digest.update(f.read())
+    inputs = [engine, parser, bs4.__version__, markdown.__version__]
+    digest.update(json.dumps(inputs).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def parse_fragment(markup, parser='html.parser'):
+    """
+    解析HTML片段，返回顶层节点列表
+    
+    lxml会自动补全html/body，这里只取body中的内容，
+    保证不同解析器插入到页面中的节点一致
+    """
+    return fragment_contents(BeautifulSoup(markup, parser), parser)
+
+
+def fragment_contents(fragment, parser='html.parser'):
+    """片段解析结果的顶层节点（lxml补全的html/body不计入）"""
+    if parser != 'html.parser' and fragment.body is not None:
+        return list(fragment.body.contents)
+    return list(fragment.contents)
+
+
+# 共享的Markdown转换器，每次转换前重置，避免重复创建实例和加载扩展
+MARKDOWN_ENGINE = markdown.Markdown()
+# Markdown片段缓存的最大条目数
+MARKDOWN_CACHE_SIZE = 256
+# (描述内容哈希, 解析器) -> 解析后的顶层节点列表，按最近使用顺序排列
+MARKDOWN_FRAGMENT_CACHE = collections.OrderedDict()
+
+
+def convert_markdown(text):
+    """使用共享的Markdown转换器将文本转换为HTML"""
+    return MARKDOWN_ENGINE.reset().convert(text)
+
+
+def parsed_markdown(text, parser='html.parser'):
+    """
+    将Markdown转换并解析为节点列表，结果按内容哈希缓存（LRU）
+    
+    返回的节点由缓存持有，只能读取；需要插入页面时使用 markdown_fragment
+    """
+    key = (hashlib.sha1(text.encode('utf-8')).hexdigest(), parser)
+    nodes = MARKDOWN_FRAGMENT_CACHE.get(key)
+    if nodes is not None:
+        MARKDOWN_FRAGMENT_CACHE.move_to_end(key)
+        return nodes
+    nodes = parse_fragment(convert_markdown(text), parser)
+    MARKDOWN_FRAGMENT_CACHE[key] = nodes
+    if len(MARKDOWN_FRAGMENT_CACHE) > MARKDOWN_CACHE_SIZE:
+        MARKDOWN_FRAGMENT_CACHE.popitem(last=False)
+    return nodes
+
+
+def markdown_fragment(text, parser='html.parser'):
+    """返回Markdown片段节点的副本，可直接插入到页面中"""
+    return [clone_node(node) for node in parsed_markdown(text, parser)]
+
+
+def copy_tag(tag):
+    """
+    复制单个元素（不含子元素）
+
+    Tag.copy_self 在 BeautifulSoup 4.13 加入；更早的版本使用 copy.copy 复制后丢弃复制出的子元素
+    """
+    if hasattr(tag, 'copy_self'):
+        return tag.copy_self()
+    new = copy.copy(tag)
+    new.contents = []
+    new.next_element = new.next_sibling = new.previous_sibling = None
+    return new
+
+
+def copy_linked(node, parent=None, previous=None, record=None, slots=None):
+    """
+    复制节点及其子树，并直接建立父子、兄弟和前后元素链接
+
+    copy.copy 和逐个 append 每插入一个节点都要重新查找和修正链接，
+    新建的子树结构已知，这里一次性连好，插入页面时只需要一次 append
+
+    Args:
+        node: 要复制的节点
+        parent: 副本的父节点
+        previous: 副本之前的元素（文档顺序）
+        record: 填充占位文本的记录（字段为None时填充空字符串）
+        slots: {id(占位文本节点): 字段名}
+
+    Returns:
+        (副本, 子树中最后一个节点)
+    """
+    if isinstance(node, Tag):
+        new = copy_tag(node)
+    else:
+        field = slots.get(id(node)) if slots else None
+        if field is None:
+            value = node
+        else:
+            value = record[field]
+            if value is None:
+                value = ''
+        new = type(node)(value)
+        new.next_element = new.next_sibling = new.previous_sibling = None
+    new.parent = parent
+    new.previous_element = previous
+    if previous is not None:
+        previous.next_element = new
+    last = new
+    if isinstance(node, Tag):
+        previous_child = None
+        for child in node.contents:
+            child_copy, last = copy_linked(child, new, last, record, slots)
+            child_copy.previous_sibling = previous_child
+            if previous_child is not None:
+                previous_child.next_sibling = child_copy
+            new.contents.append(child_copy)
+            previous_child = child_copy
+    return new, last
+
+
+def clone_node(node):
+    """复制一个节点（含子树），副本不属于任何文档"""
+    return copy_linked(node)[0]
+
+
+# 原型中的占位文本，例如 {company}
+PROTOTYPE_SLOT_PATTERN = re.compile(r'^\{(\w+)\}$')
+
+
+class Prototype:
+    """
+    预构建的节点原型
+
+    HTML片段只解析一次，之后每条记录克隆一份，不再逐个 new_tag 和设置 class。
+    文本为 {字段名} 的节点是占位符，克隆时替换为记录中的字段值
+    """
+
+    def __init__(self, markup):
+        """
+        Args:
+            markup: 只有一个根元素的HTML片段，标签之间不能有空白
+        """
+        self.root = BeautifulSoup(markup, 'html.parser').find()
+        # id(占位文本节点) -> 字段名
+        self.slots = {}
+        for text in self.root.find_all(string=True):
+            match = PROTOTYPE_SLOT_PATTERN.match(text)
+            if match:
+                self.slots[id(text)] = match.group(1)
+
+    def clone(self, record=None, attrs=None):
+        """
+        克隆原型
+
+        Args:
+            record: 填充占位符的记录（字典或 resume_model 中的记录）
+            attrs: 覆盖根元素的属性，如 {'id': ...}；原型中先写出该属性可以保持属性顺序
+
+        Returns:
+            克隆得到的根元素
+        """
+        node = copy_linked(self.root, record=record, slots=self.slots)[0]
+        if attrs:
+            node.attrs.update(attrs)
+        return node
+
+
+# 导航链接样式
+NAV_LINK_CLASS = ['text-medium', 'hover:text-primary', 'transition-colors', 'duration-300']
+
+# 各部分通用的原型
+CONTAINER_PROTOTYPE = Prototype('<div class="container mx-auto px-4"></div>')
+SECTION_TITLE_PROTOTYPE = Prototype('<div class="text-center mb-12"><h2 class="text-3xl font-bold mb-2">{title}</h2>'
+                                    '<div class="w-20 h-1 bg-primary mx-auto"></div></div>')
+CONTENT_PROTOTYPE = Prototype('<div class="max-w-4xl mx-auto"></div>')
+TAB_BAR_PROTOTYPE = Prototype('<div class="mb-8"><div class="flex justify-center gap-4 p-2"></div></div>')
+TAB_WRAPPER_PROTOTYPE = Prototype('<div class="bg-white rounded-xl shadow-lg overflow-hidden border border-gray-100"></div>')
+TAB_PANEL_PROTOTYPE = Prototype('<div id="" class="p-8 animate-fade-in"></div>')
+HIDDEN_TAB_PANEL_PROTOTYPE = Prototype('<div id="" class="p-8 hidden animate-fade-in"></div>')
+RECORD_LIST_PROTOTYPE = Prototype('<div class="space-y-4"></div>')
+
+
+@functools.lru_cache(maxsize=None)
+def tab_button_prototype(icon, color, active):
+    """标签按钮原型，按 图标、颜色、是否选中 缓存"""
+    ring = f'focus:ring-{color.replace("bg-", "")}/20'
+    if active:
+        classes = ['w-16', 'h-16', 'rounded-full', color, 'text-white', 'flex', 'items-center', 'justify-center',
+                   'shadow-lg', 'transition-all', 'duration-300', 'transform', 'scale-105', 'focus:outline-none',
+                   'focus:ring-2', ring]
+    else:
+        classes = ['w-16', 'h-16', 'rounded-full', color, 'text-white', 'flex', 'items-center', 'justify-center',
+                   'shadow-md', f'hover:{color}/80', 'transition-all', 'duration-300', 'focus:outline-none',
+                   'focus:ring-2', ring]
+    return Prototype(f'<button id="" class="{" ".join(classes)}"><i class="fa {icon} text-xl"></i></button>')
+
+
+@dataclasses.dataclass(frozen=True)
+class SectionSchema:
+    """
+    经历类部分（实习/工作/校园经历、个人项目）的声明式描述
+
+    ResumeUpdater.update_record_section 按描述统一完成 移除/新建部分、渲染记录、补充导航链接，
+    新增同类部分只需要增加一个描述
+    """
+    # 标题，同时用于提示信息和导航链接文字
+    title: str
+    section_id: str
+    # ResumeModel 中的记录列表字段
+    model_field: str
+    # 注释标记，移除部分时一并移除
+    marker: str = None
+    # True：找不到部分时新建并清空重建；False：只更新模板中已有的部分，保留其中的标题
+    create: bool = True
+    # 新建部分时的背景样式
+    background: tuple = ()
+    # 新建部分的插入位置 ((部分id, 'after' 或 'before'), ...)，使用第一个存在的
+    anchors: tuple = ()
+    # 导航链接插入到这些链接中第一个存在的之后
+    nav_after: tuple = ()
+    # tabs：多条记录使用标签栏、一条记录使用卡片；list：逐条列出
+    layout: str = 'tabs'
+    # 记录卡片（tabs）或列表项（list）
+    card: Prototype = None
+    # 记录标题行，记录中缺少 header_fields 任一字段时不显示
+    header: Prototype = None
+    header_fields: tuple = ()
+    # list 布局中有描述时追加的说明
+    detail: Prototype = None
+    # 标签按钮和面板的id前缀、按钮图标、切换脚本
+    tab_name: str = None
+    tab_icon: str = None
+    tab_script: str = None
+
+
+# 实习经历和工作经历共用的记录标题行：公司、时间、职位
+EXPERIENCE_HEADER_PROTOTYPE = Prototype(
+    '<div class="flex flex-col md:flex-row justify-between items-start md:items-center mb-6">'
+    '<div class="font-semibold text-xl mb-4 md:mb-0">{company}</div>'
+    '<div class="text-primary font-medium mb-4 md:mb-0 flex items-center gap-2"><i class="fa fa-calendar text-primary"></i>{time}</div>'
+    '<div class="text-medium bg-primary/10 text-primary px-4 py-2 rounded-full text-sm">{position}</div></div>')
+EXPERIENCE_CARD_PROTOTYPE = Prototype(
+    '<div class="bg-white rounded-xl p-8 shadow-lg overflow-hidden border border-gray-100 mb-8"></div>')
+
+EXPERIENCE_SCHEMA = SectionSchema(
+    title='实习经历', section_id='experience', model_field='experience', marker='<!-- 实习经历 -->',
+    background=('py-20', 'bg-gradient-to-r', 'from-green-50', 'to-teal-50'),
+    anchors=(('education', 'after'), ('info', 'after')), nav_after=('education',),
+    card=EXPERIENCE_CARD_PROTOTYPE, header=EXPERIENCE_HEADER_PROTOTYPE, header_fields=('company', 'time', 'position'),
+    tab_name='experience', tab_icon='fa-briefcase', tab_script=EXPERIENCE_TAB_SCRIPT,
+)
+
+WORK_SCHEMA = SectionSchema(
+    title='工作经历', section_id='work', model_field='work_experience', marker='<!-- 工作经历 -->',
+    background=('py-20', 'bg-gradient-to-r', 'from-blue-50', 'to-indigo-50'),
+    anchors=(('experience', 'after'), ('campus', 'before')), nav_after=('experience',),
+    card=EXPERIENCE_CARD_PROTOTYPE, header=EXPERIENCE_HEADER_PROTOTYPE, header_fields=('company', 'time', 'position'),
+    tab_name='work', tab_icon='fa-briefcase', tab_script=WORK_TAB_SCRIPT,
+)
+
+CAMPUS_SCHEMA = SectionSchema(
+    title='校园经历', section_id='campus', model_field='campus_experience', marker='<!-- 校园经历 -->',
+    background=('py-20', 'bg-gradient-to-r', 'from-yellow-50', 'to-orange-50'),
+    anchors=(('experience', 'after'), ('education', 'after'), ('info', 'after')), nav_after=('experience', 'education'),
+    layout='list',
+    card=Prototype('<div class="bg-white rounded-lg p-4 shadow-sm hover:shadow-md transition-shadow duration-300">'
+                   '<div class="flex justify-between items-center mb-2">'
+                   '<div class="font-medium">{activity}</div><div class="text-primary">{time}</div></div></div>'),
+    detail=Prototype('<p class="text-medium text-sm">{description}</p>'),
+)
+
+PROJECTS_SCHEMA = SectionSchema(
+    title='个人项目', section_id='projects', model_field='projects', marker='<!-- 个人项目 -->', create=False,
+    card=Prototype('<div class="bg-white rounded-xl p-6 shadow-sm card-hover"></div>'),
+    header=Prototype('<div class="flex flex-col md:flex-row justify-between items-start md:items-center mb-4">'
+                     '<div class="font-semibold text-lg mb-2 md:mb-0">{name}</div>'
+                     '<div class="text-primary font-medium mb-2 md:mb-0">{time}</div></div>'),
+    header_fields=('name', 'time'),
+    tab_name='project', tab_icon='fa-code', tab_script=PROJECT_TAB_SCRIPT,
+)
+
+# 由部分描述驱动的更新步骤：步骤名 -> SectionSchema
+SECTION_SCHEMAS = {
+    'update_experience': EXPERIENCE_SCHEMA,
+    'update_work_experience': WORK_SCHEMA,
+    'update_campus_experience': CAMPUS_SCHEMA,
+    'update_projects': PROJECTS_SCHEMA,
+}
+
+class ElementIndex:
+    """
+    页面元素索引
+    
+    一次遍历建立按 id、标签名、class组合、href 查找元素，以及按注释标记查找文本节点的表，
+    代替各个更新步骤中重复的 find / find_all 全树遍历。之后被删除或移出文档的节点在查找时跳过；
+    新建的部分和导航链接通过 add 加入索引
+    """
+    
+    def __init__(self, soup):
+        self.soup = soup
+        self.by_id = {}
+        self.by_tag = collections.defaultdict(list)
+        self.by_class = collections.defaultdict(list)
+        self.by_href = collections.defaultdict(list)
+        # 注释标记 -> 包含该标记的文本节点
+        self.markers = collections.defaultdict(list)
+        # 链接元素 -> 链接文字，首次按文字查找时计算
+        self.link_texts = None
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                self.add(node)
+            elif '<!--' in node:
+                for marker in SECTION_MARKERS:
+                    if marker in node:
+                        self.markers[marker].append(node)
+    
+    def add(self, tag):
+        """将元素（不含其子元素）加入索引"""
+        self.by_tag[tag.name].append(tag)
+        element_id = tag.get('id')
+        if element_id is not None and self.by_id.get(element_id) is None:
+            self.by_id[element_id] = tag
+        classes = tag.get('class')
+        if classes:
+            self.by_class[(tag.name,) + tuple(classes)].append(tag)
+        if tag.name == 'a':
+            href = tag.get('href')
+            if href is not None:
+                self.by_href[href].append(tag)
+            if self.link_texts is not None:
+                self.link_texts.append((tag, tag.get_text()))
+    
+    def attached(self, node, ancestor=None):
+        """节点是否仍在文档中（指定ancestor时还要求位于其内部）"""
+        ancestor = ancestor or self.soup
+        # decompose 之后节点的属性已被清空
+        if node.decomposed:
+            return False
+        while node is not None:
+            if node is ancestor:
+                return True
+            node = node.parent
+        return False
+    
+    def first(self, candidates, within=None):
+        """返回仍在文档中（且位于within内）的第一个候选元素"""
+        for node in candidates:
+            if self.attached(node, within):
+                return node
+        return None
+    
+    def get(self, element_id, name=None):
+        """按id查找元素，相当于 soup.find(name, id=element_id)"""
+        tag = self.by_id.get(element_id)
+        if tag is not None and (name is None or tag.name == name) and self.attached(tag):
+            return tag
+        if name is None:
+            return None
+        # 同一id有多个元素或第一个已被删除时，在同名标签中查找
+        for tag in self.by_tag.get(name, ()):
+            if self.attached(tag) and tag.get('id') == element_id:
+                return tag
+        return None
+    
+    def find(self, name):
+        """按标签名查找第一个元素，相当于 soup.find(name)"""
+        return self.first(self.by_tag.get(name, ()))
+    
+    def find_class(self, name, classes):
+        """按完整的class组合查找元素，相当于 soup.find_all(name, class_='a b c')"""
+        return [tag for tag in self.by_class.get((name,) + tuple(classes.split()), ()) if self.attached(tag)]
+    
+    def find_having_class(self, name, predicate, within=None):
+        """按单个class查找第一个元素，相当于 soup.find(name, class_=predicate)（predicate 作用于每个class）"""
+        for tag in self.by_tag.get(name, ()):
+            if any(predicate(value) for value in tag.get('class') or ()) and self.attached(tag, within):
+                return tag
+        return None
+    
+    def link(self, href, within=None):
+        """按href查找链接，within 为导航栏等容器"""
+        if within is None:
+            return None
+        return self.first(self.by_href.get(href, ()), within)
+    
+    def links_containing(self, *words):
+        """链接文字包含任一关键词的所有链接（文档顺序）"""
+        if self.link_texts is None:
+            self.link_texts = [(tag, tag.get_text()) for tag in self.by_tag.get('a', ())]
+        return [tag for tag, text in self.link_texts
+                if any(word in text for word in words) and self.attached(tag)]
+    
+    def marked_strings(self, marker):
+        """包含注释标记的文本节点（marker 为 SECTION_MARKERS 之一，其他标记不建立索引）"""
+        return [node for node in self.markers.get(marker, ()) if self.attached(node)]
+    
+    def navs(self):
+        """导航栏和移动端导航栏"""
+        return (self.find('nav'), self.get('mobile-menu', 'div'))
+
+
+def remove_section(index, section_id, marker=None):
+    """移除部分及其导航链接（含移动端）和注释标记"""
+    section = index.get(section_id, 'section')
+    if section:
+        section.decompose()
+    for nav in index.navs():
+        if nav:
+            link = index.link('#' + section_id, nav)
+            if link:
+                link.decompose()
+    if marker:
+        for comment in index.marked_strings(marker):
+            comment.extract()
+
+
+def ensure_section(index, section_id, classes, anchors):
+    """找不到部分时新建，并插入到第一个存在的锚点位置"""
+    section = index.get(section_id, 'section')
+    if not section:
+        section = index.soup.new_tag('section')
+        section['id'] = section_id
+        section['class'] = list(classes)
+        for anchor_id, where in anchors:
+            anchor = index.get(anchor_id, 'section')
+            if anchor:
+                if where == 'after':
+                    anchor.insert_after(section)
+                else:
+                    anchor.insert_before(section)
+                index.add(section)
+                break
+    return section
+
+
+def ensure_nav_link(index, section_id, text, after_ids):
+    """导航栏（含移动端）中缺少该部分链接时，插入到第一个存在的链接之后"""
+    for nav in index.navs():
+        if not nav or index.link('#' + section_id, nav):
+            continue
+        for after_id in after_ids:
+            after_link = index.link('#' + after_id, nav)
+            if after_link:
+                link = index.soup.new_tag('a')
+                link['href'] = '#' + section_id
+                link['class'] = list(NAV_LINK_CLASS)
+                link.string = text
+                after_link.insert_after(link)
+                index.add(link)
+                break
+
+
+class StageProfiler:
+    """按阶段记录耗时、CPU时间和内存峰值（--profile）"""
+    
+    def __init__(self, trace_memory=True):
+        """
+        初始化性能分析器
+        
+        Args:
+            trace_memory: 是否使用tracemalloc记录内存峰值（会使执行变慢）
+        """
+        self.trace_memory = trace_memory
+        self.records = []
+        # 正在执行的阶段，用于嵌套阶段之间传递内存峰值
+        self.stack = []
+        self.origin = time.perf_counter()
+    
+    def start(self):
+        """开始记录"""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.origin = time.perf_counter()
+    
+    def stop(self):
+        """停止记录"""
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+    
+    @contextlib.contextmanager
+    def stage(self, name):
+        """记录一个阶段，阶段可以嵌套"""
+        record = {'name': name, 'depth': len(self.stack)}
+        self.stack.append(record)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            wall_end = time.perf_counter()
+            cpu_end = time.process_time()
+            self.stack.pop()
+            record['start_ms'] = (wall_start - self.origin) * 1000
+            record['wall_ms'] = (wall_end - wall_start) * 1000
+            record['cpu_ms'] = (cpu_end - cpu_start) * 1000
+            if self.trace_memory:
+                # 子阶段会重置峰值，这里取自身和子阶段峰值中的较大者
+                peak = max(tracemalloc.get_traced_memory()[1], record.pop('child_peak', 0))
+                record['peak_kb'] = peak / 1024
+                if self.stack:
+                    parent = self.stack[-1]
+                    parent['child_peak'] = max(parent.get('child_peak', 0), peak)
+            self.records.append(record)
+    
+    def to_json(self):
+        """按开始时间排序的阶段记录"""
+        return sorted(self.records, key=lambda record: record['start_ms'])
+    
+    def to_trace_events(self):
+        """转换为 Chrome trace-event 格式（可在 chrome://tracing 或 Perfetto 中查看）"""
+        events = []
+        for record in self.to_json():
+            args = {'cpu_ms': round(record['cpu_ms'], 3)}
+            if 'peak_kb' in record:
+                args['peak_kb'] = round(record['peak_kb'], 1)
+            events.append({
+                'name': record['name'],
+                'cat': 'update_resume',
+                'ph': 'X',
+                'ts': round(record['start_ms'] * 1000, 1),
+                'dur': round(record['wall_ms'] * 1000, 1),
+                'pid': os.getpid(),
+                'tid': 0,
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    
+    def save(self, prefix):
+        """
+        保存分析结果
+        
+        Args:
+            prefix: 输出文件前缀，生成 <prefix>.json 和 <prefix>.trace.json
+        
+        Returns:
+            (JSON文件路径, trace文件路径)
+        """
+        json_path = prefix + '.json'
+        trace_path = prefix + '.trace.json'
+        os.makedirs(os.path.dirname(os.path.abspath(prefix)), exist_ok=True)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'stages': self.to_json()}, f, ensure_ascii=False, indent=2)
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_trace_events(), f, ensure_ascii=False)
+        return json_path, trace_path
+    
+    def print_summary(self):
+        """输出各阶段的耗时表格"""
+        print(f"\n=== 性能分析 ===\n{'阶段':36s}{'耗时':>10s}{'CPU':>11s}{'内存峰值':>10s}")
+        for record in self.to_json():
+            name = '  ' * record['depth'] + record['name']
+            peak = f"{record['peak_kb']:9.1f} KB" if 'peak_kb' in record else ''
+            print(f"{name:38s}{record['wall_ms']:9.2f} ms{record['cpu_ms']:9.2f} ms{peak}")
+
 class ResumeUpdater:
     """简历更新器类"""
     
-    def __init__(self, resume_path, html_path, config_path=None):
+    def __init__(self, resume_path, html_path, config_path=None, template_path=None, cache_path=None, parser=None,
+                 model_cache_dir=None, splice=False, parallel=False, workers=None, model_cache_size=MAX_CACHE_FILES):
         """
         初始化简历更新器
         
         Args:
             resume_path: 简历Markdown文件路径
-            html_path: HTML网页文件路径
+            html_path: HTML网页文件路径（输出）
             config_path: 配置文件路径
+            template_path: HTML模板文件路径，默认与html_path相同
+            cache_path: 增量更新缓存文件路径
+            parser: HTML解析器（html.parser 或 lxml），为空时读取配置文件中的html_parser
+            model_cache_dir: 简历数据模型缓存目录，默认 .workers/.resume_model_cache
+            splice: 拼接模式，只重新渲染发生变化的部分，其余内容原样复制
+            parallel: 并行渲染，各部分在进程池中分别渲染为独立片段，再按页面顺序拼接
+            workers: 并行渲染的进程数，默认CPU核数
+            model_cache_size: 简历数据模型缓存目录中最多保留的文件数
         """
         self.resume_path = resume_path
         self.html_path = html_path
+        self.template_path = template_path or html_path
         # 明确配置文件路径
-        self.config_path = config_path or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.yaml')
+        self.config_path = config_path or os.path.join(PROJECT_ROOT, 'config.yaml')
+        self.cache_path = cache_path or os.path.join(PROJECT_ROOT, '.workers', '.update_resume_cache.json')
+        self.parser = parser
+        self.model_cache_dir = model_cache_dir
+        self.model_cache_size = model_cache_size
+        self.splice = splice
+        self.parallel = parallel
+        self.workers = workers
         self.resume_content = ""
+        # 章节索引：标题 -> (正文起始偏移, 正文结束偏移)
+        self.sections = {}
+        # 解析后的简历数据模型（ResumeModel）
+        self.model = None
         self.html_content = ""
         self.soup = None
+        # 当前页面的元素索引（ElementIndex），页面重新加载后重建
+        self.index = None
         self.config = {}
+        # 最近一次保存的HTML内容哈希
+        self.html_hash = None
+        # 当前渲染代码和渲染方式的摘要（render_key）
+        self.render_hash = None
+        # 性能分析器（StageProfiler），为None时不记录
+        self.profiler = None
     
     def load_resume(self):
         """加载并解析简历Markdown文件"""
         try:
             with open(self.resume_path, 'r', encoding='utf-8') as f:
                 self.resume_content = f.read()
+            self.build_section_index()
+            self.model = None
             print("✓ 成功加载简历文件")
             return True
         except Exception as e:
             print(f"✗ 加载简历文件失败: {e}")
             return False
     
-    def load_config(self):
-        """加载配置文件"""
+    def build_section_index(self):
+        """一次扫描简历内容，建立二级标题到正文区间的索引"""
+        self.sections = {}
+        matches = list(SECTION_HEADING_PATTERN.finditer(self.resume_content))
+        # 第一个标题之前的内容（姓名、联系方式等）
+        preamble_end = matches[0].start() if matches else len(self.resume_content)
+        self.sections[''] = (0, preamble_end)
+        for i, match in enumerate(matches):
+            # 正文从标题行的换行符之后开始，到下一个标题为止
+            start = min(match.end() + 1, len(self.resume_content))
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(self.resume_content)
+            title = match.group(1)
+            # 同名标题只保留第一次出现的位置
+            if title not in self.sections:
+                self.sections[title] = (start, end)
+        return self.sections
+    
+    def get_section(self, title):
+        """根据章节索引获取章节正文，不存在时返回None"""
+        span = self.sections.get(title)
+        if span is None:
+            return None
+        return self.resume_content[span[0]:span[1]]
+    
+    def load_model(self):
+        """读取简历数据模型：优先使用按内容哈希缓存的结果，没有缓存时执行提取并保存"""
+        self.model = load_cached_model(self.resume_content, self.model_cache_dir)
+        if self.model is None:
+            self.model = ResumeModel.from_updater(self)
+            save_cached_model(self.resume_content, self.model, self.model_cache_dir, self.model_cache_size)
+        return self.model
+    
+    def resume_model(self):
+        """返回简历数据模型，尚未读取时先读取"""
+        if self.model is None:
+            return self.load_model()
+        return self.model
+    
+    def element_index(self):
+        """返回当前页面的元素索引，尚未建立或页面已重新加载时先建立"""
+        if self.index is None or self.index.soup is not self.soup:
+            self.index = ElementIndex(self.soup)
+        return self.index
+    
+    def load_config(self, config=None):
+        """加载配置文件，传入config时直接使用已加载的配置"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            if config is not None:
+                self.config = copy.deepcopy(config)
+            else:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    self.config = yaml.safe_load(f)
             print("✓ 成功加载配置文件")
             return True
         except Exception as e:
@@ -71,12 +1154,18 @@ class ResumeUpdater:
             print(f"✗ 更新最后更新时间失败: {e}")
             return False
     
-    def load_html(self):
-        """加载HTML文件"""
+    def html_parser(self):
+        """当前使用的HTML解析器：命令行参数优先，其次是配置文件中的html_parser"""
+        return resolve_parser(self.parser or (self.config or {}).get('html_parser'))
+    
+    def load_html(self, html_content=None):
+        """加载HTML文件，传入html_content时直接使用已读取的模板内容"""
         try:
-            with open(self.html_path, 'r', encoding='utf-8') as f:
-                self.html_content = f.read()
-            self.soup = BeautifulSoup(self.html_content, 'html.parser')
+            if html_content is not None:
+                self.html_content = html_content
+            else:
+                self.html_content = read_template(self.template_path, self.html_path)
+            self.soup = BeautifulSoup(self.html_content, self.html_parser())
             print("✓ 成功加载HTML文件")
             return True
         except Exception as e:
@@ -87,50 +1176,56 @@ class ResumeUpdater:
         """提取个人基本信息"""
         info = {}
         
-        # 提取姓名
-        name_match = re.search(r'<h1[^>]*>(.*?)</h1>', self.resume_content)
+        # 提取姓名和联系方式（位于第一个标题之前）
+        preamble = self.get_section('') or ''
+        name_match = re.search(r'<h1[^>]*>(.*?)</h1>', preamble)
         if name_match:
             info['name'] = name_match.group(1).strip()
         
         # 提取联系方式
-        contact_match = re.search(r'> 电话：`(.*?)`&emsp;\|&emsp;邮箱：\[(.*?)\]', self.resume_content)
+        contact_match = re.search(r'> 电话：`(.*?)`&emsp;\|&emsp;邮箱：\[(.*?)\]', preamble)
         if contact_match:
             info['phone'] = contact_match.group(1).strip()
             info['email'] = contact_match.group(2).strip()
         
         # 提取基本信息
-        basic_info_match = re.search(r'## 基本信息\n\n(.*?)## 教育背景', self.resume_content, re.DOTALL)
-        if basic_info_match:
-            basic_info = basic_info_match.group(1).strip()
+        basic_info = self.get_section('基本信息')
+        if basic_info is not None:
+            basic_info = basic_info.strip()
+            
+            # 一次扫描提取性别、年龄、民族、籍贯，每个字段只取第一次出现的值
+            fields = {}
+            for field_match in BASIC_FIELD_PATTERN.finditer(basic_info):
+                if field_match.group(1) not in fields:
+                    fields[field_match.group(1)] = field_match
             
-            # 使用更简单的方法提取基本信息
             # 提取性别
-            if '性别：' in basic_info:
-                gender_part = basic_info.split('性别：')[1].split('&emsp;')[0].strip()
+            if '性别' in fields:
+                gender_part = fields['性别'].group(2).split('&emsp;')[0].strip()
                 if gender_part:
                     info['gender'] = gender_part
                 else:
                     # 如果性别为空，尝试从下一行提取
-                    next_part = basic_info.split('性别：')[1].split('\n')[1].strip()
+                    next_part = basic_info[fields['性别'].end() + 1:].split('\n')[0].strip()
                     if next_part.startswith('民族：'):
                         # 性别确实为空
                         info['gender'] = '男'  # 默认值，根据实际情况修改
             
             # 提取年龄
-            if '年龄：' in basic_info:
-                age_part = basic_info.split('年龄：')[1].split('\n')[0].strip()
+            if '年龄' in fields:
+                age_part = fields['年龄'].group(2).strip()
                 if age_part:
                     info['age'] = age_part
             
             # 提取民族
-            if '民族：' in basic_info:
-                nation_part = basic_info.split('民族：')[1].split('&emsp;')[0].strip()
+            if '民族' in fields:
+                nation_part = fields['民族'].group(2).split('&emsp;')[0].strip()
                 if nation_part:
                     info['nation'] = nation_part
             
             # 提取籍贯
-            if '籍贯：' in basic_info:
-                origin_part = basic_info.split('籍贯：')[1].split('\n')[0].strip()
+            if '籍贯' in fields:
+                origin_part = fields['籍贯'].group(2).strip()
                 if origin_part:
                     # 移除多余的空格
                     origin_part = origin_part.replace('  ', ' ')
@@ -155,9 +1250,9 @@ class ResumeUpdater:
     
     def update_personal_info(self):
         """更新个人基本信息"""
-        info = self.extract_personal_info()
+        info = self.resume_model().personal_info
         # 提取教育背景信息
-        education_list = self.extract_education()
+        education_list = self.resume_model().education
         
         if not info:
             print("✗ 未提取到个人信息")
@@ -166,12 +1261,12 @@ class ResumeUpdater:
         try:
             # 更新姓名
             if 'name' in info:
-                name_elem = self.soup.find('h1', class_='text-4xl')
+                name_elem = self.element_index().find_having_class('h1', lambda value: value == 'text-4xl')
                 if name_elem:
                     name_elem.string = info['name']
             
             # 更新联系方式
-            contact_elems = self.soup.find_all('div', class_='flex items-center gap-2 text-medium')
+            contact_elems = self.element_index().find_class('div', 'flex items-center gap-2 text-medium')
             for elem in contact_elems:
                 icon = elem.find('i')
                 if icon:
@@ -196,7 +1291,7 @@ class ResumeUpdater:
                             a['href'] = info['github']
             
             # 更新基本信息表格
-            info_grid = self.soup.find('div', class_=lambda x: x and 'grid' in x)
+            info_grid = self.element_index().find_having_class('div', lambda value: 'grid' in value)
             if info_grid:
                 # 只查找直接子元素
                 info_items = info_grid.find_all('div', recursive=False)
@@ -284,12 +1379,12 @@ class ResumeUpdater:
         education_list = []
         
         # 提取教育背景
-        edu_match = re.search(r'## 教育背景\n\n(.*?)## 实习经历', self.resume_content, re.DOTALL)
-        if edu_match:
-            edu_content = edu_match.group(1).strip()
+        edu_content = self.get_section('教育背景')
+        if edu_content is not None:
+            edu_content = edu_content.strip()
             
             # 分割教育背景记录 - 按<div style="display: flex; justify-content: space-between; align-items: center;">分割
-            edu_records = edu_content.split('<div style="display: flex; justify-content: space-between; align-items: center;">')
+            edu_records = edu_content.split(RECORD_SEPARATOR)
             
             # 跳过第一个空字符串（因为分割后第一个元素是空的）
             for i, record in enumerate(edu_records[1:]):
@@ -301,9 +1396,9 @@ class ResumeUpdater:
                     # 匹配格式： <div style="flex: 1; text-align: left;"><b>时间</b></div>
                     # 匹配格式： <div style="flex: 1; text-align: center;"><b>学校</b></div>
                     # 匹配格式： <div style="flex: 1; text-align: right;"><b>专业</b></div>
-                    time_match = re.search(r'<div style="flex: 1; text-align: left;"><b>(.*?)</b></div>', record)
-                    school_match = re.search(r'<div style="flex: 1; text-align: center;"><b>(.*?)</b></div>', record)
-                    major_match = re.search(r'<div style="flex: 1; text-align: right;"><b>(.*?)</b></div>', record)
+                    time_match = EDU_TIME_PATTERN.search(record)
+                    school_match = EDU_SCHOOL_PATTERN.search(record)
+                    major_match = EDU_MAJOR_PATTERN.search(record)
                     
                     if time_match:
                         education['time'] = time_match.group(1).strip()
@@ -336,34 +1431,17 @@ class ResumeUpdater:
     
     def update_education(self):
         """更新教育背景信息"""
-        education_list = self.extract_education()
+        education_list = self.resume_model().education
         
         if not education_list:
             print("✗ 未提取到教育背景信息，不加载该部分")
-            # 如果没有教育背景，移除网页中的教育背景部分
-            edu_section = self.soup.find('section', id='education')
-            if edu_section:
-                edu_section.decompose()
-            # 移除导航栏中的教育背景链接
-            nav = self.soup.find('nav')
-            if nav:
-                edu_link = nav.find('a', href='#education')
-                if edu_link:
-                    edu_link.decompose()
-            # 移除移动端导航栏中的教育背景链接
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                mobile_edu_link = mobile_nav.find('a', href='#education')
-                if mobile_edu_link:
-                    mobile_edu_link.decompose()
-            # 移除教育背景的注释标记
-            for comment in self.soup.find_all(text=lambda text: isinstance(text, str) and '<!-- 教育背景 -->' in text):
-                comment.extract()
+            # 如果没有教育背景，移除网页中的教育背景部分及其导航链接和注释标记
+            remove_section(self.element_index(), 'education', '<!-- 教育背景 -->')
             return True
         
         try:
             # 更新教育背景卡片
-            edu_section = self.soup.find('section', id='education')
+            edu_section = self.element_index().get('education', 'section')
             if edu_section:
                 # 完全清空教育背景部分的内容
                 edu_section.clear()
@@ -403,7 +1481,7 @@ class ResumeUpdater:
                     tab_container.append(tab_buttons)
                     
                     # 定义多彩颜色
-                    colors = ['bg-blue-500', 'bg-green-500', 'bg-purple-500', 'bg-pink-500', 'bg-yellow-500', 'bg-orange-500', 'bg-teal-500']
+                    colors = TAB_COLORS
                     
                     # 创建标签按钮
                     tabs = []
@@ -578,113 +1656,30 @@ class ResumeUpdater:
                         course_container2.append(course_grid2)
                         
                         for course in education_list[1]['courses']:
-                            course_div2 = self.soup.new_tag('div')
-                            course_div2['class'] = ['bg-white', 'px-4', 'py-3', 'rounded-lg', 'text-sm', 'text-medium', 'shadow-sm', 'hover:shadow-md', 'transition-all', 'duration-300', 'transform', 'hover:scale-105', 'border', 'border-gray-100']
-                            course_div2.string = course
-                            course_grid2.append(course_div2)
-                        
-                        # 添加展开/收起按钮
-                        if len(education_list[1]['courses']) > 8:  # 假设每行显示2-3个课程，4行大约8-12个课程
-                            toggle_btn2 = self.soup.new_tag('button')
-                            toggle_btn2['id'] = 'toggle-courses-2'
-                            toggle_btn2['class'] = ['mt-4', 'text-primary', 'font-medium', 'flex', 'items-center', 'gap-2', 'hover:underline', 'focus:outline-none']
-                            toggle_btn2.string = '展开全部'
-                            toggle_icon2 = self.soup.new_tag('i')
-                            toggle_icon2['class'] = ['fa', 'fa-chevron-down']
-                            toggle_btn2.append(toggle_icon2)
-                            course_card2.append(toggle_btn2)
-                    
-                    # 添加标签切换脚本
-                    script = self.soup.new_tag('script')
-                    script.string = '''
-                        // 教育背景标签切换逻辑
-                        document.addEventListener('DOMContentLoaded', function() {
-                            const tabs = document.querySelectorAll('[id^="tab-education-"]');
-                            const panels = document.querySelectorAll('[id^="panel-education-"]');
-                            
-                            tabs.forEach((tab, index) => {
-                                tab.addEventListener('click', function() {
-                                    // 激活当前标签
-                                    tabs.forEach(t => {
-                                        // 移除所有激活状态的类
-                                        t.classList.remove('shadow-lg', 'transform', 'scale-105');
-                                        t.classList.add('shadow-md');
-                                    });
-                                    // 激活当前标签
-                                    tab.classList.add('shadow-lg', 'transform', 'scale-105');
-                                    tab.classList.remove('shadow-md');
-                                    
-                                    // 显示当前面板
-                                    panels.forEach(p => {
-                                        p.classList.add('hidden');
-                                        p.classList.remove('animate-fade-in');
-                                    });
-                                    panels[index].classList.remove('hidden');
-                                    panels[index].classList.add('animate-fade-in');
-                                });
-                            });
-                            
-                            // 主修课程折叠逻辑
-                            const toggleBtn1 = document.getElementById('toggle-courses-1');
-                            const coursesGrid1 = document.getElementById('courses-grid-1');
-                            
-                            if (toggleBtn1 && coursesGrid1) {
-                                toggleBtn1.addEventListener('click', function() {
-                                    if (coursesGrid1.classList.contains('max-h-64')) {
-                                        // 展开
-                                        coursesGrid1.classList.remove('max-h-64');
-                                        coursesGrid1.classList.add('max-h-[none]');
-                                        toggleBtn1.innerHTML = '收起 <i class="fa fa-chevron-up"></i>';
-                                    } else {
-                                        // 收起
-                                        coursesGrid1.classList.add('max-h-64');
-                                        coursesGrid1.classList.remove('max-h-[none]');
-                                        toggleBtn1.innerHTML = '展开全部 <i class="fa fa-chevron-down"></i>';
-                                    }
-                                });
-                            }
-                            
-                            const toggleBtn2 = document.getElementById('toggle-courses-2');
-                            const coursesGrid2 = document.getElementById('courses-grid-2');
-                            
-                            if (toggleBtn2 && coursesGrid2) {
-                                toggleBtn2.addEventListener('click', function() {
-                                    if (coursesGrid2.classList.contains('max-h-64')) {
-                                        // 展开
-                                        coursesGrid2.classList.remove('max-h-64');
-                                        coursesGrid2.classList.add('max-h-[none]');
-                                        toggleBtn2.innerHTML = '收起 <i class="fa fa-chevron-up"></i>';
-                                    } else {
-                                        // 收起
-                                        coursesGrid2.classList.add('max-h-64');
-                                        coursesGrid2.classList.remove('max-h-[none]');
-                                        toggleBtn2.innerHTML = '展开全部 <i class="fa fa-chevron-down"></i>';
-                                    }
-                                });
-                            }
-                        });
-                    '''
+                            course_div2 = self.soup.new_tag('div')
+                            course_div2['class'] = ['bg-white', 'px-4', 'py-3', 'rounded-lg', 'text-sm', 'text-medium', 'shadow-sm', 'hover:shadow-md', 'transition-all', 'duration-300', 'transform', 'hover:scale-105', 'border', 'border-gray-100']
+                            course_div2.string = course
+                            course_grid2.append(course_div2)
+                        
+                        # 添加展开/收起按钮
+                        if len(education_list[1]['courses']) > 8:  # 假设每行显示2-3个课程，4行大约8-12个课程
+                            toggle_btn2 = self.soup.new_tag('button')
+                            toggle_btn2['id'] = 'toggle-courses-2'
+                            toggle_btn2['class'] = ['mt-4', 'text-primary', 'font-medium', 'flex', 'items-center', 'gap-2', 'hover:underline', 'focus:outline-none']
+                            toggle_btn2.string = '展开全部'
+                            toggle_icon2 = self.soup.new_tag('i')
+                            toggle_icon2['class'] = ['fa', 'fa-chevron-down']
+                            toggle_btn2.append(toggle_icon2)
+                            course_card2.append(toggle_btn2)
+                    
+                    # 添加标签切换脚本
+                    script = self.soup.new_tag('script')
+                    script.string = EDUCATION_TAB_SCRIPT
                     container.append(script)
                     
                     # 添加自定义样式
                     style = self.soup.new_tag('style')
-                    style.string = '''
-                        /* 教育背景样式 */
-                        @keyframes fadeIn {
-                            from {
-                                opacity: 0;
-                                transform: translateY(10px);
-                            }
-                            to {
-                                opacity: 1;
-                                transform: translateY(0);
-                            }
-                        }
-                        
-                        .animate-fade-in {
-                            animation: fadeIn 0.5s ease-out forwards;
-                        }
-                    '''
+                    style.string = EDUCATION_TAB_STYLE
                     container.append(style)
                 else:
                     # 只有一段教育背景，使用单一布局
@@ -773,29 +1768,7 @@ class ResumeUpdater:
                     
                     # 添加单一教育背景的折叠脚本
                     single_education_script = self.soup.new_tag('script')
-                    single_education_script.string = '''
-                        // 单一教育背景的主修课程折叠逻辑
-                        document.addEventListener('DOMContentLoaded', function() {
-                            const toggleBtn = document.getElementById('toggle-courses-single');
-                            const coursesGrid = document.getElementById('courses-grid-single');
-                            
-                            if (toggleBtn && coursesGrid) {
-                                toggleBtn.addEventListener('click', function() {
-                                    if (coursesGrid.classList.contains('max-h-64')) {
-                                        // 展开
-                                        coursesGrid.classList.remove('max-h-64');
-                                        coursesGrid.classList.add('max-h-[none]');
-                                        toggleBtn.innerHTML = '收起 <i class="fa fa-chevron-up"></i>';
-                                    } else {
-                                        // 收起
-                                        coursesGrid.classList.add('max-h-64');
-                                        coursesGrid.classList.remove('max-h-[none]');
-                                        toggleBtn.innerHTML = '展开全部 <i class="fa fa-chevron-down"></i>';
-                                    }
-                                });
-                            }
-                        });
-                    '''
+                    single_education_script.string = SINGLE_EDUCATION_SCRIPT
                     container.append(single_education_script)
             
             print("✓ 成功更新教育背景")
@@ -808,14 +1781,13 @@ class ResumeUpdater:
         """提取实习经历信息"""
         experience_list = []
         
-        # 提取实习经历 - 匹配实习经历后面的下一个标题，可能是工作经历或校园经历
-        # 修复：使用\n+匹配一个或多个换行符，更灵活
-        exp_match = re.search(r'## 实习经历\n+(.*?)(?=## \w+)', self.resume_content, re.DOTALL)
-        if exp_match:
-            exp_content = exp_match.group(1).strip()
+        # 提取实习经历 - 从章节索引中读取，到下一个标题为止
+        exp_content = self.get_section('实习经历')
+        if exp_content is not None:
+            exp_content = exp_content.strip()
             
             # 分割实习经历记录 - 按<div style="display: flex; justify-content: space-between; align-items: center;">分割
-            exp_records = exp_content.split('<div style="display: flex; justify-content: space-between; align-items: center;">')
+            exp_records = exp_content.split(RECORD_SEPARATOR)
             
             # 跳过第一个空字符串（因为分割后第一个元素是空的）
             for i, record in enumerate(exp_records[1:]):
@@ -836,7 +1808,7 @@ class ResumeUpdater:
                         
                         # 使用更简单的方法提取公司信息、时间和职位
                         # 提取所有的粗体内容
-                        bold_contents = re.findall(r'<b>(.*?)</b>', html_content, re.DOTALL)
+                        bold_contents = BOLD_PATTERN.findall(html_content)
                         if len(bold_contents) >= 3:
                             # 第一个是公司信息
                             company = bold_contents[0].strip().replace('<br>', ' ')
@@ -858,13 +1830,13 @@ class ResumeUpdater:
         """提取工作经历信息"""
         work_experience_list = []
         
-        # 提取工作经历 - 匹配工作经历后面的下一个标题
-        work_match = re.search(r'## 工作经历\n\n(.*?)(?=## \w+)', self.resume_content, re.DOTALL)
-        if work_match:
-            work_content = work_match.group(1).strip()
+        # 提取工作经历 - 从章节索引中读取，到下一个标题为止
+        work_content = self.get_section('工作经历')
+        if work_content is not None:
+            work_content = work_content.strip()
             
             # 分割工作经历记录 - 按<div style="display: flex; justify-content: space-between; align-items: center;">分割
-            work_records = work_content.split('<div style="display: flex; justify-content: space-between; align-items: center;">')
+            work_records = work_content.split(RECORD_SEPARATOR)
             
             # 跳过第一个空字符串（因为分割后第一个元素是空的）
             for i, record in enumerate(work_records[1:]):
@@ -885,7 +1857,7 @@ class ResumeUpdater:
                         
                         # 使用更简单的方法提取公司信息、时间和职位
                         # 提取所有的粗体内容
-                        bold_contents = re.findall(r'<b>(.*?)</b>', html_content, re.DOTALL)
+                        bold_contents = BOLD_PATTERN.findall(html_content)
                         if len(bold_contents) >= 3:
                             # 第一个是公司信息
                             company = bold_contents[0].strip().replace('<br>', ' ')
@@ -905,542 +1877,137 @@ class ResumeUpdater:
     
     def update_experience(self):
         """更新实习经历信息"""
-        experience_list = self.extract_experience()
-        
-        if not experience_list:
-            print("✗ 未提取到实习经历信息，不加载该部分")
-            # 如果没有实习经历，移除网页中的实习经历部分
-            exp_section = self.soup.find('section', id='experience')
-            if exp_section:
-                exp_section.decompose()
-            # 移除导航栏中的实习经历链接
-            nav = self.soup.find('nav')
-            if nav:
-                exp_link = nav.find('a', href='#experience')
-                if exp_link:
-                    exp_link.decompose()
-            # 移除移动端导航栏中的实习经历链接
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                mobile_exp_link = mobile_nav.find('a', href='#experience')
-                if mobile_exp_link:
-                    mobile_exp_link.decompose()
-            return True
-        
-        try:
-            # 更新实习经历卡片
-            exp_section = self.soup.find('section', id='experience')
-            if not exp_section:
-                # 如果没有实习经历部分，创建一个
-                exp_section = self.soup.new_tag('section')
-                exp_section['id'] = 'experience'
-                exp_section['class'] = ['py-20', 'bg-gradient-to-r', 'from-green-50', 'to-teal-50']
-                
-                # 找到教育背景部分，在其后插入实习经历部分
-                edu_section = self.soup.find('section', id='education')
-                if edu_section:
-                    edu_section.insert_after(exp_section)
-                else:
-                    # 如果没有教育背景部分，在个人信息部分后插入
-                    info_section = self.soup.find('section', id='info')
-                    if info_section:
-                        info_section.insert_after(exp_section)
-            
-            # 清空现有内容
-            exp_section.clear()
-            
-            # 创建容器
-            container = self.soup.new_tag('div')
-            container['class'] = ['container', 'mx-auto', 'px-4']
-            exp_section.append(container)
-            
-            # 创建标题
-            title_div = self.soup.new_tag('div')
-            title_div['class'] = ['text-center', 'mb-12']
-            title_h2 = self.soup.new_tag('h2')
-            title_h2['class'] = ['text-3xl', 'font-bold', 'mb-2']
-            title_h2.string = '实习经历'
-            title_div.append(title_h2)
-            title_line = self.soup.new_tag('div')
-            title_line['class'] = ['w-20', 'h-1', 'bg-primary', 'mx-auto']
-            title_div.append(title_line)
-            container.append(title_div)
-            
-            # 创建新的内容容器
-            content_container = self.soup.new_tag('div')
-            content_container['class'] = ['max-w-4xl', 'mx-auto']
-            container.append(content_container)
-            
-            # 如果有多个实习经历，使用标签栏切换布局
-            if len(experience_list) > 1:
-                # 创建标签栏容器
-                tab_container = self.soup.new_tag('div')
-                tab_container['class'] = ['mb-8']
-                content_container.append(tab_container)
-                
-                # 创建标签按钮组
-                tab_buttons = self.soup.new_tag('div')
-                tab_buttons['class'] = ['flex', 'justify-center', 'gap-4', 'p-2']
-                tab_container.append(tab_buttons)
-                
-                # 创建标签按钮和内容面板
-                panels = []
-                colors = ['bg-blue-500', 'bg-green-500', 'bg-purple-500', 'bg-pink-500', 'bg-yellow-500', 'bg-orange-500', 'bg-teal-500']  # 多彩颜色
-                for i, exp in enumerate(experience_list):
-                    # 创建标签按钮
-                    tab_button = self.soup.new_tag('button')
-                    tab_button['id'] = f'tab-experience-{i+1}'
-                    color_class = colors[i % len(colors)]
-                    if i == 0:
-                        tab_button['class'] = [f'w-16', 'h-16', 'rounded-full', color_class, 'text-white', 'flex', 'items-center', 'justify-center', 'shadow-lg', 'transition-all', 'duration-300', 'transform', 'scale-105', 'focus:outline-none', 'focus:ring-2', f'focus:ring-{color_class.replace("bg-", "")}/20']
-                    else:
-                        tab_button['class'] = [f'w-16', 'h-16', 'rounded-full', color_class, 'text-white', 'flex', 'items-center', 'justify-center', 'shadow-md', f'hover:{color_class}/80', 'transition-all', 'duration-300', 'focus:outline-none', 'focus:ring-2', f'focus:ring-{color_class.replace("bg-", "")}/20']
-                    # 添加图标
-                    tab_icon = self.soup.new_tag('i')
-                    tab_icon['class'] = ['fa', 'fa-briefcase', 'text-xl']
-                    tab_button.append(tab_icon)
-                    tab_buttons.append(tab_button)
-                
-                # 创建内容容器
-                content_wrapper = self.soup.new_tag('div')
-                content_wrapper['class'] = ['bg-white', 'rounded-xl', 'shadow-lg', 'overflow-hidden', 'border', 'border-gray-100']
-                content_container.append(content_wrapper)
-                
-                # 创建内容面板
-                for i, exp in enumerate(experience_list):
-                    # 创建内容面板
-                    panel = self.soup.new_tag('div')
-                    panel['id'] = f'panel-experience-{i+1}'
-                    if i == 0:
-                        panel['class'] = ['p-8', 'animate-fade-in']
-                    else:
-                        panel['class'] = ['p-8', 'hidden', 'animate-fade-in']
-                    content_wrapper.append(panel)
-                    panels.append(panel)
-                    
-                    # 按照网页样式添加公司信息、时间和职位
-                    if 'company' in exp and 'time' in exp and 'position' in exp:
-                        # 创建公司信息、时间和职位的容器
-                        info_container = self.soup.new_tag('div')
-                        info_container['class'] = ['flex', 'flex-col', 'md:flex-row', 'justify-between', 'items-start', 'md:items-center', 'mb-6']
-                        panel.append(info_container)
-                        
-                        # 添加公司信息
-                        company_div = self.soup.new_tag('div')
-                        company_div['class'] = ['font-semibold', 'text-xl', 'mb-4', 'md:mb-0']
-                        company_div.string = exp['company']
-                        info_container.append(company_div)
-                        
-                        # 添加时间
-                        time_div = self.soup.new_tag('div')
-                        time_div['class'] = ['text-primary', 'font-medium', 'mb-4', 'md:mb-0', 'flex', 'items-center', 'gap-2']
-                        time_icon = self.soup.new_tag('i')
-                        time_icon['class'] = ['fa', 'fa-calendar', 'text-primary']
-                        time_div.append(time_icon)
-                        time_div.append(exp['time'])
-                        info_container.append(time_div)
-                        
-                        # 添加职位
-                        position_div = self.soup.new_tag('div')
-                        position_div['class'] = ['text-medium', 'bg-primary/10', 'text-primary', 'px-4', 'py-2', 'rounded-full', 'text-sm']
-                        position_div.string = exp['position']
-                        info_container.append(position_div)
-                    
-                    # 添加描述内容
-                    if 'description' in exp and exp['description']:
-                        # 转换Markdown为HTML
-                        markdown_html = markdown.markdown(exp['description'])
-                        desc_container = BeautifulSoup(markdown_html, 'html.parser')
-                        panel.append(desc_container)
-                
-                # 添加标签切换脚本
-                script = self.soup.new_tag('script')
-                script.string = '''
-                    // 实习经历标签切换逻辑
-                    document.addEventListener('DOMContentLoaded', function() {
-                        const tabs = document.querySelectorAll('[id^="tab-experience-"]');
-                        const panels = document.querySelectorAll('[id^="panel-experience-"]');
-                        
-                        tabs.forEach((tab, index) => {
-                            tab.addEventListener('click', function() {
-                                // 激活当前标签
-                                tabs.forEach(t => {
-                                    // 移除所有激活状态的类
-                                    t.classList.remove('shadow-lg', 'transform', 'scale-105');
-                                    t.classList.add('shadow-md');
-                                });
-                                // 激活当前标签
-                                tab.classList.add('shadow-lg', 'transform', 'scale-105');
-                                tab.classList.remove('shadow-md');
-                                
-                                // 显示当前面板
-                                panels.forEach(p => {
-                                    p.classList.add('hidden');
-                                    p.classList.remove('animate-fade-in');
-                                });
-                                panels[index].classList.remove('hidden');
-                                panels[index].classList.add('animate-fade-in');
-                            });
-                        });
-                    });
-                '''
-                container.append(script)
-            else:
-                # 只有一段实习经历，使用单一布局
-                for i, exp in enumerate(experience_list):
-                    # 创建实习经历卡片
-                    card = self.soup.new_tag('div')
-                    card['class'] = ['bg-white', 'rounded-xl', 'p-8', 'shadow-lg', 'overflow-hidden', 'border', 'border-gray-100', 'mb-8']
-                    content_container.append(card)
-                    
-                    # 按照网页样式添加公司信息、时间和职位
-                    if 'company' in exp and 'time' in exp and 'position' in exp:
-                        # 创建公司信息、时间和职位的容器
-                        info_container = self.soup.new_tag('div')
-                        info_container['class'] = ['flex', 'flex-col', 'md:flex-row', 'justify-between', 'items-start', 'md:items-center', 'mb-6']
-                        card.append(info_container)
-                        
-                        # 添加公司信息
-                        company_div = self.soup.new_tag('div')
-                        company_div['class'] = ['font-semibold', 'text-xl', 'mb-4', 'md:mb-0']
-                        company_div.string = exp['company']
-                        info_container.append(company_div)
-                        
-                        # 添加时间
-                        time_div = self.soup.new_tag('div')
-                        time_div['class'] = ['text-primary', 'font-medium', 'mb-4', 'md:mb-0', 'flex', 'items-center', 'gap-2']
-                        time_icon = self.soup.new_tag('i')
-                        time_icon['class'] = ['fa', 'fa-calendar', 'text-primary']
-                        time_div.append(time_icon)
-                        time_div.append(exp['time'])
-                        info_container.append(time_div)
-                        
-                        # 添加职位
-                        position_div = self.soup.new_tag('div')
-                        position_div['class'] = ['text-medium', 'bg-primary/10', 'text-primary', 'px-4', 'py-2', 'rounded-full', 'text-sm']
-                        position_div.string = exp['position']
-                        info_container.append(position_div)
-                    
-                    # 添加描述内容
-                    if 'description' in exp and exp['description']:
-                        # 转换Markdown为HTML
-                        markdown_html = markdown.markdown(exp['description'])
-                        desc_container = BeautifulSoup(markdown_html, 'html.parser')
-                        card.append(desc_container)
-            
-            # 更新导航栏，添加实习经历链接
-            nav = self.soup.find('nav')
-            if nav:
-                # 检查是否已经存在实习经历链接
-                existing_exp_link = nav.find('a', href='#experience')
-                if not existing_exp_link:
-                    # 找到教育背景链接
-                    edu_link = nav.find('a', href='#education')
-                    if edu_link:
-                        # 在教育背景链接后添加实习经历链接
-                        exp_link = self.soup.new_tag('a')
-                        exp_link['href'] = '#experience'
-                        exp_link['class'] = ['text-medium', 'hover:text-primary', 'transition-colors', 'duration-300']
-                        exp_link.string = '实习经历'
-                        edu_link.insert_after(exp_link)
-            
-            # 更新移动端导航栏
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                # 检查是否已经存在实习经历链接
-                existing_mobile_exp_link = mobile_nav.find('a', href='#experience')
-                if not existing_mobile_exp_link:
-                    # 找到教育背景链接
-                    mobile_edu_link = mobile_nav.find('a', href='#education')
-                    if mobile_edu_link:
-                        # 在教育背景链接后添加实习经历链接
-                        mobile_exp_link = self.soup.new_tag('a')
-                        mobile_exp_link['href'] = '#experience'
-                        mobile_exp_link['class'] = ['text-medium', 'hover:text-primary', 'transition-colors', 'duration-300']
-                        mobile_exp_link.string = '实习经历'
-                        mobile_edu_link.insert_after(mobile_exp_link)
-            
-            print("✓ 成功更新实习经历")
-            return True
-        except Exception as e:
-            print(f"✗ 更新实习经历失败: {e}")
-            return False
+        return self.update_record_section(EXPERIENCE_SCHEMA)
     
     def update_work_experience(self):
         """更新工作经历信息"""
-        work_experience_list = self.extract_work_experience()
-        
-        if not work_experience_list:
-            print("✗ 未提取到工作经历信息，不加载该部分")
-            # 如果没有工作经历，移除网页中的工作经历部分
-            work_section = self.soup.find('section', id='work')
-            if work_section:
-                work_section.decompose()
-            # 移除导航栏中的工作经历链接
-            nav = self.soup.find('nav')
-            if nav:
-                work_link = nav.find('a', href='#work')
-                if work_link:
-                    work_link.decompose()
-            # 移除移动端导航栏中的工作经历链接
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                mobile_work_link = mobile_nav.find('a', href='#work')
-                if mobile_work_link:
-                    mobile_work_link.decompose()
-            # 移除工作经历的注释标记
-            for comment in self.soup.find_all(text=lambda text: isinstance(text, str) and '<!-- 工作经历 -->' in text):
-                comment.extract()
+        return self.update_record_section(WORK_SCHEMA)
+    
+    def update_record_section(self, schema):
+        """
+        按部分描述更新经历类部分
+        
+        没有记录时移除该部分及其导航链接；否则重建内容，
+        每条记录由卡片、标题行等原型克隆得到
+        
+        Args:
+            schema: 部分描述（SectionSchema）
+        """
+        records = getattr(self.resume_model(), schema.model_field)
+        
+        if not records:
+            print(f"✗ 未提取到{schema.title}信息，不加载该部分")
+            remove_section(self.element_index(), schema.section_id, schema.marker)
             return True
         
         try:
-            # 更新工作经历卡片
-            work_section = self.soup.find('section', id='work')
-            if not work_section:
-                # 如果没有工作经历部分，创建一个
-                work_section = self.soup.new_tag('section')
-                work_section['id'] = 'work'
-                work_section['class'] = ['py-20', 'bg-gradient-to-r', 'from-blue-50', 'to-indigo-50']
-                
-                # 找到实习经历部分，在其后插入工作经历部分
-                exp_section = self.soup.find('section', id='experience')
-                if exp_section:
-                    exp_section.insert_after(work_section)
+            container = self.prepare_record_section(schema)
+            if container is not None:
+                content_container = CONTENT_PROTOTYPE.clone()
+                container.append(content_container)
+                if schema.layout == 'list':
+                    self.render_record_list(schema, content_container, records)
+                elif len(records) > 1:
+                    self.render_record_tabs(schema, container, content_container, records)
                 else:
-                    # 如果没有实习经历部分，在校园经历部分前插入
-                    campus_section = self.soup.find('section', id='campus')
-                    if campus_section:
-                        campus_section.insert_before(work_section)
-            
-            # 清空工作经历部分的现有内容
-            work_section.clear()
-            
-            # 创建容器
-            container = self.soup.new_tag('div')
-            container['class'] = ['container', 'mx-auto', 'px-4']
-            work_section.append(container)
-            
-            # 创建标题
-            title_div = self.soup.new_tag('div')
-            title_div['class'] = ['text-center', 'mb-12']
-            title_h2 = self.soup.new_tag('h2')
-            title_h2['class'] = ['text-3xl', 'font-bold', 'mb-2']
-            title_h2.string = '工作经历'
-            title_div.append(title_h2)
-            title_line = self.soup.new_tag('div')
-            title_line['class'] = ['w-20', 'h-1', 'bg-primary', 'mx-auto']
-            title_div.append(title_line)
-            container.append(title_div)
-            
-            # 创建新的内容容器
-            content_container = self.soup.new_tag('div')
-            content_container['class'] = ['max-w-4xl', 'mx-auto']
-            container.append(content_container)
-            
-            # 如果有多个工作经历，使用标签栏切换布局
-            if len(work_experience_list) > 1:
-                # 创建标签栏容器
-                tab_container = self.soup.new_tag('div')
-                tab_container['class'] = ['mb-8']
-                content_container.append(tab_container)
-                
-                # 创建标签按钮组
-                tab_buttons = self.soup.new_tag('div')
-                tab_buttons['class'] = ['flex', 'justify-center', 'gap-4', 'p-2']
-                tab_container.append(tab_buttons)
-                
-                # 创建标签按钮和内容面板
-                panels = []
-                colors = ['bg-blue-500', 'bg-green-500', 'bg-purple-500', 'bg-pink-500', 'bg-yellow-500', 'bg-orange-500', 'bg-teal-500']  # 多彩颜色
-                for i, exp in enumerate(work_experience_list):
-                    # 创建标签按钮
-                    tab_button = self.soup.new_tag('button')
-                    tab_button['id'] = f'tab-work-{i+1}'
-                    color_class = colors[i % len(colors)]
-                    if i == 0:
-                        tab_button['class'] = [f'w-16', 'h-16', 'rounded-full', color_class, 'text-white', 'flex', 'items-center', 'justify-center', 'shadow-lg', 'transition-all', 'duration-300', 'transform', 'scale-105', 'focus:outline-none', 'focus:ring-2', f'focus:ring-{color_class.replace("bg-", "")}/20']
-                    else:
-                        tab_button['class'] = [f'w-16', 'h-16', 'rounded-full', color_class, 'text-white', 'flex', 'items-center', 'justify-center', 'shadow-md', f'hover:{color_class}/80', 'transition-all', 'duration-300', 'focus:outline-none', 'focus:ring-2', f'focus:ring-{color_class.replace("bg-", "")}/20']
-                    # 添加图标
-                    tab_icon = self.soup.new_tag('i')
-                    tab_icon['class'] = ['fa', 'fa-briefcase', 'text-xl']
-                    tab_button.append(tab_icon)
-                    tab_buttons.append(tab_button)
-                
-                # 创建内容容器
-                content_wrapper = self.soup.new_tag('div')
-                content_wrapper['class'] = ['bg-white', 'rounded-xl', 'shadow-lg', 'overflow-hidden', 'border', 'border-gray-100']
-                content_container.append(content_wrapper)
-                
-                # 创建内容面板
-                for i, exp in enumerate(work_experience_list):
-                    # 创建内容面板
-                    panel = self.soup.new_tag('div')
-                    panel['id'] = f'panel-work-{i+1}'
-                    if i == 0:
-                        panel['class'] = ['p-8', 'animate-fade-in']
-                    else:
-                        panel['class'] = ['p-8', 'hidden', 'animate-fade-in']
-                    content_wrapper.append(panel)
-                    panels.append(panel)
-                    
-                    # 按照网页样式添加公司信息、时间和职位
-                    if 'company' in exp and 'time' in exp and 'position' in exp:
-                        # 创建公司信息、时间和职位的容器
-                        info_container = self.soup.new_tag('div')
-                        info_container['class'] = ['flex', 'flex-col', 'md:flex-row', 'justify-between', 'items-start', 'md:items-center', 'mb-6']
-                        panel.append(info_container)
-                        
-                        # 添加公司信息
-                        company_div = self.soup.new_tag('div')
-                        company_div['class'] = ['font-semibold', 'text-xl', 'mb-4', 'md:mb-0']
-                        company_div.string = exp['company']
-                        info_container.append(company_div)
-                        
-                        # 添加时间
-                        time_div = self.soup.new_tag('div')
-                        time_div['class'] = ['text-primary', 'font-medium', 'mb-4', 'md:mb-0', 'flex', 'items-center', 'gap-2']
-                        time_icon = self.soup.new_tag('i')
-                        time_icon['class'] = ['fa', 'fa-calendar', 'text-primary']
-                        time_div.append(time_icon)
-                        time_div.append(exp['time'])
-                        info_container.append(time_div)
-                        
-                        # 添加职位
-                        position_div = self.soup.new_tag('div')
-                        position_div['class'] = ['text-medium', 'bg-primary/10', 'text-primary', 'px-4', 'py-2', 'rounded-full', 'text-sm']
-                        position_div.string = exp['position']
-                        info_container.append(position_div)
-                    
-                    # 添加描述内容
-                    if 'description' in exp and exp['description']:
-                        # 转换Markdown为HTML
-                        markdown_html = markdown.markdown(exp['description'])
-                        desc_container = BeautifulSoup(markdown_html, 'html.parser')
-                        panel.append(desc_container)
-                
-                # 添加标签切换脚本
-                script = self.soup.new_tag('script')
-                script.string = '''
-                    // 工作经历标签切换逻辑
-                    document.addEventListener('DOMContentLoaded', function() {
-                        const tabs = document.querySelectorAll('[id^="tab-work-"]');
-                        const panels = document.querySelectorAll('[id^="panel-work-"]');
-                        
-                        tabs.forEach((tab, index) => {
-                            tab.addEventListener('click', function() {
-                                // 激活当前标签
-                                tabs.forEach(t => {
-                                    // 移除所有激活状态的类
-                                    t.classList.remove('shadow-lg', 'transform', 'scale-105');
-                                    t.classList.add('shadow-md');
-                                });
-                                // 激活当前标签
-                                tab.classList.add('shadow-lg', 'transform', 'scale-105');
-                                tab.classList.remove('shadow-md');
-                                
-                                // 显示当前面板
-                                panels.forEach(p => {
-                                    p.classList.add('hidden');
-                                    p.classList.remove('animate-fade-in');
-                                });
-                                panels[index].classList.remove('hidden');
-                                panels[index].classList.add('animate-fade-in');
-                            });
-                        });
-                    });
-                '''
-                container.append(script)
-            else:
-                # 只有一段工作经历，使用单一布局
-                for i, exp in enumerate(work_experience_list):
-                    # 创建工作经历卡片
-                    card = self.soup.new_tag('div')
-                    card['class'] = ['bg-white', 'rounded-xl', 'p-8', 'shadow-lg', 'overflow-hidden', 'border', 'border-gray-100', 'mb-8']
-                    content_container.append(card)
-                    
-                    # 按照网页样式添加公司信息、时间和职位
-                    if 'company' in exp and 'time' in exp and 'position' in exp:
-                        # 创建公司信息、时间和职位的容器
-                        info_container = self.soup.new_tag('div')
-                        info_container['class'] = ['flex', 'flex-col', 'md:flex-row', 'justify-between', 'items-start', 'md:items-center', 'mb-6']
-                        card.append(info_container)
-                        
-                        # 添加公司信息
-                        company_div = self.soup.new_tag('div')
-                        company_div['class'] = ['font-semibold', 'text-xl', 'mb-4', 'md:mb-0']
-                        company_div.string = exp['company']
-                        info_container.append(company_div)
-                        
-                        # 添加时间
-                        time_div = self.soup.new_tag('div')
-                        time_div['class'] = ['text-primary', 'font-medium', 'mb-4', 'md:mb-0', 'flex', 'items-center', 'gap-2']
-                        time_icon = self.soup.new_tag('i')
-                        time_icon['class'] = ['fa', 'fa-calendar', 'text-primary']
-                        time_div.append(time_icon)
-                        time_div.append(exp['time'])
-                        info_container.append(time_div)
-                        
-                        # 添加职位
-                        position_div = self.soup.new_tag('div')
-                        position_div['class'] = ['text-medium', 'bg-primary/10', 'text-primary', 'px-4', 'py-2', 'rounded-full', 'text-sm']
-                        position_div.string = exp['position']
-                        info_container.append(position_div)
-                    
-                    # 添加描述内容
-                    if 'description' in exp and exp['description']:
-                        # 转换Markdown为HTML
-                        markdown_html = markdown.markdown(exp['description'])
-                        desc_container = BeautifulSoup(markdown_html, 'html.parser')
-                        card.append(desc_container)
-            
-            # 更新导航栏，添加工作经历链接
-            nav = self.soup.find('nav')
-            if nav:
-                # 检查是否已经存在工作经历链接
-                existing_work_link = nav.find('a', href='#work')
-                if not existing_work_link:
-                    # 找到实习经历链接
-                    exp_link = nav.find('a', href='#experience')
-                    if exp_link:
-                        # 在实习经历链接后添加工作经历链接
-                        work_link = self.soup.new_tag('a')
-                        work_link['href'] = '#work'
-                        work_link['class'] = ['text-medium', 'hover:text-primary', 'transition-colors', 'duration-300']
-                        work_link.string = '工作经历'
-                        exp_link.insert_after(work_link)
-            
-            # 更新移动端导航栏
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                # 检查是否已经存在工作经历链接
-                existing_mobile_work_link = mobile_nav.find('a', href='#work')
-                if not existing_mobile_work_link:
-                    # 找到实习经历链接
-                    mobile_exp_link = mobile_nav.find('a', href='#experience')
-                    if mobile_exp_link:
-                        # 在实习经历链接后添加工作经历链接
-                        mobile_work_link = self.soup.new_tag('a')
-                        mobile_work_link['href'] = '#work'
-                        mobile_work_link['class'] = ['text-medium', 'hover:text-primary', 'transition-colors', 'duration-300']
-                        mobile_work_link.string = '工作经历'
-                        mobile_exp_link.insert_after(mobile_work_link)
+                    for record in records:
+                        card = schema.card.clone()
+                        self.fill_record(schema, card, record)
+                        content_container.append(card)
+                # 导航栏（含移动端）缺少该部分链接时补充
+                ensure_nav_link(self.element_index(), schema.section_id, schema.title, schema.nav_after)
             
-            print("✓ 成功更新工作经历")
+            print(f"✓ 成功更新{schema.title}")
             return True
         except Exception as e:
-            print(f"✗ 更新工作经历失败: {e}")
+            print(f"✗ 更新{schema.title}失败: {e}")
             return False
     
+    def prepare_record_section(self, schema):
+        """
+        准备部分的容器：清空旧内容并放好标题
+        
+        Returns:
+            容器元素，模板中没有该部分且不需要新建时返回None
+        """
+        if schema.create:
+            section = ensure_section(self.element_index(), schema.section_id, schema.background, schema.anchors)
+            section.clear()
+            container = CONTAINER_PROTOTYPE.clone()
+            container.append(SECTION_TITLE_PROTOTYPE.clone({'title': schema.title}))
+            section.append(container)
+            return container
+        
+        section = self.element_index().get(schema.section_id, 'section')
+        if not section:
+            return None
+        # 只保留容器
+        for child in section.find_all(recursive=False):
+            if child.name != 'div' or 'container' not in child.get('class', []):
+                child.decompose()
+        container = section.find('div', class_='container')
+        if not container:
+            container = CONTAINER_PROTOTYPE.clone()
+            section.append(container)
+        # 保留模板中的标题，移除其他内容
+        title_div = container.find('div', class_='text-center')
+        if not title_div:
+            container.append(SECTION_TITLE_PROTOTYPE.clone({'title': schema.title}))
+        else:
+            for child in container.find_all(recursive=False):
+                if child != title_div:
+                    child.decompose()
+        return container
+    
+    def fill_record(self, schema, node, record):
+        """向卡片或标签面板中添加记录标题行和Markdown描述"""
+        if schema.header is not None and all(field in record for field in schema.header_fields):
+            node.append(schema.header.clone(record))
+        if 'description' in record and record['description']:
+            # 转换Markdown为HTML（相同描述直接使用缓存）
+            node.extend(markdown_fragment(record['description'], self.html_parser()))
+    
+    def render_record_tabs(self, schema, container, content_container, records):
+        """多条记录：标签栏切换布局"""
+        tab_bar = TAB_BAR_PROTOTYPE.clone()
+        tab_buttons = tab_bar.contents[0]
+        for i in range(len(records)):
+            color = TAB_COLORS[i % len(TAB_COLORS)]
+            button = tab_button_prototype(schema.tab_icon, color, i == 0)
+            tab_buttons.append(button.clone(attrs={'id': f'tab-{schema.tab_name}-{i+1}'}))
+        content_container.append(tab_bar)
+        
+        content_wrapper = TAB_WRAPPER_PROTOTYPE.clone()
+        for i, record in enumerate(records):
+            panel = (TAB_PANEL_PROTOTYPE if i == 0 else HIDDEN_TAB_PANEL_PROTOTYPE).clone(
+                attrs={'id': f'panel-{schema.tab_name}-{i+1}'})
+            self.fill_record(schema, panel, record)
+            content_wrapper.append(panel)
+        content_container.append(content_wrapper)
+        
+        # 添加标签切换脚本
+        script = self.soup.new_tag('script')
+        script.string = schema.tab_script
+        container.append(script)
+    
+    def render_record_list(self, schema, content_container, records):
+        """逐条列出记录，有描述时追加说明"""
+        record_list = RECORD_LIST_PROTOTYPE.clone()
+        for record in records:
+            item = schema.card.clone(record)
+            if schema.detail is not None and record['description']:
+                item.append(schema.detail.clone(record))
+            record_list.append(item)
+        content_container.append(record_list)
+    
     def extract_campus_experience(self):
         """提取校园经历信息"""
         campus_experiences = []
         
         # 提取校园经历
-        # 修复：使用\n+匹配一个或多个换行符，更灵活
-        campus_match = re.search(r'## 校园经历\n+(.*?)## 个人项目', self.resume_content, re.DOTALL)
-        if campus_match:
-            campus_content = campus_match.group(1).strip()
+        campus_content = self.get_section('校园经历')
+        if campus_content is not None:
+            campus_content = campus_content.strip()
             
             # 提取每条经历 - 使用更可靠的方法
             # 按行分割
@@ -1461,223 +2028,42 @@ class ResumeUpdater:
                             # 尝试没有分隔符的情况
                             time_match = re.search(r'(\d{4}\.\d{2})\s*(.*)', exp)
                             if time_match:
-                                time = time_match.group(1).strip()
-                                content = time_match.group(2).strip()
-                        
-                        if time_match:
-                            # 提取描述
-                            desc_match = re.search(r'—— (.*)', content)
-                            if desc_match:
-                                activity = content.split('——')[0].strip()
-                                description = desc_match.group(1).strip()
-                            else:
-                                activity = content.strip()
-                                description = ""
-                            
-                            campus_experiences.append({
-                                'time': time,
-                                'activity': activity,
-                                'description': description
-                            })
-        
-        return campus_experiences
-    
-    def update_campus_experience(self):
-        """更新校园经历信息"""
-        campus_experiences = self.extract_campus_experience()
-        
-        if not campus_experiences:
-            print("✗ 未提取到校园经历信息，不加载该部分")
-            # 如果没有校园经历，移除网页中的校园经历部分
-            campus_section = self.soup.find('section', id='campus')
-            if campus_section:
-                campus_section.decompose()
-            # 移除导航栏中的校园经历链接
-            nav = self.soup.find('nav')
-            if nav:
-                campus_link = nav.find('a', href='#campus')
-                if campus_link:
-                    campus_link.decompose()
-            # 移除移动端导航栏中的校园经历链接
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                mobile_campus_link = mobile_nav.find('a', href='#campus')
-                if mobile_campus_link:
-                    mobile_campus_link.decompose()
-            # 移除校园经历的注释标记
-            for comment in self.soup.find_all(text=lambda text: isinstance(text, str) and '<!-- 校园经历 -->' in text):
-                comment.extract()
-            return True
-        
-        try:
-            # 更新校园经历列表
-            campus_section = self.soup.find('section', id='campus')
-            if not campus_section:
-                # 如果没有校园经历部分，创建一个
-                campus_section = self.soup.new_tag('section')
-                campus_section['id'] = 'campus'
-                campus_section['class'] = ['py-20', 'bg-gradient-to-r', 'from-yellow-50', 'to-orange-50']
-                
-                # 找到实习经历部分，在其后插入校园经历部分
-                exp_section = self.soup.find('section', id='experience')
-                if exp_section:
-                    exp_section.insert_after(campus_section)
-                else:
-                    # 找到教育背景部分，在其后插入校园经历部分
-                    edu_section = self.soup.find('section', id='education')
-                    if edu_section:
-                        edu_section.insert_after(campus_section)
-                    else:
-                        # 如果没有教育背景部分，在个人信息部分后插入
-                        info_section = self.soup.find('section', id='info')
-                        if info_section:
-                            info_section.insert_after(campus_section)
-            
-            # 清空现有内容
-            campus_section.clear()
-            
-            # 创建容器
-            container = self.soup.new_tag('div')
-            container['class'] = ['container', 'mx-auto', 'px-4']
-            campus_section.append(container)
-            
-            # 创建标题
-            title_div = self.soup.new_tag('div')
-            title_div['class'] = ['text-center', 'mb-12']
-            title_h2 = self.soup.new_tag('h2')
-            title_h2['class'] = ['text-3xl', 'font-bold', 'mb-2']
-            title_h2.string = '校园经历'
-            title_div.append(title_h2)
-            title_line = self.soup.new_tag('div')
-            title_line['class'] = ['w-20', 'h-1', 'bg-primary', 'mx-auto']
-            title_div.append(title_line)
-            container.append(title_div)
-            
-            # 创建内容容器
-            content_container = self.soup.new_tag('div')
-            content_container['class'] = ['max-w-4xl', 'mx-auto']
-            container.append(content_container)
-            
-            # 创建校园经历列表容器
-            campus_container = self.soup.new_tag('div')
-            campus_container['class'] = ['space-y-4']
-            content_container.append(campus_container)
-            
-            # 添加新经历
-            for exp in campus_experiences:
-                exp_div = self.soup.new_tag('div')
-                exp_div['class'] = ['bg-white', 'rounded-lg', 'p-4', 'shadow-sm', 'hover:shadow-md', 'transition-shadow', 'duration-300']
-                
-                # 添加时间和活动
-                time_activity_div = self.soup.new_tag('div')
-                time_activity_div['class'] = ['flex', 'justify-between', 'items-center', 'mb-2']
-                
-                activity_span = self.soup.new_tag('div')
-                activity_span['class'] = ['font-medium']
-                activity_span.string = exp['activity']
-                
-                time_span = self.soup.new_tag('div')
-                time_span['class'] = ['text-primary']
-                time_span.string = exp['time']
-                
-                time_activity_div.append(activity_span)
-                time_activity_div.append(time_span)
-                
-                # 添加描述
-                if exp['description']:
-                    desc_p = self.soup.new_tag('p')
-                    desc_p['class'] = ['text-medium', 'text-sm']
-                    desc_p.string = exp['description']
-                    exp_div.append(time_activity_div)
-                    exp_div.append(desc_p)
-                else:
-                    exp_div.append(time_activity_div)
-                
-                campus_container.append(exp_div)
-            
-            # 更新导航栏，添加校园经历链接
-            nav = self.soup.find('nav')
-            if nav:
-                # 检查是否已经存在校园经历链接
-                existing_campus_link = nav.find('a', href='#campus')
-                if not existing_campus_link:
-                    # 找到实习经历链接
-                    exp_link = nav.find('a', href='#experience')
-                    if exp_link:
-                        # 在实习经历链接后添加校园经历链接
-                        campus_link = self.soup.new_tag('a')
-                        campus_link['href'] = '#campus'
-                        campus_link['class'] = ['text-medium', 'hover:text-primary', 'transition-colors', 'duration-300']
-                        campus_link.string = '校园经历'
-                        exp_link.insert_after(campus_link)
-                    else:
-                        # 如果没有实习经历链接，找到教育背景链接
-                        edu_link = nav.find('a', href='#education')
-                        if edu_link:
-                            # 在教育背景链接后添加校园经历链接
-                            campus_link = self.soup.new_tag('a')
-                            campus_link['href'] = '#campus'
-                            campus_link['class'] = ['text-medium', 'hover:text-primary', 'transition-colors', 'duration-300']
-                            campus_link.string = '校园经历'
-                            edu_link.insert_after(campus_link)
-            
-            # 更新移动端导航栏
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                # 检查是否已经存在校园经历链接
-                existing_mobile_campus_link = mobile_nav.find('a', href='#campus')
-                if not existing_mobile_campus_link:
-                    # 找到实习经历链接
-                    mobile_exp_link = mobile_nav.find('a', href='#experience')
-                    if mobile_exp_link:
-                        # 在实习经历链接后添加校园经历链接
-                        mobile_campus_link = self.soup.new_tag('a')
-                        mobile_campus_link['href'] = '#campus'
-                        mobile_campus_link['class'] = ['text-medium', 'hover:text-primary', 'transition-colors', 'duration-300']
-                        mobile_campus_link.string = '校园经历'
-                        mobile_exp_link.insert_after(mobile_campus_link)
-                    else:
-                        # 如果没有实习经历链接，找到教育背景链接
-                        mobile_edu_link = mobile_nav.find('a', href='#education')
-                        if mobile_edu_link:
-                            # 在教育背景链接后添加校园经历链接
-                            mobile_campus_link = self.soup.new_tag('a')
-                            mobile_campus_link['href'] = '#campus'
-                            mobile_campus_link['class'] = ['text-medium', 'hover:text-primary', 'transition-colors', 'duration-300']
-                            mobile_campus_link.string = '校园经历'
-                            mobile_edu_link.insert_after(mobile_campus_link)
-            
-            print("✓ 成功更新校园经历")
-            return True
-        except Exception as e:
-            print(f"✗ 更新校园经历失败: {e}")
-            return False
+                                time = time_match.group(1).strip()
+                                content = time_match.group(2).strip()
+                        
+                        if time_match:
+                            # 提取描述
+                            desc_match = re.search(r'—— (.*)', content)
+                            if desc_match:
+                                activity = content.split('——')[0].strip()
+                                description = desc_match.group(1).strip()
+                            else:
+                                activity = content.strip()
+                                description = ""
+                            
+                            campus_experiences.append({
+                                'time': time,
+                                'activity': activity,
+                                'description': description
+                            })
+        
+        return campus_experiences
+    
+    def update_campus_experience(self):
+        """更新校园经历信息"""
+        return self.update_record_section(CAMPUS_SCHEMA)
     
     def extract_projects(self):
         """提取个人项目信息"""
         projects = []
         
-        # 直接从文件中读取并解析
-        with open(self.resume_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # 找到个人项目部分
-        project_start = -1
-        project_end = -1
-        for i, line in enumerate(lines):
-            if '## 个人项目' in line:
-                project_start = i
-            elif project_start != -1 and '## 专业技能' in line:
-                project_end = i
-                break
-        
-        if project_start != -1 and project_end != -1:
-            # 提取项目内容
-            project_lines = lines[project_start+1:project_end]
-            project_content = ''.join(project_lines).strip()
+        # 从章节索引中读取个人项目部分
+        project_content = self.get_section('个人项目')
+        if project_content is not None:
+            project_content = project_content.strip()
             
             # 分割项目记录 - 按<div style="display: flex; justify-content: space-between; align-items: center;">分割
-            project_records = project_content.split('<div style="display: flex; justify-content: space-between; align-items: center;">')
+            project_records = project_content.split(RECORD_SEPARATOR)
             
             # 跳过第一个空字符串（因为分割后第一个元素是空的）
             for i, record in enumerate(project_records[1:]):
@@ -1698,7 +2084,7 @@ class ResumeUpdater:
                         
                         # 使用更简单的方法提取项目信息
                         # 提取所有的粗体内容
-                        bold_contents = re.findall(r'<b>(.*?)</b>', html_content, re.DOTALL)
+                        bold_contents = BOLD_PATTERN.findall(html_content)
                         if len(bold_contents) >= 1:
                             # 第一个是项目名称
                             project['name'] = bold_contents[0].strip().replace('<br>', ' ')
@@ -1721,228 +2107,16 @@ class ResumeUpdater:
     
     def update_projects(self):
         """更新个人项目信息"""
-        projects = self.extract_projects()
-        
-        if not projects:
-            print("✗ 未提取到个人项目信息，不加载该部分")
-            # 如果没有个人项目，移除网页中的个人项目部分
-            project_section = self.soup.find('section', id='projects')
-            if project_section:
-                project_section.decompose()
-            # 移除导航栏中的个人项目链接
-            nav = self.soup.find('nav')
-            if nav:
-                project_link = nav.find('a', href='#projects')
-                if project_link:
-                    project_link.decompose()
-            # 移除移动端导航栏中的个人项目链接
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                mobile_project_link = mobile_nav.find('a', href='#projects')
-                if mobile_project_link:
-                    mobile_project_link.decompose()
-            # 移除个人项目的注释标记
-            for comment in self.soup.find_all(text=lambda text: isinstance(text, str) and '<!-- 个人项目 -->' in text):
-                comment.extract()
-            return True
-        
-        try:
-            # 更新个人项目卡片
-            project_section = self.soup.find('section', id='projects')
-            if project_section:
-                # 清空现有内容
-                for child in project_section.find_all(recursive=False):
-                    if child.name != 'div' or 'container' not in child.get('class', []):
-                        child.decompose()
-                
-                # 找到容器
-                container = project_section.find('div', class_='container')
-                if not container:
-                    # 如果没有容器，创建一个
-                    container = self.soup.new_tag('div')
-                    container['class'] = ['container', 'mx-auto', 'px-4']
-                    project_section.append(container)
-                
-                # 清空容器内的内容，只保留标题
-                title_div = container.find('div', class_='text-center')
-                if not title_div:
-                    # 如果没有标题，创建一个
-                    title_div = self.soup.new_tag('div')
-                    title_div['class'] = ['text-center', 'mb-12']
-                    title_h2 = self.soup.new_tag('h2')
-                    title_h2['class'] = ['text-3xl', 'font-bold', 'mb-2']
-                    title_h2.string = '个人项目'
-                    title_div.append(title_h2)
-                    title_line = self.soup.new_tag('div')
-                    title_line['class'] = ['w-20', 'h-1', 'bg-primary', 'mx-auto']
-                    title_div.append(title_line)
-                    container.append(title_div)
-                else:
-                    # 保留标题，移除其他内容
-                    for child in container.find_all(recursive=False):
-                        if child != title_div:
-                            child.decompose()
-                
-                # 创建新的内容容器
-                content_container = self.soup.new_tag('div')
-                content_container['class'] = ['max-w-4xl', 'mx-auto']
-                container.append(content_container)
-                
-                # 如果有多个个人项目，使用标签栏切换布局
-                if len(projects) > 1:
-                    # 创建标签栏容器
-                    tab_container = self.soup.new_tag('div')
-                    tab_container['class'] = ['mb-8']
-                    content_container.append(tab_container)
-                    
-                    # 创建标签按钮组
-                    tab_buttons = self.soup.new_tag('div')
-                    tab_buttons['class'] = ['flex', 'justify-center', 'gap-4', 'p-2']
-                    tab_container.append(tab_buttons)
-                    
-                    # 定义多彩颜色
-                    colors = ['bg-blue-500', 'bg-green-500', 'bg-purple-500', 'bg-pink-500', 'bg-yellow-500', 'bg-orange-500', 'bg-teal-500']
-                    
-                    # 创建标签按钮和内容面板
-                    panels = []
-                    for i, project in enumerate(projects):
-                        # 创建标签按钮
-                        tab_button = self.soup.new_tag('button')
-                        tab_button['id'] = f'tab-project-{i+1}'
-                        color_class = colors[i % len(colors)]
-                        if i == 0:
-                            tab_button['class'] = [f'w-16', 'h-16', 'rounded-full', color_class, 'text-white', 'flex', 'items-center', 'justify-center', 'shadow-lg', 'transition-all', 'duration-300', 'transform', 'scale-105', 'focus:outline-none', 'focus:ring-2', f'focus:ring-{color_class.replace("bg-", "")}/20']
-                        else:
-                            tab_button['class'] = [f'w-16', 'h-16', 'rounded-full', color_class, 'text-white', 'flex', 'items-center', 'justify-center', 'shadow-md', f'hover:{color_class}/80', 'transition-all', 'duration-300', 'focus:outline-none', 'focus:ring-2', f'focus:ring-{color_class.replace("bg-", "")}/20']
-                        # 添加图标
-                        tab_icon = self.soup.new_tag('i')
-                        tab_icon['class'] = ['fa', 'fa-code', 'text-xl']
-                        tab_button.append(tab_icon)
-                        tab_buttons.append(tab_button)
-                    
-                    # 创建内容容器
-                    content_wrapper = self.soup.new_tag('div')
-                    content_wrapper['class'] = ['bg-white', 'rounded-xl', 'shadow-lg', 'overflow-hidden', 'border', 'border-gray-100']
-                    content_container.append(content_wrapper)
-                    
-                    # 创建内容面板
-                    for i, project in enumerate(projects):
-                        # 创建内容面板
-                        panel = self.soup.new_tag('div')
-                        panel['id'] = f'panel-project-{i+1}'
-                        if i == 0:
-                            panel['class'] = ['p-8', 'animate-fade-in']
-                        else:
-                            panel['class'] = ['p-8', 'hidden', 'animate-fade-in']
-                        content_wrapper.append(panel)
-                        panels.append(panel)
-                        
-                        # 添加项目信息
-                        if 'name' in project and 'time' in project:
-                            # 创建项目信息容器
-                            info_container = self.soup.new_tag('div')
-                            info_container['class'] = ['flex', 'flex-col', 'md:flex-row', 'justify-between', 'items-start', 'md:items-center', 'mb-4']
-                            panel.append(info_container)
-                            
-                            # 添加项目名称
-                            name_div = self.soup.new_tag('div')
-                            name_div['class'] = ['font-semibold', 'text-lg', 'mb-2', 'md:mb-0']
-                            name_div.string = project['name']
-                            info_container.append(name_div)
-                            
-                            # 添加项目时间
-                            time_div = self.soup.new_tag('div')
-                            time_div['class'] = ['text-primary', 'font-medium', 'mb-2', 'md:mb-0']
-                            time_div.string = project['time']
-                            info_container.append(time_div)
-                        
-                        # 添加项目描述
-                        if 'description' in project and project['description']:
-                            # 转换Markdown为HTML
-                            markdown_html = markdown.markdown(project['description'])
-                            desc_container = BeautifulSoup(markdown_html, 'html.parser')
-                            panel.append(desc_container)
-                    
-                    # 添加标签切换脚本
-                    script = self.soup.new_tag('script')
-                    script.string = '''
-                        // 个人项目标签切换逻辑
-                        document.addEventListener('DOMContentLoaded', function() {
-                            const tabs = document.querySelectorAll('[id^="tab-project-"]');
-                            const panels = document.querySelectorAll('[id^="panel-project-"]');
-                            
-                            tabs.forEach((tab, index) => {
-                                tab.addEventListener('click', function() {
-                                    // 激活当前标签
-                                    tabs.forEach(t => {
-                                        // 移除所有激活状态的类
-                                        t.classList.remove('shadow-lg', 'transform', 'scale-105');
-                                        t.classList.add('shadow-md');
-                                    });
-                                    // 激活当前标签
-                                    tab.classList.add('shadow-lg', 'transform', 'scale-105');
-                                    tab.classList.remove('shadow-md');
-                                    
-                                    // 显示当前面板
-                                    panels.forEach(p => {
-                                        p.classList.add('hidden');
-                                        p.classList.remove('animate-fade-in');
-                                    });
-                                    panels[index].classList.remove('hidden');
-                                    panels[index].classList.add('animate-fade-in');
-                                });
-                            });
-                        });
-                    '''
-                    container.append(script)
-                else:
-                    # 只有一个个人项目，使用单一布局
-                    for i, project in enumerate(projects):
-                        # 创建项目卡片
-                        card = self.soup.new_tag('div')
-                        card['class'] = ['bg-white', 'rounded-xl', 'p-6', 'shadow-sm', 'card-hover']
-                        content_container.append(card)
-                        
-                        # 添加项目信息
-                        if 'name' in project and 'time' in project:
-                            # 创建项目信息容器
-                            info_container = self.soup.new_tag('div')
-                            info_container['class'] = ['flex', 'flex-col', 'md:flex-row', 'justify-between', 'items-start', 'md:items-center', 'mb-4']
-                            card.append(info_container)
-                            
-                            # 添加项目名称
-                            name_div = self.soup.new_tag('div')
-                            name_div['class'] = ['font-semibold', 'text-lg', 'mb-2', 'md:mb-0']
-                            name_div.string = project['name']
-                            info_container.append(name_div)
-                            
-                            # 添加项目时间
-                            time_div = self.soup.new_tag('div')
-                            time_div['class'] = ['text-primary', 'font-medium', 'mb-2', 'md:mb-0']
-                            time_div.string = project['time']
-                            info_container.append(time_div)
-                        
-                        # 添加项目描述
-                        if 'description' in project and project['description']:
-                            # 转换Markdown为HTML
-                            markdown_html = markdown.markdown(project['description'])
-                            desc_container = BeautifulSoup(markdown_html, 'html.parser')
-                            card.append(desc_container)
-            
-            print("✓ 成功更新个人项目")
-            return True
-        except Exception as e:
-            print(f"✗ 更新个人项目失败: {e}")
-            return False
+        return self.update_record_section(PROJECTS_SCHEMA)
     
     def extract_skills(self):
         """提取专业技能信息"""
         skills = []
         
         # 提取专业技能
-        skill_match = re.search(r'## 专业技能\n\n(.*?)## 自我评价', self.resume_content, re.DOTALL)
-        if skill_match:
-            skill_content = skill_match.group(1).strip()
+        skill_content = self.get_section('专业技能')
+        if skill_content is not None:
+            skill_content = skill_content.strip()
             
             # 提取每条技能 - 使用更可靠的方法
             # 按行分割
@@ -1959,34 +2133,17 @@ class ResumeUpdater:
     
     def update_skills(self):
         """更新专业技能信息"""
-        skills = self.extract_skills()
+        skills = self.resume_model().skills
         
         if not skills:
             print("✗ 未提取到专业技能信息，不加载该部分")
-            # 如果没有专业技能，移除网页中的专业技能部分
-            skill_section = self.soup.find('section', id='skills')
-            if skill_section:
-                skill_section.decompose()
-            # 移除导航栏中的专业技能链接
-            nav = self.soup.find('nav')
-            if nav:
-                skill_link = nav.find('a', href='#skills')
-                if skill_link:
-                    skill_link.decompose()
-            # 移除移动端导航栏中的专业技能链接
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                mobile_skill_link = mobile_nav.find('a', href='#skills')
-                if mobile_skill_link:
-                    mobile_skill_link.decompose()
-            # 移除专业技能的注释标记
-            for comment in self.soup.find_all(text=lambda text: isinstance(text, str) and '<!-- 专业技能 -->' in text):
-                comment.extract()
+            # 如果没有专业技能，移除网页中的专业技能部分及其导航链接和注释标记
+            remove_section(self.element_index(), 'skills', '<!-- 专业技能 -->')
             return True
         
         try:
             # 更新专业技能时间线
-            skill_section = self.soup.find('section', id='skills')
+            skill_section = self.element_index().get('skills', 'section')
             if skill_section:
                 skill_container = skill_section.find('div', class_='space-y-6')
                 if skill_container:
@@ -1994,11 +2151,7 @@ class ResumeUpdater:
                     skill_container.clear()
                     
                     # 添加新技能
-                    icons = [
-                        'fa-language', 'fa-line-chart', 'fa-pencil',
-                        'fa-code', 'fa-magic', 'fa-html5',
-                        'fa-film', 'fa-file-excel-o', 'fa-terminal'
-                    ]
+                    icons = SKILL_ICONS
                     
                     for i, skill in enumerate(skills):
                         # 创建技能项
@@ -2045,51 +2198,37 @@ class ResumeUpdater:
         evaluation = ""
         
         # 提取自我评价
-        eval_match = re.search(r'## 自我评价\n\n(.*?)(?:<center>|$)', self.resume_content, re.DOTALL)
-        if eval_match:
-            evaluation = eval_match.group(1).strip()
+        eval_content = self.get_section('自我评价')
+        if eval_content is not None:
+            # 自我评价到<center>（二维码区域）为止
+            evaluation = eval_content.split('<center>')[0].strip()
         
         return evaluation
     
     def update_self_evaluation(self):
         """更新自我评价信息"""
-        evaluation = self.extract_self_evaluation()
+        evaluation = self.resume_model().self_evaluation
         
         if not evaluation:
             print("✗ 未提取到自我评价信息，不加载该部分")
-            # 如果没有自我评价，移除网页中的自我评价部分
-            eval_section = self.soup.find('section', id='self-evaluation')
-            if eval_section:
-                eval_section.decompose()
-            # 移除导航栏中的自我评价链接
-            nav = self.soup.find('nav')
-            if nav:
-                eval_link = nav.find('a', href='#self-evaluation')
-                if eval_link:
-                    eval_link.decompose()
-            # 移除移动端导航栏中的自我评价链接
-            mobile_nav = self.soup.find('div', id='mobile-menu')
-            if mobile_nav:
-                mobile_eval_link = mobile_nav.find('a', href='#self-evaluation')
-                if mobile_eval_link:
-                    mobile_eval_link.decompose()
-            # 移除自我评价的注释标记
-            for comment in self.soup.find_all(text=lambda text: isinstance(text, str) and '<!-- 自我评价 -->' in text):
-                comment.extract()
+            # 如果没有自我评价，移除网页中的自我评价部分及其导航链接和注释标记
+            remove_section(self.element_index(), 'self-evaluation', '<!-- 自我评价 -->')
             return True
         
         try:
             # 更新自我评价
-            eval_section = self.soup.find('section', id='self-evaluation')
+            eval_section = self.element_index().get('self-evaluation', 'section')
             if eval_section:
                 eval_card = eval_section.find('div', class_='bg-white rounded-xl p-8 shadow-sm')
                 if eval_card:
                     eval_p = eval_card.find('p', class_='text-medium')
                     if eval_p:
-                        # 转换Markdown为HTML，处理HTML标签
-                        markdown_html = markdown.markdown(evaluation)
                         eval_p.clear()
-                        eval_p.append(BeautifulSoup(markdown_html, 'html.parser'))
+                        # lxml会把模板中嵌套的<p>拆成并列节点，一并移除
+                        for sibling in eval_p.find_next_siblings():
+                            sibling.decompose()
+                        # 转换Markdown为HTML，处理HTML标签
+                        eval_p.extend(markdown_fragment(evaluation, self.html_parser()))
             
             print("✓ 成功更新自我评价")
             return True
@@ -2104,156 +2243,246 @@ class ResumeUpdater:
                 print("✗ 配置文件未加载，无法更新配置内容")
                 return False
             
-            # 更新网页标题标签
-            if 'head_title' in self.config:
-                title_elem = self.soup.find('title')
-                if title_elem:
-                    title_elem.string = self.config['head_title']
-            
-            # 更新页面标题（导航栏中的标题）
-            if 'page_title' in self.config:
-                nav_title_elem = self.soup.find('div', class_='text-xl font-bold text-primary')
-                if nav_title_elem:
-                    nav_title_elem.string = self.config['page_title']
-            
-            # 更新简历列表链接
-            if 'resume_list_url' in self.config:
-                # 查找简历列表按钮
-                resume_list_buttons = self.soup.find_all('a')
-                for button in resume_list_buttons:
-                    if '简历文件列表' in button.get_text():
-                        button['href'] = self.config['resume_list_url']
-            
-            # 更新招聘须知链接
-            if 'recruitment_info_url' in self.config:
-                # 查找招聘须知按钮
-                recruitment_buttons = self.soup.find_all('a')
-                for button in recruitment_buttons:
-                    if '招聘须知' in button.get_text():
-                        button['href'] = self.config['recruitment_info_url']
-            
-            # 更新简历下载链接
-            if 'resume_pdf_url' in self.config:
-                # 查找简历下载按钮
-                download_buttons = self.soup.find_all('a')
-                for button in download_buttons:
-                    if '简历下载' in button.get_text() or '下载简历' in button.get_text():
-                        button['href'] = self.config['resume_pdf_url']
-            
-            # 更新求职版简历下载链接
-            if 'resume_job_pdf_url' in self.config:
-                # 查找求职版简历下载按钮
-                job_download_buttons = self.soup.find_all('a')
-                for button in job_download_buttons:
-                    if '求职版简历' in button.get_text() or '简历（求职）' in button.get_text():
-                        button['href'] = self.config['resume_job_pdf_url']
-            
-            # 更新底部信息和最后更新时间
-            # 查找底部信息容器
-            footer_div = self.soup.find('div', class_='border-t border-gray-800 mt-8 pt-8 text-center text-gray-400')
-            if footer_div:
-                # 更新底部信息
-                if 'footer_info' in self.config:
-                    footer_p = footer_div.find('p')
-                    if footer_p:
-                        footer_p.string = self.config['footer_info']
-                
-                # 更新最后更新时间
-                if 'last_updated' in self.config:
-                    # 查找最后更新时间元素
-                    update_time_elems = footer_div.find_all('p')
-                    if len(update_time_elems) >= 2:
-                        update_time_elem = update_time_elems[1]
-                        update_time_elem.string = f"最后更新：{self.config['last_updated']}"
-            
+            self.apply_config_content()
             print("✓ 成功更新配置内容")
             return True
         except Exception as e:
             print(f"✗ 更新配置内容失败: {e}")
             return False
     
-    def save_html(self):
-        """保存更新后的HTML文件"""
-        try:
-            # 获取HTML内容
-            html_content = str(self.soup)
-            
-            # 移除所有部分的注释标记
-            html_content = html_content.replace('<!-- 实习经历 -->', '')
-            html_content = html_content.replace('<!-- 校园经历 -->', '')
-            html_content = html_content.replace('<!-- 工作经历 -->', '')
-            html_content = html_content.replace('<!-- 教育背景 -->', '')
-            html_content = html_content.replace('<!-- 个人项目 -->', '')
-            html_content = html_content.replace('<!-- 专业技能 -->', '')
-            html_content = html_content.replace('<!-- 自我评价 -->', '')
-            
-            # 移除多余的空行
-            import re
-            html_content = re.sub(r'\n\s*\n', '\n\n', html_content)
+    def apply_config_content(self):
+        """将配置写入网页：标题、按钮链接、底部信息和最后更新时间（拼接模式下也用于单个片段）"""
+        # 各部分渲染时新增了链接，重新建立一次索引，之后的查找都不再遍历整个页面
+        self.index = index = ElementIndex(self.soup)
+        
+        # 更新网页标题标签
+        if 'head_title' in self.config:
+            title_elem = index.find('title')
+            if title_elem:
+                title_elem.string = self.config['head_title']
+        
+        # 更新页面标题（导航栏中的标题）
+        if 'page_title' in self.config:
+            nav_title_elems = index.find_class('div', 'text-xl font-bold text-primary')
+            if nav_title_elems:
+                nav_title_elems[0].string = self.config['page_title']
+        
+        # 按钮链接：(配置项, 按钮文字关键词)，按文字查找对应按钮
+        for key, words in CONFIG_LINKS:
+            if key in self.config:
+                for button in index.links_containing(*words):
+                    button['href'] = self.config[key]
+        
+        # 更新底部信息和最后更新时间
+        # 查找底部信息容器
+        footer_divs = index.find_class('div', 'border-t border-gray-800 mt-8 pt-8 text-center text-gray-400')
+        if footer_divs:
+            footer_div = footer_divs[0]
+            # 更新底部信息
+            if 'footer_info' in self.config:
+                footer_p = footer_div.find('p')
+                if footer_p:
+                    footer_p.string = self.config['footer_info']
             
-            # 保存HTML文件
-            with open(self.html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # 更新最后更新时间
+            if 'last_updated' in self.config:
+                # 查找最后更新时间元素
+                update_time_elems = footer_div.find_all('p')
+                if len(update_time_elems) >= 2:
+                    update_time_elem = update_time_elems[1]
+                    update_time_elem.string = f"最后更新：{self.config['last_updated']}"
+    
+    def save_html(self, html_content=None, chunks=None):
+        """
+        保存更新后的HTML文件，传入html_content（或已序列化的片段chunks）时保存该内容而不是序列化soup
+        
+        序列化、移除注释标记和合并空行按片段流式进行，先写入临时文件再原子替换
+        """
+        try:
+            if html_content is not None:
+                chunks = iter_string_chunks(html_content)
+            elif chunks is None:
+                chunks = iter_soup_chunks(self.soup, self.soup)
+            with self.profile_stage('serialize'):
+                self.html_hash = write_atomic(self.html_path, iter_clean_chunks(chunks))
             print("✓ 成功保存HTML文件")
             return True
         except Exception as e:
             print(f"✗ 保存HTML文件失败: {e}")
             return False
     
-    def update_all(self):
-        """更新所有内容"""
-        print("=== 开始更新简历网页 ===")
-        
-        # 加载文件
-        if not self.load_resume():
-            return False
-        
-        if not self.load_html():
+    def profile_stage(self, name):
+        """性能分析阶段，未开启性能分析时不做任何记录"""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.stage(name)
+    
+    def run_stage(self, func, *args):
+        """执行一个步骤，并以方法名作为阶段名记录性能数据"""
+        with self.profile_stage(func.__name__):
+            return func(*args)
+    
+    def update_steps(self):
+        """按顺序返回所有内容更新步骤"""
+        return [
+            self.update_personal_info,
+            self.update_education,
+            self.update_experience,
+            self.update_work_experience,
+            self.update_campus_experience,
+            self.update_projects,
+            self.update_skills,
+            self.update_self_evaluation,
+            self.update_config_content,
+        ]
+    
+    def update_sections(self):
+        """依次执行所有内容更新步骤，全部成功时返回True"""
+        success = True
+        for step in self.update_steps():
+            if not step():
+                success = False
+        return success
+    
+    def file_hash(self, path):
+        """计算文件内容哈希，文件不存在时返回None"""
+        try:
+            with open(path, 'rb') as f:
+                return hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            return None
+    
+    def compute_section_hashes(self):
+        """计算各简历章节正文的内容哈希"""
+        hashes = {}
+        for title, (start, end) in self.sections.items():
+            hashes[title] = hashlib.sha1(self.resume_content[start:end].encode('utf-8')).hexdigest()
+        return hashes
+    
+    def cache_key(self):
+        """增量缓存中当前输出文件对应的键"""
+        return os.path.relpath(os.path.abspath(self.html_path), PROJECT_ROOT).replace('\\', '/')
+    
+    def load_cache(self):
+        """读取当前输出文件的增量缓存记录"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get(self.cache_key(), {})
+        except (OSError, ValueError):
+            return {}
+    
+    def save_cache(self, section_hashes):
+        """保存增量缓存：章节哈希、生成的HTML哈希、配置文件哈希和渲染代码摘要"""
+        try:
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            cache[self.cache_key()] = {
+                'html_hash': self.html_hash,
+                'config_hash': self.file_hash(self.config_path),
+                'render_hash': self.render_hash,
+                'sections': section_hashes,
+            }
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False, indent=2)
+            return True
+        except Exception as e:
+            print(f"✗ 保存增量缓存失败: {e}")
             return False
+    
+    def changed_steps(self, cache, section_hashes):
+        """
+        根据增量缓存计算需要重新执行的更新步骤
         
-        # 加载配置文件
-        self.load_config()
+        Returns:
+            需要执行的步骤列表；模板不是上次生成的HTML或渲染代码变化时返回全部步骤
+        """
+        steps = self.update_steps()
+        # 模板被修改过（或模板与输出不是同一文件），或者渲染代码、渲染方式变化时，无法复用上次的结果
+        if (not cache or cache.get('html_hash') != self.file_hash(self.template_path)
+                or cache.get('render_hash') != self.render_hash):
+            return steps
+        old_hashes = cache.get('sections', {})
+        changed = []
+        for step in steps:
+            titles = STEP_SECTIONS.get(step.__name__, ())
+            if any(old_hashes.get(title) != section_hashes.get(title) for title in titles):
+                changed.append(step)
+        return changed
+    
+    def update_all(self, force=False, renderer=None, template_content=None, config=None):
+        """
+        更新所有内容
         
-        # 更新各个部分
-        success = True
+        Args:
+            force: 忽略增量缓存，重新生成所有部分
+            renderer: 预编译模板渲染器（TemplateRenderer），为None时使用BeautifulSoup修改DOM
+            template_content: 已读取的模板内容，为None时从模板文件读取
+            config: 已加载的配置，为None时从配置文件读取
+        """
+        print("=== 开始更新简历网页 ===")
         
-        if not self.update_personal_info():
-            success = False
+        # 加载文件
+        if not self.run_stage(self.load_resume):
+            return False
         
-        if not self.update_education():
-            success = False
+        # 对比增量缓存，只重新生成内容发生变化的部分
+        with self.profile_stage('check_cache'):
+            section_hashes = self.compute_section_hashes()
+            self.render_hash = render_key('soup' if renderer is None else 'template', self.parser)
+            cache = {} if force else self.load_cache()
+            steps = self.changed_steps(cache, section_hashes)
+            config_changed = cache.get('config_hash') != self.file_hash(self.config_path)
+        if not steps and not config_changed:
+            print("✓ 简历内容未变化，跳过更新")
+            return True
         
-        if not self.update_experience():
-            success = False
+        # 读取简历数据模型（内容未变化时直接使用缓存，不再执行正则提取）
+        self.run_stage(self.load_model)
         
-        if not self.update_work_experience():
-            success = False
+        if renderer is not None:
+            return self.update_with_template(renderer, section_hashes, config)
         
-        if not self.update_campus_experience():
-            success = False
+        # 先加载配置文件，以便读取其中的html_parser设置
+        self.run_stage(self.load_config, config)
         
-        if not self.update_projects():
-            success = False
+        # 拼接模式：配置未变化时只重新渲染变化的部分
+        if self.splice:
+            if config_changed:
+                print("✗ 配置文件已变化，拼接模式改为完整更新")
+            else:
+                result = self.update_splice(steps, section_hashes, template_content)
+                if result is not None:
+                    return result
         
-        if not self.update_skills():
-            success = False
+        # 并行渲染：各部分在进程池中分别渲染
+        if self.parallel:
+            result = self.update_parallel(steps, section_hashes, template_content)
+            if result is not None:
+                return result
         
-        if not self.update_self_evaluation():
-            success = False
+        if not self.run_stage(self.load_html, template_content):
+            return False
         
-        if not self.update_config_content():
-            success = False
+        # 更新各个部分
+        success = True
+        for step in steps:
+            if not self.run_stage(step):
+                success = False
         
         # 保存文件
         if success:
             # 先更新最后更新时间
-            self.update_last_updated()
+            self.run_stage(self.update_last_updated)
             # 重新加载配置文件以获取最新的最后更新时间
-            self.load_config()
+            self.run_stage(self.load_config)
             # 再次更新配置内容，确保使用最新的最后更新时间
-            self.update_config_content()
+            self.run_stage(self.update_config_content)
             # 保存HTML文件
-            if self.save_html():
+            if self.run_stage(self.save_html):
+                self.run_stage(self.save_cache, section_hashes)
                 print("\n🎉 简历网页更新成功！")
                 return True
             else:
@@ -2261,14 +2490,467 @@ class ResumeUpdater:
         else:
             print("\n❌ 简历网页更新失败！")
             return False
+    
+    def splice_blocker(self, steps, ranges):
+        """
+        检查能否使用拼接模式
+        
+        Returns:
+            不能使用的原因，可以使用时返回None
+        """
+        if SPLICE_FOOTER not in ranges:
+            return '找不到页脚'
+        for step in steps:
+            if step.__name__ not in SPLICE_STEPS:
+                return f'{step.__name__} 需要修改部分之外的内容'
+            section_id, field = SPLICE_STEPS[step.__name__]
+            present = field is None or bool(getattr(self.resume_model(), field))
+            # 部分需要新建或移除时导航栏也要变化
+            if present != (section_id in ranges):
+                return f'需要{"新建" if present else "移除"}部分 {section_id}'
+        return None
+    
+    def update_splice(self, steps, section_hashes, template_content=None):
+        """
+        拼接模式：只解析并重新渲染发生变化的部分和页脚，页面其余内容原样复制
+        
+        Args:
+            steps: 需要执行的更新步骤
+            section_hashes: 简历各章节的内容哈希
+            template_content: 已读取的模板内容，为None时从模板文件读取
+        
+        Returns:
+            是否成功；不能只更新部分内容时返回None，由调用方改为完整更新
+        """
+        if template_content is None:
+            template_content = read_template(self.template_path, self.html_path)
+        with self.profile_stage('scan_ranges'):
+            ranges = scan_ranges(template_content)
+        reason = self.splice_blocker(steps, ranges)
+        if reason:
+            print(f"✗ 拼接模式不适用（{reason}），改为完整更新")
+            return None
+        
+        # 按在页面中的位置依次处理，每个片段单独解析
+        step_keys = {SPLICE_STEPS[step.__name__][0]: step for step in steps}
+        keys = sorted(set(step_keys) | {SPLICE_FOOTER}, key=lambda key: ranges[key][0])
+        parser = self.html_parser()
+        fragments = {}
+        success = True
+        with self.profile_stage('load_html'):
+            for key in keys:
+                start, end = ranges[key]
+                fragments[key] = BeautifulSoup(template_content[start:end], parser)
+        for key, step in step_keys.items():
+            self.soup = fragments[key]
+            if not self.run_stage(step):
+                success = False
+        if not success:
+            self.soup = None
+            print("\n❌ 简历网页更新失败！")
+            return False
+        
+        # 与完整更新相同：先更新最后更新时间，再把配置写入重新渲染的片段
+        self.run_stage(self.update_last_updated)
+        self.run_stage(self.load_config)
+        with self.profile_stage('update_config_content'):
+            for key in keys:
+                self.soup = fragments[key]
+                self.apply_config_content()
+        self.soup = None
+        
+        with self.profile_stage('splice'):
+            parts = []
+            position = 0
+            for key in keys:
+                start, end = ranges[key]
+                parts.append(template_content[position:start])
+                parts.extend(str(node) for node in fragment_contents(fragments[key], parser))
+                position = end
+            parts.append(template_content[position:])
+        if self.run_stage(self.save_html, ''.join(parts)):
+            self.run_stage(self.save_cache, section_hashes)
+            print(f"\n🎉 简历网页更新成功！（拼接模式，重新渲染: {', '.join(keys)}）")
+            return True
+        return False
+    
+    def new_section(self, schema):
+        """与 ensure_section 新建的元素相同的空部分，尚未插入页面"""
+        return BeautifulSoup('', 'html.parser').new_tag('section', attrs={'id': schema.section_id,
+                                                                         'class': list(schema.background)})
+    
+    def update_parallel(self, steps, section_hashes, template_content=None):
+        """
+        并行渲染：各部分在进程池中分别解析、渲染为独立片段，输出与顺序渲染一致
+        
+        进程渲染的同时，主进程解析页面的其余部分（各部分只保留空的外层元素），
+        按步骤顺序完成新建、移除部分和补充导航链接等结构调整，最后按页面顺序把片段填回
+        
+        Args:
+            steps: 需要执行的更新步骤
+            section_hashes: 简历各章节的内容哈希
+            template_content: 已读取的模板内容，为None时从模板文件读取
+        
+        Returns:
+            是否成功；没有可以并行渲染的部分时返回None，由调用方改为顺序渲染
+        """
+        # 配置内容最后对整个页面统一写入，不作为单独的部分
+        section_steps = [step for step in steps if step.__name__ in SPLICE_STEPS]
+        if not section_steps or len(section_steps) + 1 < len(steps):
+            return None
+        if template_content is None:
+            template_content = read_template(self.template_path, self.html_path)
+        with self.profile_stage('scan_ranges'):
+            ranges = scan_ranges(template_content)
+        model = self.resume_model()
+        
+        def present(step):
+            """部分是否有数据"""
+            field = SPLICE_STEPS[step.__name__][1]
+            return field is None or bool(getattr(model, field))
+        
+        def weight(key):
+            """按记录数估计部分的渲染耗时"""
+            field = SPLICE_STEPS[step_names[key]][1]
+            value = getattr(model, field) if field else None
+            return len(value) if isinstance(value, (list, Skills)) else 1
+        
+        # 有数据的部分直接交给进程渲染：模板中已有的使用模板中的HTML，需要新建的使用新建的空元素
+        fragments = {}
+        step_names = {}
+        for step in section_steps:
+            section_id = SPLICE_STEPS[step.__name__][0]
+            schema = SECTION_SCHEMAS.get(step.__name__)
+            if not present(step):
+                continue
+            if section_id in ranges:
+                fragments[section_id] = template_content[ranges[section_id][0]:ranges[section_id][1]]
+            elif schema is not None and schema.create:
+                fragments[section_id] = str(self.new_section(schema))
+            else:
+                continue
+            step_names[section_id] = step.__name__
+        parser = self.html_parser()
+        workers = max(1, min(self.workers or os.cpu_count() or 1, len(section_steps)))
+        start = time.perf_counter()
+        futures = {}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=init_section_worker,
+                                                    initargs=(model.to_compact(), self.config, parser)) as executor:
+            with self.profile_stage('parallel_render'):
+                # 记录多的部分先提交，缩短最后一个部分完成的时间
+                for key in sorted(step_names, key=weight, reverse=True):
+                    futures[key] = executor.submit(render_section_job, step_names[key], fragments[key])
+                
+                # 页面其余部分：各部分只保留外层元素的开始和结束标签，供结构调整时定位
+                parts = []
+                position = 0
+                for key in sorted(fragments.keys() & ranges.keys(), key=lambda key: ranges[key][0]):
+                    key_start, key_end = ranges[key]
+                    parts.append(template_content[position:template_content.index('>', key_start) + 1])
+                    parts.append(template_content[template_content.rindex('<', key_start, key_end):key_end])
+                    position = key_end
+                parts.append(template_content[position:])
+                if not self.run_stage(self.load_html, ''.join(parts)):
+                    return False
+                index = self.element_index()
+                
+                # 按步骤顺序调整结构：新建部分并补充导航链接，无数据的部分在主进程中移除
+                sections = {}
+                for step in section_steps:
+                    section_id = SPLICE_STEPS[step.__name__][0]
+                    schema = SECTION_SCHEMAS.get(step.__name__)
+                    if section_id not in step_names:
+                        # 无数据或模板中没有该部分，与顺序渲染一样直接执行
+                        if not self.run_stage(step):
+                            self.soup = None
+                            print("\n❌ 简历网页更新失败！")
+                            return False
+                        continue
+                    if schema is not None and schema.create:
+                        section = ensure_section(index, schema.section_id, schema.background, schema.anchors)
+                    else:
+                        section = index.get(section_id, 'section')
+                    # 找不到插入位置的新建部分与顺序渲染一样不会出现在页面中
+                    if section is None or section.parent is None:
+                        continue
+                    if schema is not None:
+                        ensure_nav_link(index, schema.section_id, schema.title, schema.nav_after)
+                    sections[section_id] = section
+                for section_id, section in sections.items():
+                    section.replace_with(Comment(FRAGMENT_SLOT.format(section_id)))
+                results = {key: futures[key].result() for key in sections}
+        
+        # 按页面顺序输出各部分的日志
+        success = True
+        for key in sections:
+            ok, _, _, log = results[key]
+            print(log.rstrip())
+            success = success and ok
+        if not success:
+            self.soup = None
+            print("\n❌ 简历网页更新失败！")
+            return False
+        
+        # 与顺序渲染相同：先更新最后更新时间，再把配置写入页面其余部分（各片段已在进程中写入）
+        self.run_stage(self.update_last_updated)
+        self.run_stage(self.load_config)
+        self.run_stage(self.update_config_content)
+        chunks = (FRAGMENT_SLOT_PATTERN.sub(lambda match: results[match.group(1)][1], chunk)
+                  for chunk in iter_soup_chunks(self.soup, self.soup))
+        saved = self.run_stage(self.save_html, None, chunks)
+        self.soup = None
+        if saved:
+            self.run_stage(self.save_cache, section_hashes)
+            timings = '，'.join(f"{key} {results[key][2] * 1000:.1f} ms" for key in sections)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"\n🎉 简历网页更新成功！（并行渲染，{workers} 个进程，共 {elapsed:.1f} ms: {timings}）")
+            return True
+        return False
+    
+    def update_with_template(self, renderer, section_hashes, config=None):
+        """使用预编译模板渲染整个页面并保存"""
+        self.run_stage(self.load_config, config)
+        rendered = self.run_stage(renderer.render_sections, self)
+        if rendered is None:
+            print("\n❌ 简历网页更新失败！")
+            return False
+        # 先更新最后更新时间，再填充配置相关内容
+        self.run_stage(self.update_last_updated)
+        self.run_stage(self.load_config)
+        html_content = self.run_stage(renderer.render_config, rendered[0], rendered[1], self.config)
+        if self.run_stage(self.save_html, html_content):
+            self.run_stage(self.save_cache, section_hashes)
+            print("\n🎉 简历网页更新成功！")
+            return True
+        return False
 
-if __name__ == "__main__":
+
+# 并行渲染进程内的简历数据模型、配置和解析器
+SECTION_WORKER_STATE = {}
+
+
+def init_section_worker(model, config, parser):
+    """并行渲染进程初始化：每个进程只恢复一次简历数据模型和配置"""
+    SECTION_WORKER_STATE['model'] = ResumeModel.from_compact(model)
+    SECTION_WORKER_STATE['config'] = config
+    SECTION_WORKER_STATE['parser'] = parser
+
+
+def render_section_job(step_name, fragment_html):
+    """
+    在并行渲染进程中渲染单个部分
+    
+    Args:
+        step_name: 更新步骤名（SPLICE_STEPS 中的步骤）
+        fragment_html: 该部分在模板中的HTML
+    
+    Returns:
+        (是否成功, 渲染后的HTML, 耗时秒数, 日志)
+    """
+    start = time.perf_counter()
+    parser = SECTION_WORKER_STATE['parser']
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        updater = ResumeUpdater(None, None, parser=parser)
+        updater.model = SECTION_WORKER_STATE['model']
+        updater.config = SECTION_WORKER_STATE['config']
+        updater.soup = BeautifulSoup(fragment_html, parser)
+        success = getattr(updater, step_name)()
+        if success:
+            updater.apply_config_content()
+        html = ''.join(str(node) for node in fragment_contents(updater.soup, parser))
+    return bool(success), html, time.perf_counter() - start, log.getvalue()
+
+
+# 批量渲染进程内缓存的模板和配置
+BATCH_WORKER_STATE = {}
+
+
+def init_batch_worker(template_path, config_path, engine='soup', parser=None, model_cache_size=MAX_CACHE_FILES):
+    """批量渲染进程初始化：每个进程只读取一次模板和配置"""
+    BATCH_WORKER_STATE['template'] = read_template(template_path)
+    with open(config_path, 'r', encoding='utf-8') as f:
+        BATCH_WORKER_STATE['config'] = yaml.safe_load(f)
+    BATCH_WORKER_STATE['parser'] = resolve_parser(parser or (BATCH_WORKER_STATE['config'] or {}).get('html_parser'))
+    if engine == 'template':
+        from template_renderer import TemplateRenderer
+        # 模板在进程内只编译一次，之后的渲染只做字符串拼接
+        BATCH_WORKER_STATE['renderer'] = TemplateRenderer(BATCH_WORKER_STATE['template'], BATCH_WORKER_STATE['parser'])
+    BATCH_WORKER_STATE['model_cache_size'] = model_cache_size
+    BATCH_WORKER_STATE['template_path'] = template_path
+    BATCH_WORKER_STATE['config_path'] = config_path
+
+
+def render_batch_job(resume_path, output_path):
+    """
+    在批量渲染进程中渲染单个简历文件
+    
+    Returns:
+        (resume_path, output_path, 是否成功, 耗时秒数, 日志)
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        updater = ResumeUpdater(resume_path, output_path,
+                                BATCH_WORKER_STATE['config_path'],
+                                BATCH_WORKER_STATE['template_path'],
+                                parser=BATCH_WORKER_STATE['parser'],
+                                model_cache_size=BATCH_WORKER_STATE['model_cache_size'])
+        renderer = BATCH_WORKER_STATE.get('renderer')
+        if renderer is not None:
+            success = updater.load_resume() and updater.load_config(BATCH_WORKER_STATE['config'])
+            if success:
+                html_content = renderer.render(updater)
+                success = html_content is not None and updater.save_html(html_content)
+        else:
+            success = (updater.load_resume()
+                       and updater.load_config(BATCH_WORKER_STATE['config'])
+                       and updater.load_html(BATCH_WORKER_STATE['template'])
+                       and updater.update_sections()
+                       and updater.save_html())
+    return resume_path, output_path, bool(success), time.perf_counter() - start, log.getvalue()
+
+
+def load_batch_jobs(manifest_path=None, pattern=None, output_dir=None):
+    """
+    读取批量渲染任务列表
+    
+    Args:
+        manifest_path: JSON清单文件，格式为[{"resume": "...", "output": "..."}]
+        pattern: 简历Markdown文件的glob模式
+        output_dir: 使用glob模式时的输出目录，输出文件名为<简历文件名>.html
+    
+    Returns:
+        [(简历路径, 输出路径), ...]，相对路径以项目根目录为基准
+    """
+    jobs = []
+    if manifest_path:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            for item in json.load(f):
+                jobs.append((os.path.join(PROJECT_ROOT, item['resume']),
+                             os.path.join(PROJECT_ROOT, item['output'])))
+    if pattern:
+        output_dir = os.path.join(PROJECT_ROOT, output_dir or 'build')
+        for resume_path in sorted(glob.glob(os.path.join(PROJECT_ROOT, pattern))):
+            name = os.path.splitext(os.path.basename(resume_path))[0]
+            jobs.append((resume_path, os.path.join(output_dir, name + '.html')))
+    return jobs
+
+
+def render_batch(jobs, template_path, config_path, workers=None, engine='soup', parser=None):
+    """使用进程池并发渲染多个简历文件，并输出每个文件的耗时"""
+    print(f"=== 开始批量渲染 {len(jobs)} 份简历 ===")
+    start = time.perf_counter()
+    # 整个批次只更新一次最后更新时间，各进程读取更新后的配置
+    updater = ResumeUpdater(None, None, config_path)
+    if updater.load_config():
+        updater.update_last_updated()
+    for _, output_path in jobs:
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    
+    failed = 0
+    # 模型缓存至少保留整个批次，避免批次内的简历互相淘汰
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                initializer=init_batch_worker,
+                                                initargs=(template_path, config_path, engine, parser,
+                                                          max(MAX_CACHE_FILES, len(jobs)))) as executor:
+        futures = [executor.submit(render_batch_job, resume_path, output_path)
+                   for resume_path, output_path in jobs]
+        for future in futures:
+            resume_path, output_path, success, elapsed, log = future.result()
+            rel_resume = os.path.relpath(resume_path, PROJECT_ROOT)
+            rel_output = os.path.relpath(output_path, PROJECT_ROOT)
+            if success:
+                print(f"✓ {rel_resume} -> {rel_output} ({elapsed * 1000:.1f} ms)")
+            else:
+                failed += 1
+                print(f"✗ {rel_resume} -> {rel_output} ({elapsed * 1000:.1f} ms)")
+                print(log.rstrip())
+    
+    total = time.perf_counter() - start
+    print(f"\n共 {len(jobs)} 份，失败 {failed} 份，总耗时 {total:.2f} s")
+    return failed == 0
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='根据简历Markdown文件更新HTML网页')
+    parser.add_argument('--manifest', help='批量渲染清单（JSON）：[{"resume": "...", "output": "..."}]')
+    parser.add_argument('--glob', dest='pattern', help='批量渲染的简历文件glob模式，例如 "candidates/*.md"')
+    parser.add_argument('--output-dir', help='使用--glob时的输出目录（默认 build）')
+    parser.add_argument('--template', help='HTML模板文件（默认 index.html）')
+    parser.add_argument('--config', help='配置文件（默认 config.yaml）')
+    parser.add_argument('--workers', type=int, help='批量渲染和并行渲染的进程数（默认CPU核数）')
+    parser.add_argument('--force', action='store_true', help='忽略增量缓存，重新生成所有部分')
+    parser.add_argument('--engine', choices=['soup', 'template'], default='soup',
+                        help='渲染方式：soup 使用BeautifulSoup修改DOM，template 使用预编译模板拼接字符串')
+    parser.add_argument('--parser', dest='html_parser', choices=list(HTML_PARSERS),
+                        help='HTML解析器（默认读取config.yaml中的html_parser，未设置时为html.parser）；lxml未安装时自动回退')
+    parser.add_argument('--watch', action='store_true', help='监听简历、配置和模板文件，变化后自动重新生成')
+    parser.add_argument('--debounce', type=float, default=0.3, help='监听模式的去抖时间（秒，默认0.3）')
+    parser.add_argument('--poll', action='store_true', help='监听模式下不使用inotify，改为轮询文件修改时间')
+    parser.add_argument('--profile', nargs='?', const=os.path.join('.workers', 'profile'), metavar='PREFIX',
+                        help='记录各阶段的耗时、CPU时间和内存峰值，输出 PREFIX.json 和 Chrome trace 格式的 PREFIX.trace.json'
+                             '（默认 .workers/profile）')
+    parser.add_argument('--splice', action='store_true',
+                        help='拼接模式：只重新渲染发生变化的部分和页脚，页面其余内容逐字节保留（仅soup渲染方式）')
+    parser.add_argument('--parallel', action='store_true',
+                        help='并行渲染：各部分在进程池中分别渲染为独立片段，再按页面顺序拼接（仅soup渲染方式）')
+    args = parser.parse_args(argv)
+    
     # 定义文件路径
-    resume_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resume', '简历.md')
-    html_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'index.html')
+    resume_path = os.path.join(PROJECT_ROOT, 'resume', '简历.md')
+    html_path = os.path.join(PROJECT_ROOT, 'index.html')
+    template_path = os.path.join(PROJECT_ROOT, args.template) if args.template else html_path
+    config_path = os.path.join(PROJECT_ROOT, args.config) if args.config else os.path.join(PROJECT_ROOT, 'config.yaml')
+    
+    if args.manifest or args.pattern:
+        if args.watch or args.profile or args.splice or args.parallel:
+            print("✗ 监听模式、性能分析、拼接模式和并行渲染不支持批量渲染")
+            return False
+        jobs = load_batch_jobs(args.manifest, args.pattern, args.output_dir)
+        if not jobs:
+            print("✗ 没有找到需要渲染的简历文件")
+            return False
+        return render_batch(jobs, template_path, config_path, args.workers, args.engine, args.html_parser)
+    
+    if (args.splice or args.parallel) and args.engine != 'soup':
+        print("✗ 拼接模式和并行渲染只支持 soup 渲染方式")
+        return False
     
     # 创建更新器实例
-    updater = ResumeUpdater(resume_path, html_path)
+    updater = ResumeUpdater(resume_path, html_path, config_path, template_path, parser=args.html_parser,
+                            splice=args.splice, parallel=args.parallel, workers=args.workers)
+    
+    if args.watch:
+        from resume_watcher import ResumeWatcher
+        watcher = ResumeWatcher(updater, args.engine, debounce=args.debounce, use_inotify=not args.poll)
+        return watcher.run(force=args.force)
+    
+    renderer = None
+    if args.engine == 'template':
+        from template_renderer import TemplateRenderer
+        updater.load_config()
+        renderer = TemplateRenderer(read_template(template_path, updater.html_path), updater.html_parser())
     
-    # 执行更新
-    updater.update_all()
+    if not args.profile:
+        # 执行更新
+        return updater.update_all(force=args.force, renderer=renderer)
+    
+    # 执行更新并记录各阶段的性能数据
+    profiler = StageProfiler()
+    updater.profiler = profiler
+    profiler.start()
+    try:
+        with profiler.stage('update_all'):
+            success = updater.update_all(force=args.force, renderer=renderer)
+    finally:
+        profiler.stop()
+    profiler.print_summary()
+    json_path, trace_path = profiler.save(os.path.join(PROJECT_ROOT, args.profile))
+    print(f"✓ 已保存性能分析结果: {os.path.relpath(json_path, PROJECT_ROOT)}，{os.path.relpath(trace_path, PROJECT_ROOT)}")
+    return success
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)